@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import datetime as dt
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from orchestrator.storage import read_json, write_json
 
-REQUIRED_FIELDS = [
+
+REQUIRED_FIELDS = (
     "hypothesis",
     "context",
     "method",
@@ -17,10 +18,48 @@ REQUIRED_FIELDS = [
     "delta",
     "recommendation",
     "governance_impact",
-]
+)
+_VALIDATION_KEYS = frozenset(REQUIRED_FIELDS) | {"id"}
+
+_TEMPLATE = """---
+id: {id}
+title: {title}
+created_at: {created_at}
+updated_at: {updated_at}
+hypothesis: {hypothesis}
+context: {context}
+method: {method}
+outcome: {outcome}
+cost_paid: {cost_paid}
+failure_modes: {failure_modes}
+delta: {delta}
+recommendation: {recommendation}
+governance_impact: {governance_impact}
+---
+
+# AVL Evidence Pack
+
+## Hypothesis
+
+## Context
+
+## Method
+
+## Outcome
+
+## Cost Paid
+
+## Failure Modes
+
+## Delta
+
+## Recommendation
 
+## Governance Impact
+"""
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class EvidencePackRecord:
     id: str
     title: str
@@ -48,6 +87,8 @@ class EvidencePackStore:
         self.base_dir = self.root / "avl" / "evidence_packs"
         self.index_path = self.base_dir / "index.json"
         self.template_path = self.base_dir / "template.md"
+        self._index_cache: dict[str, Any] | None = None
+        self._index_mtime: int | None = None
 
     def create(self, *, title: str, now: dt.datetime | None = None) -> EvidencePackRecord:
         now_dt = now or dt.datetime.now(tz=dt.timezone.utc)
@@ -87,15 +128,12 @@ class EvidencePackStore:
         return record
 
     def validate(self, path: Path) -> dict[str, Any]:
-        payload = self._read_frontmatter(path)
+        payload = self._read_frontmatter(path, only=_VALIDATION_KEYS)
         missing = [field for field in REQUIRED_FIELDS if not payload.get(field)]
         return {"ok": not missing, "missing": missing, "id": payload.get("id"), "path": str(path)}
 
     def find_by_id(self, pack_id: str) -> dict[str, Any] | None:
-        if not self.index_path.exists():
-            return None
-        payload = json.loads(self.index_path.read_text(encoding="utf-8"))
-        for item in payload.get("items", []):
+        for item in self._read_index()["items"]:
             if item.get("id") == pack_id:
                 return item
         return None
@@ -103,75 +141,84 @@ class EvidencePackStore:
     def read_frontmatter(self, path: Path) -> dict[str, str]:
         return self._read_frontmatter(path)
 
+    def next_id(self, day: dt.date) -> str:
+        """Reserve the next pack id for ``day`` without adding an index item."""
+        pack_id = self._next_id(day)
+        self._write_index(self._read_index())
+        return pack_id
+
     def _next_id(self, day: dt.date) -> str:
-        date_key = day.strftime("%Y%m%d")
-        prefix = f"AVL-EP-{date_key}-"
-        existing = []
-        if self.index_path.exists():
-            index = json.loads(self.index_path.read_text(encoding="utf-8"))
-            existing = [item["id"] for item in index.get("items", []) if item["id"].startswith(prefix)]
-        return f"{prefix}{len(existing) + 1:03d}"
+        prefix = _day_prefix(day)
+        counters = self._read_index()["counters"]
+        serial = counters.get(prefix, 0) + 1
+        counters[prefix] = serial
+        return f"{prefix}{serial:03d}"
+
+    def _read_index(self) -> dict[str, Any]:
+        # Reuse the parsed index until another writer touches the file.
+        try:
+            mtime = self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if self._index_cache is not None and mtime == self._index_mtime:
+            return self._index_cache
+
+        if mtime is None:
+            payload: dict[str, Any] = {"items": []}
+        else:
+            payload = read_json(self.index_path)
+            payload.setdefault("items", [])
+        if "counters" not in payload:
+            payload["counters"] = _counters_from_items(payload["items"])
+        self._index_cache = payload
+        self._index_mtime = mtime
+        return payload
 
     def _update_index(self, record: EvidencePackRecord) -> None:
-        self.base_dir.mkdir(parents=True, exist_ok=True)
-        if self.index_path.exists():
-            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
-        else:
-            payload = {"items": []}
+        payload = self._read_index()
         payload["items"].append(record.to_index())
-        self.index_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        self._write_index(payload)
+
+    def _write_index(self, payload: dict[str, Any]) -> None:
+        write_json(self.index_path, payload)
+        self._index_mtime = self.index_path.stat().st_mtime_ns
 
     def _render_template(self, fields: dict[str, Any]) -> str:
-        frontmatter = [
-            "---",
-            f"id: {fields['id']}",
-            f"title: {fields['title']}",
-            f"created_at: {fields['created_at']}",
-            f"updated_at: {fields['updated_at']}",
-            f"hypothesis: {fields['hypothesis']}",
-            f"context: {fields['context']}",
-            f"method: {fields['method']}",
-            f"outcome: {fields['outcome']}",
-            f"cost_paid: {fields['cost_paid']}",
-            f"failure_modes: {fields['failure_modes']}",
-            f"delta: {fields['delta']}",
-            f"recommendation: {fields['recommendation']}",
-            f"governance_impact: {fields['governance_impact']}",
-            "---",
-            "",
-            "# AVL Evidence Pack",
-            "",
-            "## Hypothesis",
-            "",
-            "## Context",
-            "",
-            "## Method",
-            "",
-            "## Outcome",
-            "",
-            "## Cost Paid",
-            "",
-            "## Failure Modes",
-            "",
-            "## Delta",
-            "",
-            "## Recommendation",
-            "",
-            "## Governance Impact",
-            "",
-        ]
-        return "\n".join(frontmatter)
-
-    def _read_frontmatter(self, path: Path) -> dict[str, str]:
-        lines = path.read_text(encoding="utf-8").splitlines()
-        if not lines or lines[0].strip() != "---":
-            return {}
+        return _TEMPLATE.format_map(fields)
+
+    def _read_frontmatter(self, path: Path, *, only: frozenset[str] | None = None) -> dict[str, str]:
+        # Frontmatter sits at the top of the file; stop reading at its closing fence,
+        # or as soon as every key in ``only`` has been collected.
         data: dict[str, str] = {}
-        for line in lines[1:]:
-            if line.strip() == "---":
-                break
-            if ":" not in line:
-                continue
-            key, value = line.split(":", 1)
-            data[key.strip()] = value.strip()
+        with path.open(encoding="utf-8") as handle:
+            if handle.readline().strip() != "---":
+                return {}
+            for line in handle:
+                if line.strip() == "---":
+                    break
+                sep = line.find(":")
+                if sep < 0:
+                    continue
+                key = line[:sep].strip()
+                if only is None:
+                    data[key] = line[sep + 1 :].strip()
+                elif key in only:
+                    data[key] = line[sep + 1 :].strip()
+                    if len(data) == len(only):
+                        break
         return data
+
+
+def _day_prefix(day: dt.date) -> str:
+    return f"AVL-EP-{day.strftime('%Y%m%d')}-"
+
+
+def _counters_from_items(items: list[dict[str, Any]]) -> dict[str, int]:
+    counters: dict[str, int] = {}
+    for item in items:
+        prefix, _, serial = item["id"].rpartition("-")
+        if not serial.isdigit():
+            continue
+        key = f"{prefix}-"
+        counters[key] = max(counters.get(key, 0), int(serial))
+    return counters
@@ -50,9 +50,10 @@ class ClaimStore:
         return claims
 
     def _read_index(self) -> dict[str, dict[str, Any]]:
-        if not self.index_path.exists():
+        try:
+            return json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
             return {}
-        return json.loads(self.index_path.read_text(encoding="utf-8"))
 
     def _write_index(self, payload: dict[str, dict[str, Any]]) -> None:
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
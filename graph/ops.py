@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 import datetime as dt
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
-from orchestrator.storage import JSONLStorage
+from orchestrator.storage import JSONLStorage, loads_json, read_json, write_json
 from graph.validation import validate_newsletter_hypothesis_payload
 
 GraphType = Literal["concept", "skill", "playbook", "hypothesis", "evidence"]
 GraphStatus = Literal["exploring", "validation_ready", "validated", "archived"]
 
+SNAPSHOT_EVERY = 64
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GraphNodeRecord:
     id: str
     type: GraphType
@@ -52,6 +53,30 @@ class GraphStore:
         self.nodes_path = self.graph_dir / "graph_nodes.jsonl"
         self.index_path = self.graph_dir / "graph_index.json"
         self.store = JSONLStorage(self.nodes_path)
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._log_offset = 0
+        self._pending = 0
+        self._batch_depth = 0
+
+    def __enter__(self) -> GraphStore:
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        # The snapshot records how much of the log it covers, so a new store
+        # loads it and only replays the lines appended after that offset.
+        index = self._read_index()
+        write_json(self.index_path, {"log_offset": self._log_offset, "nodes": index})
+        self._pending = 0
 
     def create(
         self,
@@ -84,8 +109,7 @@ class GraphStore:
             tags=tags or [],
             extra=extra_payload,
         )
-        self.store.append(record.to_dict())
-        self._update_index(record)
+        self._append(record.to_dict())
         return record
 
     def create_from_payload(
@@ -151,8 +175,7 @@ class GraphStore:
         updated = dict(current)
         updated["status"] = status
         updated["updated_at"] = now_iso
-        self.store.append(updated)
-        self._write_index({**self._read_index(), node_id: updated})
+        self._append(updated)
         return updated
 
     def _next_id(self, node_type: GraphType, day: dt.date) -> str:
@@ -162,18 +185,52 @@ class GraphStore:
         return f"{prefix}{len(existing) + 1:03d}"
 
     def _read_index(self) -> dict[str, dict[str, Any]]:
-        if not self.index_path.exists():
-            return {}
-        return json.loads(self.index_path.read_text(encoding="utf-8"))
-
-    def _write_index(self, payload: dict[str, dict[str, Any]]) -> None:
-        self.index_path.parent.mkdir(parents=True, exist_ok=True)
-        self.index_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-
-    def _update_index(self, record: GraphNodeRecord) -> None:
+        # graph_nodes.jsonl is the source of truth: the latest line per id wins.
+        # Only bytes appended since the last read are replayed.
+        try:
+            size = self.nodes_path.stat().st_size
+        except FileNotFoundError:
+            size = None
+        if self._index is None:
+            self._index, self._log_offset = self._load_snapshot(size)
+        if size is not None and size > self._log_offset:
+            with self.nodes_path.open("rb") as handle:
+                handle.seek(self._log_offset)
+                chunk = handle.read()
+            # Leave a partially written trailing line for the next read.
+            complete = chunk[: chunk.rfind(b"\n") + 1]
+            for line in complete.splitlines():
+                if line.strip():
+                    payload = loads_json(line)
+                    self._index[payload["id"]] = payload
+            self._log_offset += len(complete)
+        return self._index
+
+    def _load_snapshot(self, log_size: int | None) -> tuple[dict[str, dict[str, Any]], int]:
+        try:
+            snapshot = read_json(self.index_path)
+        except FileNotFoundError:
+            return {}, 0
+        if "nodes" in snapshot and "log_offset" in snapshot:
+            if log_size is None or snapshot["log_offset"] <= log_size:
+                return snapshot["nodes"], snapshot["log_offset"]
+            # The log was replaced or truncated since; rebuild from it.
+            return {}, 0
+        # Snapshots without an offset are plain id -> node maps; they are only
+        # trusted on their own; with a log present, the whole log is replayed.
+        return (snapshot, 0) if log_size is None else ({}, 0)
+
+    def _append(self, payload: dict[str, Any]) -> None:
         index = self._read_index()
-        index[record.id] = record.to_dict()
-        self._write_index(index)
+        self.store.append(payload)
+        # Visible right away; the offset still only advances over bytes read, so
+        # the next read replays this line together with any other writer's lines
+        # that landed before it.
+        index[payload["id"]] = payload
+        self._pending += 1
+        # Single mutations keep the snapshot current; batches snapshot periodically.
+        if self._batch_depth == 0 or self._pending >= SNAPSHOT_EVERY:
+            self.snapshot()
 
 
 def _validate_newsletter_extra(extra: dict[str, Any]) -> None:
@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import io
 import xml.etree.ElementTree as ET
 from typing import Any
 
 
-from ingest.fetchers.common import RateLimiter, parse_datetime
+from ingest.fetchers.common import DEFAULT_RATE_LIMITER, USER_AGENT, RateLimiter, parse_datetime
 from ingest.fetchers.http import http_get
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ingest.registry import SourceConfig
 
-USER_AGENT = "ai-native-pm-os/0.1 (+https://example.local)"
-ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+_ATOM = "{http://www.w3.org/2005/Atom}"
+ENTRY_TAG = f"{_ATOM}entry"
+TITLE_TAG = f"{_ATOM}title"
+ID_TAG = f"{_ATOM}id"
+PUBLISHED_TAG = f"{_ATOM}published"
+UPDATED_TAG = f"{_ATOM}updated"
+SUMMARY_TAG = f"{_ATOM}summary"
+AUTHOR_TAG = f"{_ATOM}author"
+NAME_TAG = f"{_ATOM}name"
+CATEGORY_TAG = f"{_ATOM}category"
 
 
 class ArxivFetcher:
     def __init__(self, *, rate_limiter: RateLimiter | None = None) -> None:
-        self.rate_limiter = rate_limiter or RateLimiter(min_interval=1.5)
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
 
     def fetch(self, source: SourceConfig, *, limit: int) -> list[dict[str, Any]]:
         base_url = source.base_url or source.url
@@ -34,29 +43,32 @@ class ArxivFetcher:
         self.rate_limiter.wait(base_url)
         response = http_get(base_url, params=params, headers={"User-Agent": USER_AGENT}, timeout=25)
 
-        root = ET.fromstring(response.content)
         items: list[dict[str, Any]] = []
-        for entry in root.findall("atom:entry", ATOM_NS)[:limit]:
-            title = _text(entry.find("atom:title", ATOM_NS))
-            url = _text(entry.find("atom:id", ATOM_NS))
-            published = _text(entry.find("atom:published", ATOM_NS)) or _text(entry.find("atom:updated", ATOM_NS))
-            authors = [_text(node.find("atom:name", ATOM_NS)) for node in entry.findall("atom:author", ATOM_NS)]
-            categories = [node.get("term") for node in entry.findall("atom:category", ATOM_NS)]
+        if limit <= 0:
+            return items
+        for _, entry in ET.iterparse(io.BytesIO(response.content)):
+            if entry.tag != ENTRY_TAG:
+                continue
+            published = _findtext(entry, PUBLISHED_TAG) or _findtext(entry, UPDATED_TAG)
+            authors = [_findtext(node, NAME_TAG) for node in entry.iterfind(AUTHOR_TAG)]
+            categories = [node.get("term") for node in entry.iterfind(CATEGORY_TAG)]
             items.append(
                 {
-                    "title": title,
-                    "url": url,
+                    "title": _findtext(entry, TITLE_TAG),
+                    "url": _findtext(entry, ID_TAG),
                     "published_at": parse_datetime(published),
-                    "content": _text(entry.find("atom:summary", ATOM_NS)),
+                    "content": _findtext(entry, SUMMARY_TAG),
                     "authors": [a for a in authors if a],
                     "categories": [c for c in categories if c],
                     "raw": {},
                 }
             )
+            entry.clear()
+            if len(items) >= limit:
+                break
         return items
 
 
-def _text(node: ET.Element | None) -> str | None:
-    if node is None or node.text is None:
-        return None
-    return node.text.strip()
+def _findtext(node: ET.Element, tag: str) -> str | None:
+    value = node.findtext(tag)
+    return value.strip() if value else None
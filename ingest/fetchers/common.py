@@ -2,38 +2,72 @@ from __future__ import annotations
 
 import datetime as dt
 import email.utils
+import math
 import re
+import threading
 import time
+from collections import defaultdict
+from functools import lru_cache
 from urllib.parse import urlparse
 
+USER_AGENT = "ai-native-pm-os/0.1 (+https://example.local)"
+_YEAR_RE = re.compile(r"\b(20\d{2})\b")
+# Zero-padded forms of the strptime formats in parse_datetime. Only these take
+# the fromisoformat fast path, so fractional seconds, space separators and other
+# ISO variants keep falling through to the year hint exactly as before.
+_ISO_FAST_RE = re.compile(r"\d{4}-\d\d-\d\d(?:T\d\d:\d\d:\d\d(?:Z|[+-]\d\d:\d\d))?", re.ASCII)
+
 
 class RateLimiter:
     def __init__(self, min_interval: float = 1.5) -> None:
         self.min_interval = min_interval
-        self._last_request_by_host: dict[str, float] = {}
+        # Unseen hosts start at -inf so the first request never sleeps.
+        self._last_request_by_host: defaultdict[str, float] = defaultdict(lambda: -math.inf)
+        self._lock = threading.Lock()
 
     def wait(self, url: str) -> None:
-        host = urlparse(url).netloc or "default"
-        now = time.monotonic()
-        last = self._last_request_by_host.get(host)
-        if last is not None:
-            delay = self.min_interval - (now - last)
-            if delay > 0:
-                time.sleep(delay)
-        self._last_request_by_host[host] = time.monotonic()
+        # Sources are fetched from worker threads: each caller reserves the next
+        # free slot for its host under the lock and sleeps outside it.
+        host = _host(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._last_request_by_host[host] + self.min_interval)
+            self._last_request_by_host[host] = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Shared by every fetcher that is not handed its own limiter, so per-host spacing
+# holds across sources and fetcher instances.
+DEFAULT_RATE_LIMITER = RateLimiter(min_interval=1.5)
+
+
+@lru_cache(maxsize=1024)
+def _host(url: str) -> str:
+    return urlparse(url).netloc or "default"
 
 
 def parse_datetime(value: str | None) -> dt.datetime | None:
     if not value:
         return None
 
-    # RSS-style dates
-    try:
-        parsed = email.utils.parsedate_to_datetime(value)
-    except (TypeError, ValueError):
-        parsed = None
-    if parsed:
-        return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt.timezone.utc)
+    # RSS-style dates; ISO 8601 values (YYYY-...) can never match, so skip the attempt.
+    if not _looks_iso(value):
+        try:
+            parsed = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            parsed = None
+        if parsed:
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt.timezone.utc)
+
+    if _ISO_FAST_RE.fullmatch(value):
+        # datetime.fromisoformat only accepts a trailing "Z" from Python 3.11 on.
+        try:
+            parsed_dt = dt.datetime.fromisoformat(value[:-1] + "+00:00" if value[-1] == "Z" else value)
+        except ValueError:
+            parsed_dt = None
+        if parsed_dt is not None:
+            return parsed_dt if parsed_dt.tzinfo else parsed_dt.replace(tzinfo=dt.timezone.utc)
 
     for fmt in (
         "%Y-%m-%dT%H:%M:%SZ",
@@ -49,8 +83,12 @@ def parse_datetime(value: str | None) -> dt.datetime | None:
             continue
 
     # partial year/month hints in html pages
-    if re.search(r"\b20\d{2}\b", value):
-        year = int(re.search(r"\b(20\d{2})\b", value).group(1))
-        return dt.datetime(year, 1, 1, tzinfo=dt.timezone.utc)
+    match = _YEAR_RE.search(value)
+    if match:
+        return dt.datetime(int(match.group(1)), 1, 1, tzinfo=dt.timezone.utc)
 
     return None
+
+
+def _looks_iso(value: str) -> bool:
+    return value[:4].isdigit() and value[4:5] == "-"
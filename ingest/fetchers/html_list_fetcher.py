@@ -1,30 +1,34 @@
 from __future__ import annotations
 
 import re
+from functools import partial
 from html.parser import HTMLParser
-from typing import Any
+from typing import Any, Callable, Iterator
 from urllib.parse import urljoin
 
 
-from ingest.fetchers.common import RateLimiter, parse_datetime
+from ingest.fetchers.common import DEFAULT_RATE_LIMITER, USER_AGENT, RateLimiter, parse_datetime
 from ingest.fetchers.http import http_get
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ingest.registry import SourceConfig
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ModuleNotFoundError:  # pragma: no cover - optional fast parser
+    LexborHTMLParser = None
+
 try:
     from bs4 import BeautifulSoup
 except ModuleNotFoundError:  # pragma: no cover - fallback parser
     BeautifulSoup = None
 
-USER_AGENT = "ai-native-pm-os/0.1 (+https://example.local)"
 DATE_RE = re.compile(r"(?:20\d{2}[-/]\d{1,2}[-/]\d{1,2}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+20\d{2})", re.IGNORECASE)
 
-
 class HTMLListFetcher:
     def __init__(self, *, rate_limiter: RateLimiter | None = None) -> None:
-        self.rate_limiter = rate_limiter or RateLimiter(min_interval=1.5)
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
 
     def fetch(self, source: SourceConfig, *, limit: int) -> list[dict[str, Any]]:
         if not source.url:
@@ -33,18 +37,20 @@ class HTMLListFetcher:
         self.rate_limiter.wait(source.url)
         response = http_get(source.url, headers={"User-Agent": USER_AGENT}, timeout=20)
 
-        if BeautifulSoup is None:
+        if LexborHTMLParser is None and BeautifulSoup is None:
             links = _fallback_extract_links(response.text)
             return _normalize_link_rows(links, source, limit)
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        anchors = soup.select(source.link_selector or "a[href]")
+        selector = source.link_selector or "a[href]"
+        if LexborHTMLParser is not None:
+            anchors = _iter_lexbor_anchors(response.text, selector)
+        else:
+            anchors = _iter_bs4_anchors(response.text, selector)
         pattern = re.compile(source.include_pattern) if source.include_pattern else None
         items: list[dict[str, Any]] = []
         seen: set[str] = set()
 
-        for anchor in anchors:
-            href = anchor.get("href")
+        for href, describe in anchors:
             if not href:
                 continue
             full_url = urljoin(source.url, href)
@@ -54,14 +60,9 @@ class HTMLListFetcher:
                 continue
             seen.add(full_url)
 
-            title = (anchor.get_text(" ", strip=True) or None)
-            container = anchor.find_parent() or anchor
-            container_text = container.get_text(" ", strip=True)
-            date_text = None
-            time_tag = container.find("time")
-            if time_tag:
-                date_text = time_tag.get("datetime") or time_tag.get_text(" ", strip=True)
-            if not date_text and source.date_hint:
+            title, container_text, date_text = describe()
+            # Every DATE_RE alternative contains a 20xx year.
+            if not date_text and source.date_hint and "20" in container_text:
                 match = DATE_RE.search(container_text)
                 if match:
                     date_text = match.group(0)
@@ -81,6 +82,49 @@ class HTMLListFetcher:
         return items
 
 
+AnchorDescription = tuple[str | None, str, str | None]
+
+
+def _iter_lexbor_anchors(html: str, selector: str) -> Iterator[tuple[str | None, Callable[[], AnchorDescription]]]:
+    tree = LexborHTMLParser(html)
+    for anchor in tree.css(selector):
+        yield anchor.attributes.get("href"), partial(_describe_lexbor_anchor, anchor)
+
+
+def _describe_lexbor_anchor(anchor: Any) -> AnchorDescription:
+    title = _squash(anchor.text(separator=" ", strip=True)) or None
+    container = anchor.parent or anchor
+    container_text = _squash(container.text(separator=" ", strip=True))
+    date_text = None
+    time_tag = container.css_first("time")
+    if time_tag is not None:
+        date_text = time_tag.attributes.get("datetime") or _squash(time_tag.text(separator=" ", strip=True))
+    return title, container_text, date_text
+
+
+def _iter_bs4_anchors(html: str, selector: str) -> Iterator[tuple[str | None, Callable[[], AnchorDescription]]]:
+    soup = BeautifulSoup(html, "html.parser")
+    for anchor in soup.select(selector):
+        yield anchor.get("href"), partial(_describe_bs4_anchor, anchor)
+
+
+def _describe_bs4_anchor(anchor: Any) -> AnchorDescription:
+    title = _squash(anchor.get_text(" ", strip=True)) or None
+    container = anchor.find_parent() or anchor
+    container_text = _squash(container.get_text(" ", strip=True))
+    date_text = None
+    time_tag = container.find("time")
+    if time_tag:
+        date_text = time_tag.get("datetime") or _squash(time_tag.get_text(" ", strip=True))
+    return title, container_text, date_text
+
+
+def _squash(text: str) -> str:
+    # Lexbor keeps whitespace-only text nodes and bs4 keeps runs inside a node;
+    # collapsing both keeps the two backends' rows identical.
+    return " ".join(text.split())
+
+
 class _AnchorParser(HTMLParser):
     def __init__(self) -> None:
         super().__init__()
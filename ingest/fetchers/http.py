@@ -1,9 +1,25 @@
 from __future__ import annotations
 
+import gzip
 from dataclasses import dataclass
+from urllib.error import HTTPError
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
+try:
+    import urllib3
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    urllib3 = None
+
+# Keeps TCP/TLS connections to each host warm across fetches when urllib3 is installed.
+# Like urlopen: one attempt per request (no connect/read/Retry-After retries) and
+# up to 10 redirects followed.
+_POOL = (
+    urllib3.PoolManager(maxsize=8, retries=urllib3.Retry(total=None, connect=0, read=0, other=0, status=0, redirect=10))
+    if urllib3 is not None
+    else None
+)
+
 
 @dataclass
 class HTTPResponse:
@@ -16,7 +32,18 @@ def http_get(url: str, *, headers: dict[str, str] | None = None, params: dict |
     if params:
         query = urlencode({k: v for k, v in params.items() if v is not None})
         final_url = f"{url}?{query}"
-    req = Request(final_url, headers=headers or {})
-    with urlopen(req, timeout=timeout) as resp:  # noqa: S310
-        content = resp.read()
+    request_headers = {"Accept-Encoding": "gzip", **(headers or {})}
+    if _POOL is not None:
+        # urllib3 decodes gzip bodies itself (decode_content defaults to True).
+        resp = _POOL.request("GET", final_url, headers=request_headers, timeout=timeout)
+        # urlopen raises for any final status outside 2xx.
+        if not 200 <= resp.status < 300:
+            raise HTTPError(final_url, resp.status, resp.reason or "", resp.headers, None)
+        content = resp.data
+    else:
+        req = Request(final_url, headers=request_headers)
+        with urlopen(req, timeout=timeout) as resp:  # noqa: S310
+            content = resp.read()
+            if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+                content = gzip.decompress(content)
     return HTTPResponse(text=content.decode("utf-8", errors="replace"), content=content)
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import datetime as dt
 import re
 from typing import Any, TYPE_CHECKING
 
-from ingest.fetchers.common import RateLimiter, parse_datetime
+from ingest.fetchers.common import DEFAULT_RATE_LIMITER, USER_AGENT, RateLimiter, parse_datetime
 from ingest.fetchers.http import http_get
 
 if TYPE_CHECKING:
     from ingest.registry import SourceConfig
 
-USER_AGENT = "ai-native-pm-os/0.1 (+https://example.local)"
 _MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)")
 _DATE_RE = re.compile(r"\b(20\d{2}-\d{2}-\d{2})\b")
 _SKIP_TITLES = {"skip to main content", "main content"}
@@ -17,7 +17,7 @@ _SKIP_TITLES = {"skip to main content", "main content"}
 
 class MDProxyFetcher:
     def __init__(self, *, rate_limiter: RateLimiter | None = None) -> None:
-        self.rate_limiter = rate_limiter or RateLimiter(min_interval=1.5)
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
 
     def fetch(self, source: SourceConfig, *, limit: int) -> list[dict[str, Any]]:
         if not source.url:
@@ -29,6 +29,12 @@ class MDProxyFetcher:
         items: list[dict[str, Any]] = []
         seen_urls: set[str] = set()
         for line in response.text.splitlines():
+            # Most proxy lines carry no link; a substring test is far cheaper than the regex.
+            if "](" not in line:
+                continue
+            stripped = line.strip()
+            published_at: dt.datetime | None = None
+            date_checked = False
             for title, url in _MARKDOWN_LINK_RE.findall(line):
                 cleaned_title = " ".join(title.split())
                 if not cleaned_title:
@@ -39,14 +45,17 @@ class MDProxyFetcher:
                     continue
                 seen_urls.add(url)
 
-                date_match = _DATE_RE.search(line)
+                if not date_checked:
+                    date_match = _DATE_RE.search(line)
+                    published_at = parse_datetime(date_match.group(1) if date_match else None)
+                    date_checked = True
                 items.append(
                     {
                         "title": cleaned_title,
                         "url": url,
-                        "published_at": parse_datetime(date_match.group(1) if date_match else None),
-                        "content": line.strip(),
-                        "raw": {"line": line.strip()},
+                        "published_at": published_at,
+                        "content": stripped,
+                        "raw": {"line": stripped},
                     }
                 )
                 if len(items) >= limit:
@@ -1,22 +1,21 @@
 from __future__ import annotations
 
+import io
 import xml.etree.ElementTree as ET
 from typing import Any
 
 
-from ingest.fetchers.common import RateLimiter, parse_datetime
+from ingest.fetchers.common import DEFAULT_RATE_LIMITER, USER_AGENT, RateLimiter, parse_datetime
 from ingest.fetchers.http import http_get
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ingest.registry import SourceConfig
 
-USER_AGENT = "ai-native-pm-os/0.1 (+https://example.local)"
-
 
 class RSSFetcher:
     def __init__(self, *, rate_limiter: RateLimiter | None = None) -> None:
-        self.rate_limiter = rate_limiter or RateLimiter(min_interval=1.5)
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
 
     def fetch(self, source: SourceConfig, *, limit: int) -> list[dict[str, Any]]:
         if not source.url:
@@ -25,24 +24,29 @@ class RSSFetcher:
         self.rate_limiter.wait(source.url)
         response = http_get(source.url, headers={"User-Agent": USER_AGENT}, timeout=20)
 
-        root = ET.fromstring(response.content)
         items: list[dict[str, Any]] = []
-        for item in root.findall("./channel/item")[:limit]:
+        if limit <= 0:
+            return items
+        for _, item in ET.iterparse(io.BytesIO(response.content)):
+            if item.tag != "item":
+                continue
             items.append(
                 {
-                    "title": _text(item.find("title")),
-                    "url": _text(item.find("link")),
-                    "published_at": parse_datetime(_text(item.find("pubDate")) or _text(item.find("published"))),
-                    "content": _text(item.find("description")) or _text(item.find("summary")),
+                    "title": _findtext(item, "title"),
+                    "url": _findtext(item, "link"),
+                    "published_at": parse_datetime(_findtext(item, "pubDate") or _findtext(item, "published")),
+                    "content": _findtext(item, "description") or _findtext(item, "summary"),
                     "authors": [],
-                    "categories": [_text(c) for c in item.findall("category") if _text(c)],
+                    "categories": [text for c in item.iterfind("category") if (text := (c.text or "").strip())],
                     "raw": {},
                 }
             )
+            item.clear()
+            if len(items) >= limit:
+                break
         return items
 
 
-def _text(node: ET.Element | None) -> str | None:
-    if node is None or node.text is None:
-        return None
-    return node.text.strip()
+def _findtext(node: ET.Element, tag: str) -> str | None:
+    value = node.findtext(tag)
+    return value.strip() if value else None
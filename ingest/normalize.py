@@ -2,14 +2,22 @@ from __future__ import annotations
 
 import datetime as dt
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 
 from pm_os_contracts.models import SIGNAL
 
 from ingest.registry import SourceConfig
+from ingest.validation import validate_signal_payload
 
 MIN_PRIORITY_THRESHOLD = 0.6
 
+# Outcomes of normalize_and_validate_items.
+OK = "ok"
+LOW_PRIORITY = "low_priority"
+DUPLICATE = "duplicate"
+INVALID = "invalid"
+
 IMPACT_KEYWORDS: dict[str, list[str]] = {
     "agent_systems": ["agent", "agents", "autonomous", "workflow agent", "tool use"],
     "evaluation": ["eval", "evaluation", "benchmark", "leaderboard", "metric", "red team"],
@@ -19,43 +27,63 @@ IMPACT_KEYWORDS: dict[str, list[str]] = {
     "tooling_infra": ["sdk", "api", "tooling", "inference", "serving", "platform", "framework"],
 }
 
+_TERM_AREAS: dict[str, str] = {term: area for area, terms in IMPACT_KEYWORDS.items() for term in terms}
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    # Factor shared prefixes ("agent|agents" -> "agent(?:s)?") so the regex engine
+    # walks each prefix once per position instead of retrying every alternative.
+    # Optional suffixes are greedy, so the longest term ending on a word boundary
+    # still wins ("evaluation" over "eval").
+    trie: dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+# One pass over the text for every term; the lookahead lets the scanner skip
+# positions that cannot start a term before entering the trie.
+_IMPACT_RE = re.compile(
+    r"\b(?=[" + "".join(sorted({term[0] for term in _TERM_AREAS})) + r"])(?:" + _trie_pattern(_TERM_AREAS) + r")\b"
+)
+
 
 def infer_impact_area(title: str | None, content: str | None) -> list[str]:
     text = f"{title or ''} {content or ''}".lower()
-    impacts: list[str] = []
-    for area, terms in IMPACT_KEYWORDS.items():
-        if any(re.search(rf"\b{re.escape(term)}\b", text) for term in terms):
-            impacts.append(area)
+    found: set[str] = set()
+    for match in _IMPACT_RE.finditer(text):
+        found.add(_TERM_AREAS[match.group()])
+        if len(found) == len(IMPACT_KEYWORDS):
+            break
+    impacts = [area for area in IMPACT_KEYWORDS if area in found]
     return impacts or ["tooling_infra"]
 
 
-def _freshness_score(published_at: dt.datetime | None, now_utc: dt.datetime) -> float:
-    if not published_at:
-        return 0.4
-    age_days = max(0.0, (now_utc - published_at.astimezone(dt.timezone.utc)).total_seconds() / 86400)
-    if age_days <= 3:
-        return 1.0
-    if age_days <= 7:
-        return 0.7
-    return 0.4
-
-
-def _impact_signal_score(impact_areas: Iterable[str]) -> float:
-    area_count = len(set(impact_areas))
-    if area_count >= 3:
-        return 1.0
-    if area_count == 2:
-        return 0.8
-    if area_count == 1:
-        return 0.6
-    return 0.4
+# Impact factor indexed by min(distinct impact area count, 3).
+_IMPACT_SIGNAL_SCORES = (0.4, 0.6, 0.8, 1.0)
 
 
 def clamp01(value: float) -> float:
     return max(0.0, min(1.0, value))
 
 
-def calculate_priority_score(source_cfg: SourceConfig, item: dict, keywords: list[str]) -> float:
+def calculate_priority_score(
+    source_cfg: SourceConfig,
+    item: dict,
+    keywords: list[str],
+    now_utc: dt.datetime | None = None,
+) -> float:
     """
     Priority = (Strength × Confidence) / Effort
 
@@ -63,31 +91,141 @@ def calculate_priority_score(source_cfg: SourceConfig, item: dict, keywords: lis
     Confidence = source_weight
     Effort = 1.0 (placeholder for MVP)
     """
-    now_utc = dt.datetime.now(tz=dt.timezone.utc)
-    freshness = _freshness_score(item.get("published_at"), now_utc)
-    impact_signal = _impact_signal_score(keywords)
-    strength = freshness * impact_signal
-    confidence = source_cfg.weight
-    effort = 1.0
-    return clamp01((strength * confidence) / effort)
+    if now_utc is None:
+        now_utc = dt.datetime.now(tz=dt.timezone.utc)
+    freshness = _bucket_freshness(item.get("published_at"), *_freshness_cutoffs(now_utc))
+    return _score(freshness, keywords, source_cfg.weight)
+
+
+def calculate_priority_scores_batch(
+    source_cfgs: Sequence[SourceConfig],
+    items: Sequence[dict],
+    keywords_list: Sequence[list[str]],
+    now_utc: dt.datetime,
+) -> list[float]:
+    """Batch form of calculate_priority_score with the freshness cutoffs computed once."""
+    fresh_after, recent_after = _freshness_cutoffs(now_utc)
+    return [
+        _score(_bucket_freshness(item.get("published_at"), fresh_after, recent_after), keywords, source_cfg.weight)
+        for source_cfg, item, keywords in zip(source_cfgs, items, keywords_list, strict=True)
+    ]
+
+
+def _score(freshness: float, impact_area: Iterable[str], weight: float) -> float:
+    # The formula documented on calculate_priority_score; Effort is fixed at 1.0.
+    return clamp01(freshness * _IMPACT_SIGNAL_SCORES[min(len(set(impact_area)), 3)] * weight)
+
+
+def _freshness_cutoffs(now_utc: dt.datetime) -> tuple[dt.datetime, dt.datetime]:
+    return now_utc - dt.timedelta(days=3), now_utc - dt.timedelta(days=7)
+
+
+def _bucket_freshness(published_at: dt.datetime | None, fresh_after: dt.datetime, recent_after: dt.datetime) -> float:
+    # 1.0 up to 3 days old (or future-dated), 0.7 up to 7 days, 0.4 older or undated.
+    if not published_at:
+        return 0.4
+    if published_at.tzinfo is not dt.timezone.utc:
+        published_at = published_at.astimezone(dt.timezone.utc)
+    return 1.0 if published_at >= fresh_after else 0.7 if published_at >= recent_after else 0.4
 
 
 def normalize_item_to_signal(source_cfg: SourceConfig, item: dict, seq_num: int, now_utc: dt.datetime) -> SIGNAL:
-    signal_id = f"SIG-{now_utc.strftime('%Y%m%d')}-{seq_num:03d}"
-    title = item.get("title")
-    content = item.get("content")
-    impact_area = infer_impact_area(title, content)
-    priority_score = calculate_priority_score(source_cfg, item, impact_area)
-    timestamp = item.get("published_at") or now_utc
-
-    return SIGNAL(
-        id=signal_id,
-        source=source_cfg.name or source_cfg.id,
-        type=source_cfg.signal_type,
-        timestamp=timestamp,
-        title=title,
-        content=content,
-        url=item.get("url"),
-        impact_area=impact_area,
-        priority_score=priority_score,
-    )
+    return normalize_items_to_signals(source_cfg, [item], start_seq=seq_num, now_utc=now_utc)[0]
+
+
+def normalize_items_to_signals(
+    source_cfg: SourceConfig,
+    items: Sequence[dict],
+    *,
+    start_seq: int,
+    now_utc: dt.datetime,
+) -> list[SIGNAL]:
+    date_key = now_utc.strftime("%Y%m%d")
+    impact_areas = [infer_impact_area(item.get("title"), item.get("content")) for item in items]
+    priority_scores = calculate_priority_scores_batch([source_cfg] * len(items), items, impact_areas, now_utc)
+    source = source_cfg.name or source_cfg.id
+
+    return [
+        SIGNAL(
+            id=f"SIG-{date_key}-{seq_num:03d}",
+            source=source,
+            type=source_cfg.signal_type,
+            timestamp=item.get("published_at") or now_utc,
+            title=item.get("title"),
+            content=item.get("content"),
+            url=item.get("url"),
+            impact_area=impact_area,
+            priority_score=priority_score,
+        )
+        for seq_num, item, impact_area, priority_score in zip(
+            range(start_seq, start_seq + len(items)), items, impact_areas, priority_scores
+        )
+    ]
+
+
+@dataclass(slots=True)
+class NormalizedItem:
+    reason: str
+    signal: SIGNAL | None = None
+    error: str | None = None
+
+
+def normalize_and_validate_items(
+    source_cfg: SourceConfig,
+    items: Sequence[dict],
+    *,
+    start_seq: int,
+    now_utc: dt.datetime,
+    threshold: float,
+    seen_urls: set[str] | None = None,
+) -> list[NormalizedItem]:
+    """Normalize, threshold, dedupe and validate one source's items in a single pass.
+
+    Every item consumes a sequence number, as with normalize_items_to_signals.
+    Items below ``threshold`` or whose URL is already in ``seen_urls`` are never
+    built into a SIGNAL; URLs of accepted signals are added to ``seen_urls``.
+    """
+    date_key = now_utc.strftime("%Y%m%d")
+    fresh_after, recent_after = _freshness_cutoffs(now_utc)
+    weight = source_cfg.weight
+    source = source_cfg.name or source_cfg.id
+
+    results: list[NormalizedItem] = []
+    for seq_num, item in enumerate(items, start_seq):
+        freshness = _bucket_freshness(item.get("published_at"), fresh_after, recent_after)
+        # The impact factor is at most 1.0, so an item whose freshness and source
+        # weight alone fall short is rejected before its text is scanned.
+        if clamp01(freshness * weight) < threshold:
+            results.append(NormalizedItem(LOW_PRIORITY))
+            continue
+        impact_area = infer_impact_area(item.get("title"), item.get("content"))
+        priority_score = _score(freshness, impact_area, weight)
+        if priority_score < threshold:
+            results.append(NormalizedItem(LOW_PRIORITY))
+            continue
+        url = item.get("url")
+        if seen_urls is not None and url and url in seen_urls:
+            results.append(NormalizedItem(DUPLICATE))
+            continue
+        # SIGNAL construction already enforces the model; only the JSON schema
+        # check is left, so the model is not validated a second time.
+        try:
+            signal = SIGNAL(
+                id=f"SIG-{date_key}-{seq_num:03d}",
+                source=source,
+                type=source_cfg.signal_type,
+                timestamp=item.get("published_at") or now_utc,
+                title=item.get("title"),
+                content=item.get("content"),
+                url=url,
+                impact_area=impact_area,
+                priority_score=priority_score,
+            )
+            validate_signal_payload(signal.to_dict())
+        except Exception as exc:  # noqa: BLE001
+            results.append(NormalizedItem(INVALID, error=str(exc)))
+            continue
+        if seen_urls is not None and url:
+            seen_urls.add(url)
+        results.append(NormalizedItem(OK, signal))
+    return results
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -9,11 +11,20 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - fallback path
     yaml = None
 
+# libyaml's C loader when PyYAML was built with it; same output as SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 from ingest.fetchers.arxiv_fetcher import ArxivFetcher
 from ingest.fetchers.html_list_fetcher import HTMLListFetcher
 from ingest.fetchers.md_proxy_fetcher import MDProxyFetcher
 from ingest.fetchers.rss_fetcher import RSSFetcher
 
+_SOURCES_CACHE_SIZE = 32
+_SOURCES_CACHE: OrderedDict[tuple[str, int, int], list[SourceConfig]] = OrderedDict()
+
+
+_INTERNED_KEYS = ("id", "name", "signal_type", "type", "source_type")
+
 
 @dataclass(slots=True)
 class SourceConfig:
@@ -48,25 +59,38 @@ class SourceConfig:
         if normalized.get("query") is not None and normalized.get("search_query") is None:
             normalized["search_query"] = normalized["query"]
 
+        # These end up on every SIGNAL from the source; share one object per value.
+        for key in _INTERNED_KEYS:
+            value = normalized.get(key)
+            if isinstance(value, str):
+                normalized[key] = sys.intern(value)
+
         return cls(**normalized)
 
 
+_BOOL_SCALARS = {"true": True, "True": True, "false": False, "False": False}
+_NUMERIC_STARTS = frozenset("+-.0123456789")
+
+
 def _parse_scalar(value: str) -> Any:
+    # Dispatch on the first character so plain strings skip the bool, quote and
+    # numeric checks they cannot match.
     value = value.strip()
-    if value in {"true", "True"}:
-        return True
-    if value in {"false", "False"}:
-        return False
-    if value.startswith('"') and value.endswith('"'):
-        return value[1:-1]
-    if value.startswith("'") and value.endswith("'"):
-        return value[1:-1]
-    try:
-        if "." in value:
-            return float(value)
-        return int(value)
-    except ValueError:
+    if not value:
         return value
+    first = value[0]
+    if first == '"' or first == "'":
+        return value[1:-1] if value[-1] == first else value
+    if first in "tTfF":
+        return _BOOL_SCALARS.get(value, value)
+    if first in _NUMERIC_STARTS or first.isdigit():
+        try:
+            if "." in value:
+                return float(value)
+            return int(value)
+        except ValueError:
+            return value
+    return value
 
 
 def _minimal_yaml_load(text: str) -> list[dict[str, Any]]:
@@ -74,18 +98,16 @@ def _minimal_yaml_load(text: str) -> list[dict[str, Any]]:
     current: dict[str, Any] | None = None
     for raw in text.splitlines():
         line = raw.strip()
-        if not line or line.startswith("#"):
+        if not line or line[0] == "#":
             continue
-        if line.startswith("- "):
+        if line[:2] == "- ":
             if current:
                 items.append(current)
             current = {}
             line = line[2:]
-            if line:
-                key, value = line.split(":", 1)
-                current[key.strip()] = _parse_scalar(value)
-            continue
-        if current is None:
+            if not line:
+                continue
+        elif current is None:
             continue
         key, value = line.split(":", 1)
         current[key.strip()] = _parse_scalar(value)
@@ -96,13 +118,26 @@ def _minimal_yaml_load(text: str) -> list[dict[str, Any]]:
 
 
 def load_sources(path: str | Path) -> list[SourceConfig]:
+    # Parsed configs are shared between calls for an unchanged file, so callers
+    # must treat the returned SourceConfig objects as read-only.
     config_path = Path(path)
+    stat = config_path.stat()
+    key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    cached = _SOURCES_CACHE.get(key)
+    if cached is not None:
+        _SOURCES_CACHE.move_to_end(key)
+        return list(cached)
+
     raw_text = config_path.read_text(encoding="utf-8")
     if yaml is not None:
-        source_list = yaml.safe_load(raw_text) or []
+        source_list = yaml.load(raw_text, Loader=_YAML_LOADER) or []
     else:
         source_list = _minimal_yaml_load(raw_text)
-    return [SourceConfig.from_dict(row) for row in source_list]
+    sources = [SourceConfig.from_dict(row) for row in source_list]
+    _SOURCES_CACHE[key] = sources
+    if len(_SOURCES_CACHE) > _SOURCES_CACHE_SIZE:
+        _SOURCES_CACHE.popitem(last=False)
+    return list(sources)
 
 
 def get_fetcher(source_type: str):
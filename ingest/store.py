@@ -1,45 +1,91 @@
 from __future__ import annotations
 
+import datetime as dt
 import hashlib
-import json
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from typing import Any
 
+from orchestrator.storage import JournaledSnapshot, dumps_json
 from pm_os_contracts.models import SIGNAL
 
+# 1 (unversioned files): sha256 fallback hashes; 2: blake2b-128. Existing
+# indexes keep the hash they were built with so their keys stay comparable.
+INDEX_VERSION = 2
 
-def _hash_key(source: str, title: str | None, published: str) -> str:
-    raw = f"{source}|{title or ''}|{published}"
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
+def _hash_key(source: str, title: str | None, published: str, *, index_version: int = INDEX_VERSION) -> str:
+    raw = f"{source}|{title or ''}|{published}".encode("utf-8")
+    if index_version < 2:
+        return hashlib.sha256(raw).hexdigest()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
-def _load_index(index_path: Path) -> dict[str, set[str]]:
-    if not index_path.exists():
-        return {"urls": set(), "fallback_hashes": set()}
-    payload = json.loads(index_path.read_text(encoding="utf-8"))
-    return {
+
+def _load_index(index_path: Path, *, max_age_days: int | None = None) -> dict[str, Any]:
+    # "dated" maps each fallback hash to (url, first-seen day) in insertion
+    # order; entries from before days were recorded are kept in the plain
+    # url/hash lists.
+    payload, journal = JournaledSnapshot(index_path).read()
+    if payload is None:
+        return {"index_version": INDEX_VERSION, "urls": set(), "fallback_hashes": set(), "dated": {}}
+    index_data = {
+        "index_version": payload.get("index_version", 1),
         "urls": set(payload.get("urls", [])),
         "fallback_hashes": set(payload.get("fallback_hashes", [])),
+        "dated": {},
+    }
+    for entry in [*payload.get("entries", []), *journal]:
+        _add_entry(index_data, entry.get("url"), entry["hash"], entry.get("ts"))
+    if max_age_days is not None:
+        _prune_index(index_data, max_age_days)
+    return index_data
+
+
+def _add_entry(index_data: dict[str, Any], url: str | None, fallback: str, day: str | None) -> None:
+    if url:
+        index_data["urls"].add(url)
+    index_data["fallback_hashes"].add(fallback)
+    if day is not None:
+        index_data["dated"][fallback] = (url, day)
+
+
+def _prune_index(index_data: dict[str, Any], max_age_days: int) -> None:
+    cutoff = (dt.datetime.now(tz=dt.timezone.utc).date() - dt.timedelta(days=max_age_days)).isoformat()
+    dated = index_data["dated"]
+    expired = [fallback for fallback, (_, day) in dated.items() if day < cutoff]
+    for fallback in expired:
+        url, _ = dated.pop(fallback)
+        index_data["fallback_hashes"].discard(fallback)
+        if url:
+            index_data["urls"].discard(url)
+
+
+def _snapshot(index_data: dict[str, Any]) -> dict[str, Any]:
+    dated = index_data["dated"]
+    dated_urls = {url for url, _ in dated.values() if url}
+    # Only the undated legacy lists are sorted; dated entries are already in
+    # first-seen order and are written as-is.
+    return {
+        "index_version": index_data["index_version"],
+        "urls": sorted(index_data["urls"] - dated_urls),
+        "fallback_hashes": sorted(index_data["fallback_hashes"].difference(dated)),
+        "entries": [{"url": url, "hash": fallback, "ts": day} for fallback, (url, day) in dated.items()],
     }
 
 
-def _write_index_atomic(index_path: Path, index_data: dict[str, set[str]]) -> None:
-    index_path.parent.mkdir(parents=True, exist_ok=True)
-    serialized = json.dumps(
-        {
-            "urls": sorted(index_data["urls"]),
-            "fallback_hashes": sorted(index_data["fallback_hashes"]),
-        },
-        indent=2,
-    )
-    with NamedTemporaryFile("w", encoding="utf-8", dir=index_path.parent, delete=False) as tmp:
-        tmp.write(serialized)
-        tmp_path = Path(tmp.name)
-    tmp_path.replace(index_path)
+def _update_index(index_path: Path, index_data: dict[str, Any], new_entries: list[dict[str, Any]]) -> None:
+    JournaledSnapshot(index_path).append(new_entries, lambda: _snapshot(index_data))
 
 
-def append_signals(path: str | Path, signals: list[SIGNAL], *, index_path: str | Path | None = None) -> tuple[int, int]:
-    written_signals, skipped = append_signals_with_results(path, signals, index_path=index_path)
+def append_signals(
+    path: str | Path,
+    signals: list[SIGNAL],
+    *,
+    index_path: str | Path | None = None,
+    max_index_age_days: int | None = None,
+) -> tuple[int, int]:
+    written_signals, skipped = append_signals_with_results(
+        path, signals, index_path=index_path, max_index_age_days=max_index_age_days
+    )
     return len(written_signals), skipped
 
 
@@ -48,21 +94,51 @@ def append_signals_with_results(
     signals: list[SIGNAL],
     *,
     index_path: str | Path | None = None,
+    max_index_age_days: int | None = None,
 ) -> tuple[list[SIGNAL], int]:
-    data_path = Path(path)
-    idx_path = Path(index_path) if index_path else data_path.parent / "signals_index.json"
-    data_path.parent.mkdir(parents=True, exist_ok=True)
-
-    index_data = _load_index(idx_path)
-
-    written_signals: list[SIGNAL] = []
-    skipped = 0
-    with data_path.open("a", encoding="utf-8") as handle:
+    """Append non-duplicate signals; dedup entries older than ``max_index_age_days`` are forgotten."""
+    with SignalAppender(path, index_path=index_path, max_index_age_days=max_index_age_days) as appender:
+        return appender.append(signals)
+
+
+class SignalAppender:
+    """Append batches of signals to one JSONL file, loading the dedupe index once.
+
+    Each append() writes its batch and records it in the index journal before
+    returning, so batches written before a crash are not re-ingested later.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        index_path: str | Path | None = None,
+        max_index_age_days: int | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path else self.path.parent / "signals_index.json"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._index_data = _load_index(self.index_path, max_age_days=max_index_age_days)
+        self._today = dt.datetime.now(tz=dt.timezone.utc).date().isoformat()
+        self._handle = self.path.open("ab")
+
+    def __enter__(self) -> SignalAppender:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def append(self, signals: list[SIGNAL]) -> tuple[list[SIGNAL], int]:
+        index_data = self._index_data
+        written_signals: list[SIGNAL] = []
+        out_lines: list[bytes] = []
+        new_entries: list[dict[str, Any]] = []
+        skipped = 0
         for signal in signals:
             signal_payload = signal.to_dict()
             url = signal_payload.get("url")
             published = str(signal_payload.get("timestamp", ""))
-            fallback = _hash_key(signal.source, signal.title, published)
+            fallback = _hash_key(signal.source, signal.title, published, index_version=index_data["index_version"])
 
             if url and url in index_data["urls"]:
                 skipped += 1
@@ -71,12 +147,24 @@ def append_signals_with_results(
                 skipped += 1
                 continue
 
-            handle.write(json.dumps(signal_payload) + "\n")
+            out_lines.append(dumps_json(signal_payload))
             written_signals.append(signal)
-
-            if url:
-                index_data["urls"].add(url)
-            index_data["fallback_hashes"].add(fallback)
-
-    _write_index_atomic(idx_path, index_data)
-    return written_signals, skipped
+            new_entries.append({"url": url, "hash": fallback, "id": signal.id, "ts": self._today})
+            _add_entry(index_data, url, fallback, self._today)
+
+        # One write for the whole batch instead of one per signal.
+        if out_lines:
+            self._handle.write(b"\n".join(out_lines) + b"\n")
+            self._handle.flush()
+        # The index only changes when something was written; all-duplicate
+        # batches leave it untouched.
+        if new_entries or not self.index_path.exists():
+            _update_index(self.index_path, index_data, new_entries)
+        return written_signals, skipped
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        self._handle.close()
+        if not self.index_path.exists():
+            _update_index(self.index_path, self._index_data, [])
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any
+
 from jsonschema import Draft7Validator, FormatChecker
 
 from pm_os_contracts.models import SIGNAL, load_schema
 
 
+@lru_cache(maxsize=None)
+def _signal_validator() -> Draft7Validator:
+    # Built on first use and reused; validate() keeps no per-call state.
+    return Draft7Validator(schema=load_schema("SIGNAL"), format_checker=FormatChecker())
+
+
+def validate_signal_payload(payload: dict[str, Any]) -> None:
+    """Check a dumped SIGNAL payload against the JSON schema only."""
+    _signal_validator().validate(payload)
+
+
 def validate_signal_contract(signal: SIGNAL) -> None:
     payload = signal.to_dict()
-    validator = Draft7Validator(schema=load_schema("SIGNAL"), format_checker=FormatChecker())
-    validator.validate(payload)
+    validate_signal_payload(payload)
     SIGNAL.model_validate(payload)
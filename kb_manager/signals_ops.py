@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import Any
 
+from orchestrator.storage import JournaledSnapshot
 from pm_os_contracts.models import SIGNAL
 
 _URL_PATTERN = re.compile(r"https?://[^\s)\]>\"']+")
+# The whole-second UTC form SIGNAL.to_dict() emits, e.g. 2026-02-16T12:34:56Z.
+_UTC_SECONDS_RE = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ", re.ASCII)
+# Escapes for YAML double-quoted scalars; backslash must be escaped too.
+_YAML_SCALAR_TRANS = str.maketrans({'"': '\\"', "\\": "\\\\"})
+
+# Fingerprint hash versioning, as for ingest.store.INDEX_VERSION.
+INDEX_VERSION = 2
 
 
 class SignalVaultWriter:
@@ -19,39 +25,62 @@ class SignalVaultWriter:
         self.vault_root = Path(vault_root)
         self.signals_root = self.vault_root / "95_Signals"
         self.index_path = self.vault_root / "00_Index" / "signal_url_index.json"
+        self._index_store = JournaledSnapshot(self.index_path, sort_keys=True)
 
     def write_signals(self, signals: list[SIGNAL]) -> dict[str, int]:
         summary = {"written": 0, "skipped_existing": 0, "skipped_dupe": 0}
         index_data = self._load_index()
-
-        for signal in signals:
-            payload = signal.to_dict()
-            url = payload.get("url")
-            fingerprint = self._fingerprint(signal.source, signal.title, self._iso_timestamp(payload.get("timestamp")))
-
-            if url and url in index_data["seen_urls"]:
-                summary["skipped_dupe"] += 1
-                continue
-            if fingerprint in index_data["seen_fingerprints"]:
-                summary["skipped_dupe"] += 1
-                continue
-
-            target = self._note_path(signal)
-            if target.exists():
-                summary["skipped_existing"] += 1
-                continue
-
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(self._render_note(signal), encoding="utf-8")
-            summary["written"] += 1
-
-            if url:
-                index_data["seen_urls"][url] = signal.id
-            index_data["seen_fingerprints"][fingerprint] = signal.id
-            self._write_index_atomic(index_data)
+        new_entries: list[dict[str, str | None]] = []
+
+        try:
+            for signal in signals:
+                payload = signal.to_dict()
+                url = payload.get("url")
+                fingerprint = self._fingerprint(
+                    signal.source,
+                    signal.title,
+                    self._iso_timestamp(payload.get("timestamp")),
+                    index_version=index_data["index_version"],
+                )
+
+                if url and url in index_data["seen_urls"]:
+                    summary["skipped_dupe"] += 1
+                    continue
+                if fingerprint in index_data["seen_fingerprints"]:
+                    summary["skipped_dupe"] += 1
+                    continue
+
+                target = self._note_path(signal)
+                if target.exists():
+                    summary["skipped_existing"] += 1
+                    continue
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                self._write_note(target, self._render_note(signal, payload).encode("utf-8"))
+                summary["written"] += 1
+
+                if url:
+                    index_data["seen_urls"][url] = signal.id
+                index_data["seen_fingerprints"][fingerprint] = signal.id
+                new_entries.append({"url": url, "fingerprint": fingerprint, "id": signal.id})
+        finally:
+            # Flush once per batch; notes written before a failure are still indexed.
+            if new_entries:
+                self._update_index(index_data, new_entries)
 
         return summary
 
+    @staticmethod
+    def _write_note(target: Path, blob: bytes) -> None:
+        # Raw fd write of the pre-encoded note; no TextIOWrapper per file.
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(blob)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
     def _note_path(self, signal: SIGNAL) -> Path:
         return self.signals_root / f"{signal.id}.md"
 
@@ -68,8 +97,10 @@ class SignalVaultWriter:
             return parsed.replace(tzinfo=timezone.utc)
         return parsed.astimezone(timezone.utc)
 
-    def _render_note(self, signal: SIGNAL) -> str:
-        payload = signal.to_dict()
+    def _render_note(self, signal: SIGNAL, payload: dict[str, Any] | None = None) -> str:
+        # write_signals passes the payload it already dumped for dedup.
+        if payload is None:
+            payload = signal.to_dict()
         lines = [
             "---",
             f"id: {signal.id}",
@@ -105,39 +136,49 @@ class SignalVaultWriter:
     @staticmethod
     def _extract_links(signal: SIGNAL) -> list[str]:
         links: list[str] = []
+        seen: set[str] = set()
         if signal.url:
             links.append(signal.url)
+            seen.add(signal.url)
         if signal.content:
-            for found in _URL_PATTERN.findall(signal.content):
-                if found not in links:
+            for match in _URL_PATTERN.finditer(signal.content):
+                found = match.group()
+                if found not in seen:
+                    seen.add(found)
                     links.append(found)
         return links
 
-    def _load_index(self) -> dict[str, dict[str, str]]:
-        if not self.index_path.exists():
-            return {"seen_urls": {}, "seen_fingerprints": {}}
-        payload = json.loads(self.index_path.read_text(encoding="utf-8"))
-        return {
+    def _load_index(self) -> dict[str, Any]:
+        payload, journal = self._index_store.read()
+        if payload is None:
+            return {"index_version": INDEX_VERSION, "seen_urls": {}, "seen_fingerprints": {}}
+        index_data = {
+            "index_version": payload.get("index_version", 1),
             "seen_urls": dict(payload.get("seen_urls", {})),
             "seen_fingerprints": dict(payload.get("seen_fingerprints", {})),
         }
-
-    def _write_index_atomic(self, index_data: dict[str, dict[str, str]]) -> None:
-        self.index_path.parent.mkdir(parents=True, exist_ok=True)
-        serialized = json.dumps(index_data, indent=2, sort_keys=True) + "\n"
-
-        with NamedTemporaryFile(mode="w", encoding="utf-8", dir=self.index_path.parent, delete=False) as tmp:
-            tmp.write(serialized)
-            tmp.flush()
-            os.fsync(tmp.fileno())
-            tmp_name = tmp.name
-
-        os.replace(tmp_name, self.index_path)
+        for entry in journal:
+            if entry.get("url"):
+                index_data["seen_urls"][entry["url"]] = entry["id"]
+            index_data["seen_fingerprints"][entry["fingerprint"]] = entry["id"]
+        return index_data
+
+    def _update_index(self, index_data: dict[str, Any], new_entries: list[dict[str, str | None]]) -> None:
+        self._index_store.append(
+            new_entries,
+            lambda: {
+                "index_version": index_data["index_version"],
+                "seen_urls": index_data["seen_urls"],
+                "seen_fingerprints": index_data["seen_fingerprints"],
+            },
+        )
 
     @staticmethod
-    def _fingerprint(source: str, title: str | None, timestamp: str) -> str:
-        raw = f"{source}|{title or ''}|{timestamp}"
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    def _fingerprint(source: str, title: str | None, timestamp: str, *, index_version: int = INDEX_VERSION) -> str:
+        raw = f"{source}|{title or ''}|{timestamp}".encode("utf-8")
+        if index_version < 2:
+            return hashlib.sha256(raw).hexdigest()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
     @staticmethod
     def _iso_timestamp(value: Any) -> str:
@@ -145,6 +186,9 @@ class SignalVaultWriter:
             normalized = value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
             return normalized.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
         if isinstance(value, str):
+            if len(value) == 20 and _UTC_SECONDS_RE.fullmatch(value):
+                # Already in the output form; skip the parse/format round trip.
+                return value
             return SignalVaultWriter._timestamp_to_utc(value).replace(microsecond=0).isoformat().replace("+00:00", "Z")
         return ""
 
@@ -153,13 +197,12 @@ class SignalVaultWriter:
         if value is None:
             return "null"
         if isinstance(value, str):
-            escaped = value.replace('"', '\\"')
-            return f'"{escaped}"'
+            return f'"{value.translate(_YAML_SCALAR_TRANS)}"'
         return str(value)
 
     @staticmethod
     def _yaml_list(values: list[str] | None) -> str:
         if not values:
             return "[]"
-        escaped = ['"' + v.replace('"', '\\"') + '"' for v in values]
+        escaped = ['"' + v.translate(_YAML_SCALAR_TRANS) + '"' for v in values]
         return "[" + ", ".join(escaped) + "]"
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import json
 import os
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Any
+from typing import Any, Callable
 
+from orchestrator.storage import dumps_json
 from pm_os_contracts.models import COS_CASE, LPL_POST, LTI_NODE, RTI_NODE
 
 
@@ -33,24 +35,25 @@ class KnowledgeBaseManager:
         self.cos_index_path = self.cos_dir / "cos_index.json"
         self.rti_index_path = self.rti_dir / "rti_index.json"
         self.lpl_index_path = self.lpl_dir / "lpl_index.jsonl"
+        self._scan_cache: dict[str, tuple[int, int, dict[str, Any] | None]] = {}
 
     def writeback_lti(self, lti_node: LTI_NODE) -> Path:
         target = self.lti_dir / lti_node.series / f"{lti_node.id}.md"
-        self._write_model(target, lti_node)
-        self.sync_indices()
+        payload = self._write_model(target, lti_node)
+        self._update_index(self.lti_dir, target, payload)
         return target
 
     def writeback_cos(self, cos_case: COS_CASE) -> Path:
         target = self.cos_dir / cos_case.failure_pattern_id / f"{cos_case.id}.md"
-        self._write_model(target, cos_case)
-        self.sync_indices()
+        payload = self._write_model(target, cos_case)
+        self._update_index(self.cos_dir, target, payload)
         return target
 
     def writeback_lpl(self, lpl_post: LPL_POST) -> Path:
         year, month = self._year_month_from_lpl_id(lpl_post.id)
         target = self.lpl_dir / year / month / f"{lpl_post.id}.md"
-        self._write_model(target, lpl_post)
-        self.sync_indices()
+        payload = self._write_model(target, lpl_post)
+        self._update_index(self.lpl_dir, target, payload)
         return target
 
     def update_rti_status(self, rti_id: str, status: str) -> None:
@@ -61,15 +64,47 @@ class KnowledgeBaseManager:
 
         current["status"] = status
         current["updated_at"] = self._utc_now_iso()
-        self._atomic_write_text(target, self._render_json_document(current))
-        self.sync_indices()
+        self._atomic_write(target, self._render_json_document(current))
+        self._update_index(self.rti_dir, target, current)
 
     def sync_indices(self) -> SyncResult:
+        """Rebuild every index from a full rescan of the vault."""
         lti_entries = self._scan_json_markdown(self.lti_dir, "LTI-")
         cos_entries = self._scan_json_markdown(self.cos_dir, "COS-")
         lpl_entries = self._scan_json_markdown(self.lpl_dir, "LPL-")
         rti_entries = self._scan_json_markdown(self.rti_dir, "RTI-")
 
+        self._write_lti_index(lti_entries)
+        self._write_cos_index(cos_entries)
+        self._write_rti_index(rti_entries)
+        self._write_lpl_index(lpl_entries)
+
+        return SyncResult(
+            lti_count=len(lti_entries),
+            cos_count=len(cos_entries),
+            lpl_count=len(lpl_entries),
+            rti_count=len(rti_entries),
+        )
+
+    def _update_index(self, root: Path, target: Path, payload: dict[str, Any]) -> None:
+        # The note just written goes straight into the scan cache, so the rescan
+        # only stats the directory and re-parses notes changed outside this manager.
+        relpath = target.relative_to(self.vault_root).as_posix()
+        with suppress(FileNotFoundError):
+            stat = target.stat()
+            self._scan_cache[os.fspath(target)] = (stat.st_mtime_ns, stat.st_size, {**payload, "_relpath": relpath})
+        id_prefix, write_index = self._index_specs()[root]
+        write_index(self._scan_json_markdown(root, id_prefix))
+
+    def _index_specs(self) -> dict[Path, tuple[str, Callable[[list[dict[str, Any]]], None]]]:
+        return {
+            self.lti_dir: ("LTI-", self._write_lti_index),
+            self.cos_dir: ("COS-", self._write_cos_index),
+            self.lpl_dir: ("LPL-", self._write_lpl_index),
+            self.rti_dir: ("RTI-", self._write_rti_index),
+        }
+
+    def _write_lti_index(self, lti_entries: list[dict[str, Any]]) -> None:
         lti_index = {
             "generated_at": self._utc_now_iso(),
             "items": [
@@ -82,8 +117,9 @@ class KnowledgeBaseManager:
                 for item in lti_entries
             ],
         }
-        self._atomic_write_text(self.lti_index_path, json.dumps(lti_index, indent=2, sort_keys=True) + "\n")
+        self._atomic_write(self.lti_index_path, self._render_json_document(lti_index))
 
+    def _write_cos_index(self, cos_entries: list[dict[str, Any]]) -> None:
         cos_index = {
             "generated_at": self._utc_now_iso(),
             "items": [
@@ -95,8 +131,9 @@ class KnowledgeBaseManager:
                 for item in cos_entries
             ],
         }
-        self._atomic_write_text(self.cos_index_path, json.dumps(cos_index, indent=2, sort_keys=True) + "\n")
+        self._atomic_write(self.cos_index_path, self._render_json_document(cos_index))
 
+    def _write_rti_index(self, rti_entries: list[dict[str, Any]]) -> None:
         rti_index = {
             "generated_at": self._utc_now_iso(),
             "items": [
@@ -110,10 +147,11 @@ class KnowledgeBaseManager:
                 for item in rti_entries
             ],
         }
-        self._atomic_write_text(self.rti_index_path, json.dumps(rti_index, indent=2, sort_keys=True) + "\n")
+        self._atomic_write(self.rti_index_path, self._render_json_document(rti_index))
 
+    def _write_lpl_index(self, lpl_entries: list[dict[str, Any]]) -> None:
         lines = [
-            json.dumps(
+            dumps_json(
                 {
                     "id": item["id"],
                     "path": item["_relpath"],
@@ -122,38 +160,38 @@ class KnowledgeBaseManager:
                 },
                 sort_keys=True,
             )
+            + b"\n"
             for item in lpl_entries
         ]
-        lpl_content = "\n".join(lines)
-        if lpl_content:
-            lpl_content += "\n"
-        self._atomic_write_text(self.lpl_index_path, lpl_content)
+        self._atomic_write(self.lpl_index_path, b"".join(lines))
 
-        return SyncResult(
-            lti_count=len(lti_entries),
-            cos_count=len(cos_entries),
-            lpl_count=len(lpl_entries),
-            rti_count=len(rti_entries),
-        )
-
-    def _write_model(self, target: Path, model: LTI_NODE | COS_CASE | LPL_POST) -> None:
+    def _write_model(self, target: Path, model: LTI_NODE | COS_CASE | LPL_POST) -> dict[str, Any]:
         payload = model.model_dump(mode="json", exclude_none=True)
         payload["updated_at"] = self._utc_now_iso()
-        self._atomic_write_text(target, self._render_json_document(payload))
+        self._atomic_write(target, self._render_json_document(payload))
+        return payload
 
     def _scan_json_markdown(self, root: Path, id_prefix: str) -> list[dict[str, Any]]:
         if not root.exists():
             return []
 
+        root_relpath = root.relative_to(self.vault_root).as_posix()
         results: list[dict[str, Any]] = []
-        for md_path in sorted(root.rglob("*.md")):
-            payload = self._read_json_file(md_path)
+        for parts, md_path, stat in _walk_markdown(root):
+            # Only files whose mtime or size changed since the last scan are re-parsed.
+            cached = self._scan_cache.get(md_path)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                payload = cached[2]
+            else:
+                payload = self._read_json_file(Path(md_path))
+                if payload:
+                    payload["_relpath"] = "/".join((root_relpath, *parts))
+                self._scan_cache[md_path] = (stat.st_mtime_ns, stat.st_size, payload)
             if not payload:
                 continue
             item_id = payload.get("id")
             if not isinstance(item_id, str) or not item_id.startswith(id_prefix):
                 continue
-            payload["_relpath"] = md_path.relative_to(self.vault_root).as_posix()
             results.append(payload)
         return results
 
@@ -168,18 +206,18 @@ class KnowledgeBaseManager:
         except json.JSONDecodeError:
             return None
 
-    def _atomic_write_text(self, target: Path, content: str) -> None:
+    def _atomic_write(self, target: Path, data: bytes) -> None:
         target.parent.mkdir(parents=True, exist_ok=True)
-        with NamedTemporaryFile(mode="w", encoding="utf-8", dir=target.parent, delete=False) as tmp:
-            tmp.write(content)
+        with NamedTemporaryFile(mode="wb", dir=target.parent, delete=False) as tmp:
+            tmp.write(data)
             tmp.flush()
             os.fsync(tmp.fileno())
             tmp_name = tmp.name
         os.replace(tmp_name, target)
 
     @staticmethod
-    def _render_json_document(payload: dict[str, Any]) -> str:
-        return json.dumps(payload, indent=2, sort_keys=True) + "\n"
+    def _render_json_document(payload: dict[str, Any]) -> bytes:
+        return dumps_json(payload, pretty=True, sort_keys=True) + b"\n"
 
     @staticmethod
     def _utc_now_iso() -> str:
@@ -190,3 +228,31 @@ class KnowledgeBaseManager:
         # LPL-YYYYMMDDTHHMMSSZ-NNN
         timestamp = lpl_id.split("-")[1]
         return timestamp[:4], timestamp[4:6]
+
+
+def _relpath_sort_key(item: dict[str, Any]) -> tuple[str, ...]:
+    # Same order as sorted(root.rglob(...)), which compares path components.
+    return tuple(item["_relpath"].split("/"))
+
+
+def _walk_markdown(root: Path) -> list[tuple[tuple[str, ...], str, os.stat_result]]:
+    """Return (path parts below root, path, stat) for each *.md file, in rglob order."""
+    found: list[tuple[tuple[str, ...], str, os.stat_result]] = []
+    stack: list[tuple[tuple[str, ...], str]] = [((), os.fspath(root))]
+    while stack:
+        parts, directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(((*parts, entry.name), entry.path))
+                elif os.path.normcase(entry.name).endswith(".md") and entry.is_file():
+                    try:
+                        found.append(((*parts, entry.name), entry.path, entry.stat()))
+                    except FileNotFoundError:
+                        continue
+    found.sort(key=lambda row: row[0])
+    return found
@@ -1,3 +1,17 @@
-from orchestrator.workflow import Orchestrator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from orchestrator.workflow import Orchestrator
 
 __all__ = ["Orchestrator"]
+
+
+def __getattr__(name: str) -> Any:
+    # Deferred so importing orchestrator.cli (e.g. for --help) does not load the workflow.
+    if name == "Orchestrator":
+        from orchestrator.workflow import Orchestrator
+
+        return Orchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
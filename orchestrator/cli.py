@@ -2,30 +2,116 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import heapq
+import importlib
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-
-from ingest.normalize import MIN_PRIORITY_THRESHOLD, normalize_item_to_signal
-from ingest.registry import get_fetcher, load_sources
-from ingest.store import append_signals_with_results
-from ingest.validation import validate_signal_contract
-from orchestrator.vault_ops import (
-    current_week_id,
-    resolve_vault_root,
-    write_signal_markdown,
-    write_weekly_review_from_signals,
-)
-from orchestrator.l5_routing_guard import (
-    route_after_gate_decision,
-    list_staged,
-    publish_lti_draft,
-    reject_lti_draft,
-    publish_rti_proposal,
-    reject_rti_proposal,
-    check_rule_of_three_and_propose_rti,
-)
-from orchestrator.workflow import Orchestrator
-from pm_os_contracts.models import SIGNAL
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from ingest.normalize import (
+        DUPLICATE,
+        LOW_PRIORITY,
+        MIN_PRIORITY_THRESHOLD,
+        OK,
+        normalize_and_validate_items,
+    )
+    from ingest.registry import get_fetcher, load_sources
+    from ingest.store import SignalAppender
+    from orchestrator.l5_routing_guard import (
+        check_rule_of_three_and_propose_rti,
+        list_staged,
+        publish_lti_draft,
+        publish_rti_proposal,
+        reject_lti_draft,
+        reject_rti_proposal,
+        route_after_gate_decision,
+    )
+    from orchestrator.vault_ops import (
+        current_week_id,
+        resolve_vault_root,
+        write_signal_markdowns,
+        write_weekly_review_from_signals,
+    )
+    from orchestrator.workflow import Orchestrator
+    from pm_os_contracts.models import SIGNAL
+
+# Mirrors the SIGNAL.type literal; kept here so building the parser does not
+# import the contract models.
+_SIGNAL_TYPES = ("capability", "research", "governance", "market", "ecosystem")
+
+# Command dependencies are imported on first use so `--help` and argument
+# errors never pay for pydantic, jsonschema, bs4 or the contract models.
+# Handlers _require() the modules they use; the TYPE_CHECKING imports above
+# mirror this table for type checkers.
+_LAZY_MODULES: dict[str, tuple[str, ...]] = {
+    "ingest.normalize": ("DUPLICATE", "LOW_PRIORITY", "MIN_PRIORITY_THRESHOLD", "OK", "normalize_and_validate_items"),
+    "ingest.registry": ("get_fetcher", "load_sources"),
+    "ingest.store": ("SignalAppender",),
+    "orchestrator.l5_routing_guard": (
+        "check_rule_of_three_and_propose_rti",
+        "list_staged",
+        "publish_lti_draft",
+        "publish_rti_proposal",
+        "reject_lti_draft",
+        "reject_rti_proposal",
+        "route_after_gate_decision",
+    ),
+    "orchestrator.vault_ops": (
+        "current_week_id",
+        "resolve_vault_root",
+        "write_signal_markdowns",
+        "write_weekly_review_from_signals",
+    ),
+    "orchestrator.workflow": ("Orchestrator",),
+    "pm_os_contracts.models": ("SIGNAL",),
+}
+_LAZY_IMPORTS = {name: module_name for module_name, names in _LAZY_MODULES.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _require(*module_names: str) -> None:
+    """Bind every lazily imported name of ``module_names`` as a module global.
+
+    Names that are already set (e.g. patched by tests) are kept.
+    """
+    for module_name in module_names:
+        for name in _LAZY_MODULES[module_name]:
+            if name not in globals():
+                __getattr__(name)
+
+
+def _emit(line: bytes) -> None:
+    """Write one output line to stdout as a single buffered write."""
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(line.decode("utf-8") + "\n")
+        stream.flush()
+        return
+    # Both parts land in the writer's buffer and leave in one flush, without
+    # concatenating a copy of the line.
+    stream.flush()
+    buffer.write(line)
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+def _emit_json(payload: Any) -> None:
+    # Always the stdlib encoder with its defaults: scripts parse this output,
+    # and non-ASCII stays \u-escaped so it survives non-UTF-8 consoles.
+    _emit(json.dumps(payload).encode("ascii"))
 
 
 def _parse_iso_datetime(value: str) -> dt.datetime:
@@ -35,36 +121,45 @@ def _parse_iso_datetime(value: str) -> dt.datetime:
     return parsed
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="PM-OS orchestrator CLI")
-    parser.add_argument("--data-dir", default="orchestrator/data", help="Directory containing orchestrator JSONL files")
+class _AppendUnique(argparse.Action):
+    """Like action="append", but a value given more than once is kept once."""
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        current = getattr(namespace, self.dest, None) or []
+        if values not in current:
+            current = [*current, values]
+        setattr(namespace, self.dest, current)
 
-    subparsers = parser.add_subparsers(dest="command", required=True)
 
+def _add_signal_parser(subparsers: argparse._SubParsersAction) -> None:
     signal_parser = subparsers.add_parser("signal")
     signal_sub = signal_parser.add_subparsers(dest="signal_command", required=True)
 
     signal_add = signal_sub.add_parser("add")
     signal_add.add_argument("--source", required=True)
-    signal_add.add_argument("--type", required=True, choices=["capability", "research", "governance", "market", "ecosystem"])
+    signal_add.add_argument("--type", required=True, choices=_SIGNAL_TYPES)
     signal_add.add_argument("--title")
     signal_add.add_argument("--content")
     signal_add.add_argument("--url")
     signal_add.add_argument("--priority-score", type=float)
-    signal_add.add_argument("--impact-area", action="append")
+    signal_add.add_argument("--impact-area", action=_AppendUnique)
     signal_add.add_argument("--timestamp", help="ISO-8601 timestamp")
 
     signal_top = signal_sub.add_parser("top")
     signal_top.add_argument("--limit", type=int, default=3)
 
+
+def _add_add_signal_parser(subparsers: argparse._SubParsersAction) -> None:
     add_signal = subparsers.add_parser("add_signal", help="Manual Layer-1 signal insertion")
     add_signal.add_argument("--source", required=True)
     add_signal.add_argument("--title", required=True)
     add_signal.add_argument("--url", required=True)
-    add_signal.add_argument("--type", required=True, choices=["capability", "research", "governance", "market", "ecosystem"])
+    add_signal.add_argument("--type", required=True, choices=_SIGNAL_TYPES)
     add_signal.add_argument("--content")
     add_signal.add_argument("--priority-score", type=float)
 
+
+def _add_ingest_parser(subparsers: argparse._SubParsersAction) -> None:
     ingest = subparsers.add_parser("ingest", help="Run Layer 1 intake from source registry")
     ingest.add_argument("--sources", default="ingest/sources.yaml")
     ingest.add_argument("--since-days", type=int, default=7)
@@ -75,7 +170,7 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Optional dedupe index file path (default: <out_dir>/signals_index.json)",
     )
-    ingest.add_argument("--threshold", type=float, default=MIN_PRIORITY_THRESHOLD)
+    ingest.add_argument("--threshold", type=float, default=None, help="Default: ingest.normalize.MIN_PRIORITY_THRESHOLD")
     ingest.add_argument("--vault-root")
     ingest.add_argument(
         "--writeback-signals",
@@ -83,11 +178,15 @@ def build_parser() -> argparse.ArgumentParser:
         help="Write newly ingested signals as Obsidian notes under 95_Signals",
     )
 
+
+def _add_weekly_parser(subparsers: argparse._SubParsersAction) -> None:
     weekly = subparsers.add_parser("weekly", help="Generate Layer-2 weekly shortlist note")
     weekly.add_argument("--vault-root")
     weekly.add_argument("--week-id", default=None, help="Format: YYYY-Wxx")
     weekly.add_argument("--limit", type=int, default=10)
 
+
+def _add_action_parser(subparsers: argparse._SubParsersAction) -> None:
     action_parser = subparsers.add_parser("action")
     action_sub = action_parser.add_subparsers(dest="action_command", required=True)
     action_generate = action_sub.add_parser("generate")
@@ -95,6 +194,8 @@ def build_parser() -> argparse.ArgumentParser:
     action_generate.add_argument("--type", default="strategic_design", choices=["tech_prototype", "strategic_design", "content_creation", "task_tracking"])
     action_generate.add_argument("--signal-id")
 
+
+def _add_writeback_parser(subparsers: argparse._SubParsersAction) -> None:
     writeback_parser = subparsers.add_parser("writeback")
     writeback_sub = writeback_parser.add_subparsers(dest="writeback_command", required=True)
     writeback_apply = writeback_sub.add_parser("apply")
@@ -104,6 +205,8 @@ def build_parser() -> argparse.ArgumentParser:
     writeback_apply.add_argument("--publish-intent")
     writeback_apply.add_argument("--rti-intent")
 
+
+def _add_gate_parser(subparsers: argparse._SubParsersAction) -> None:
     gate_parser = subparsers.add_parser("gate")
     gate_sub = gate_parser.add_subparsers(dest="gate_command", required=True)
     gate_decide = gate_sub.add_parser("decide")
@@ -113,6 +216,8 @@ def build_parser() -> argparse.ArgumentParser:
     gate_decide.add_argument("--reason")
     gate_decide.add_argument("--next-actions", action="append", default=[])
 
+
+def _add_deepen_parser(subparsers: argparse._SubParsersAction) -> None:
     deepen_parser = subparsers.add_parser("deepen")
     deepen_sub = deepen_parser.add_subparsers(dest="deepen_command", required=True)
     deepen_run = deepen_sub.add_parser("run")
@@ -122,122 +227,298 @@ def build_parser() -> argparse.ArgumentParser:
     deepen_run.add_argument("--signal-id")
     deepen_run.add_argument("--vault-root")
 
+
+def _add_route_after_gate_parser(subparsers: argparse._SubParsersAction) -> None:
     route_gate = subparsers.add_parser("route-after-gate", help="Route L5 staging after L4 decision")
     route_gate.add_argument("--decision-id", required=True)
     route_gate.add_argument("--vault-dir", required=True)
 
+
+def _add_list_staged_parser(subparsers: argparse._SubParsersAction) -> None:
     list_staged_cmd = subparsers.add_parser("list-staged", help="List staged LTI/RTI artifacts")
     list_staged_cmd.add_argument("--type", required=True, choices=["lti", "rti"])
     list_staged_cmd.add_argument("--status", default=None, choices=["draft", "published", "rejected"])
 
+
+def _add_publish_lti_parser(subparsers: argparse._SubParsersAction) -> None:
     publish_lti_cmd = subparsers.add_parser("publish-lti", help="Publish an LTI draft")
     publish_lti_cmd.add_argument("--id", required=True)
     publish_lti_cmd.add_argument("--reviewer", required=True)
     publish_lti_cmd.add_argument("--notes", required=True)
     publish_lti_cmd.add_argument("--vault-dir", required=True)
 
+
+def _add_reject_lti_parser(subparsers: argparse._SubParsersAction) -> None:
     reject_lti_cmd = subparsers.add_parser("reject-lti", help="Reject an LTI draft")
     reject_lti_cmd.add_argument("--id", required=True)
     reject_lti_cmd.add_argument("--reviewer", required=True)
     reject_lti_cmd.add_argument("--reason", required=True)
     reject_lti_cmd.add_argument("--vault-dir", required=True)
 
+
+def _add_publish_rti_parser(subparsers: argparse._SubParsersAction) -> None:
     publish_rti_cmd = subparsers.add_parser("publish-rti", help="Publish an RTI proposal")
     publish_rti_cmd.add_argument("--id", required=True)
     publish_rti_cmd.add_argument("--reviewer", required=True)
     publish_rti_cmd.add_argument("--notes", required=True)
     publish_rti_cmd.add_argument("--vault-dir", required=True)
 
+
+def _add_reject_rti_parser(subparsers: argparse._SubParsersAction) -> None:
     reject_rti_cmd = subparsers.add_parser("reject-rti", help="Reject an RTI proposal")
     reject_rti_cmd.add_argument("--id", required=True)
     reject_rti_cmd.add_argument("--reviewer", required=True)
     reject_rti_cmd.add_argument("--reason", required=True)
     reject_rti_cmd.add_argument("--vault-dir", required=True)
 
+
+def _add_rule_of_three_parser(subparsers: argparse._SubParsersAction) -> None:
     rule_three = subparsers.add_parser("rule-of-three", help="Check Rule-of-Three and propose RTI")
     rule_three.add_argument("--pattern-id", required=True)
     rule_three.add_argument("--vault-dir", required=True)
 
+
+_COMMAND_BUILDERS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "signal": _add_signal_parser,
+    "add_signal": _add_add_signal_parser,
+    "ingest": _add_ingest_parser,
+    "weekly": _add_weekly_parser,
+    "action": _add_action_parser,
+    "writeback": _add_writeback_parser,
+    "gate": _add_gate_parser,
+    "deepen": _add_deepen_parser,
+    "route-after-gate": _add_route_after_gate_parser,
+    "list-staged": _add_list_staged_parser,
+    "publish-lti": _add_publish_lti_parser,
+    "reject-lti": _add_reject_lti_parser,
+    "publish-rti": _add_publish_rti_parser,
+    "reject-rti": _add_reject_rti_parser,
+    "rule-of-three": _add_rule_of_three_parser,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the top-level command in ``argv`` without parsing it, or None."""
+    args = iter(argv)
+    for token in args:
+        if token == "--data-dir":
+            next(args, None)
+            continue
+        if token.startswith("-"):
+            if token in ("-h", "--help"):
+                return None
+            continue
+        return token if token in _COMMAND_BUILDERS else None
+    return None
+
+
+# parse_args() does not mutate the parser, so one instance per command can be
+# reused by callers that invoke main() repeatedly (tests, driver scripts).
+@lru_cache(maxsize=None)
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser; with ``command``, only that subcommand's parser is added."""
+    parser = argparse.ArgumentParser(description="PM-OS orchestrator CLI")
+    parser.add_argument("--data-dir", default="orchestrator/data", help="Directory containing orchestrator JSONL files")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    builders = [_COMMAND_BUILDERS[command]] if command in _COMMAND_BUILDERS else _COMMAND_BUILDERS.values()
+    for build in builders:
+        build(subparsers)
     return parser
 
 
 def _run_ingest(args: argparse.Namespace) -> int:
+    _require("ingest.normalize", "ingest.registry", "ingest.store", "orchestrator.vault_ops")
+    threshold = MIN_PRIORITY_THRESHOLD if args.threshold is None else args.threshold
     now_utc = dt.datetime.now(tz=dt.timezone.utc)
     since_cutoff = now_utc - dt.timedelta(days=args.since_days)
+    out_path = Path(args.out)
+    dedupe_index_path = Path(args.index_path) if args.index_path else out_path.parent / "signals_index.json"
     source_cfgs = load_sources(args.sources)
 
-    signals = []
+    written_signals: list[SIGNAL] = []
+    skipped_dupes = 0
     failures: list[dict[str, str]] = []
     filtered_low_priority = 0
     sequence = 1
-
-    for source_cfg in source_cfgs:
+    # The same article often appears in several feeds; repeats of a URL within
+    # one run are dropped here so they are not schema-validated again.
+    run_urls: set[str] = set()
+    run_duplicates = 0
+
+    # One fetcher per source type; an unsupported type is resolved once and
+    # reported against each of its sources.
+    fetchers: dict[str, Any] = {}
+    fetcher_errors: dict[str, str] = {}
+    for source_type in dict.fromkeys(source_cfg.type for source_cfg in source_cfgs):
         try:
-            fetcher = get_fetcher(source_cfg.type)
-            items = fetcher.fetch(source_cfg, limit=args.limit_per_source)
+            fetchers[source_type] = get_fetcher(source_type)
         except Exception as exc:  # noqa: BLE001
-            failures.append({"source": source_cfg.id, "error": str(exc)})
-            continue
-
-        for item in items:
-            published_at = item.get("published_at")
-            if published_at and published_at < since_cutoff:
-                continue
-
-            signal = normalize_item_to_signal(source_cfg, item, seq_num=sequence, now_utc=now_utc)
-            sequence += 1
-
-            if signal.priority_score is not None and signal.priority_score < args.threshold:
-                filtered_low_priority += 1
+            fetcher_errors[source_type] = str(exc)
+
+    # Fetches are network-bound, so they run concurrently; results are consumed
+    # in source order so signal ids and failure order stay deterministic. Each
+    # source's accepted signals are appended as soon as it is processed.
+    with (
+        SignalAppender(out_path, index_path=dedupe_index_path) as appender,
+        ThreadPoolExecutor(max_workers=max(1, min(32, len(source_cfgs)))) as executor,
+    ):
+        pending = [
+            (
+                source_cfg,
+                None
+                if source_cfg.type in fetcher_errors
+                else executor.submit(fetchers[source_cfg.type].fetch, source_cfg, limit=args.limit_per_source),
+            )
+            for source_cfg in source_cfgs
+        ]
+        for source_cfg, future in pending:
+            if future is None:
+                failures.append({"source": source_cfg.id, "error": fetcher_errors[source_cfg.type]})
                 continue
-
             try:
-                validate_signal_contract(signal)
+                items = future.result()
             except Exception as exc:  # noqa: BLE001
-                failures.append({"source": source_cfg.id, "error": f"validation: {exc}"})
+                failures.append({"source": source_cfg.id, "error": str(exc)})
                 continue
-            signals.append(signal)
 
-    written_signals, skipped_dupes = append_signals_with_results(args.out, signals, index_path=args.index_path)
+            recent_items = [
+                item for item in items if not (item.get("published_at") and item["published_at"] < since_cutoff)
+            ]
+            outcomes = normalize_and_validate_items(
+                source_cfg,
+                recent_items,
+                start_seq=sequence,
+                now_utc=now_utc,
+                threshold=threshold,
+                seen_urls=run_urls,
+            )
+            sequence += len(outcomes)
+
+            accepted: list[SIGNAL] = []
+            for outcome in outcomes:
+                if outcome.reason == OK:
+                    accepted.append(outcome.signal)
+                elif outcome.reason == LOW_PRIORITY:
+                    filtered_low_priority += 1
+                elif outcome.reason == DUPLICATE:
+                    run_duplicates += 1
+                else:
+                    failures.append({"source": source_cfg.id, "error": f"validation: {outcome.error}"})
+
+            batch_written, batch_skipped = appender.append(accepted)
+            written_signals.extend(batch_written)
+            skipped_dupes += batch_skipped
+
+    skipped_dupes += run_duplicates
     written = len(written_signals)
-    dedupe_index_path = Path(args.index_path) if args.index_path else Path(args.out).parent / "signals_index.json"
 
     vault_paths: list[str] = []
     if args.writeback_signals:
         vault_root = resolve_vault_root(args.vault_root)
-        for signal in written_signals:
-            vault_paths.append(str(write_signal_markdown(vault_root, signal)))
+        vault_paths = [str(path) for path in write_signal_markdowns(vault_root, written_signals)]
 
     report = {
         "new_count": written,
         "skipped_duplicates": skipped_dupes,
         "filtered_low_priority": filtered_low_priority,
         "failed_count": len(failures),
-        "out": str(Path(args.out)),
+        "out": str(out_path),
         "index_path": str(dedupe_index_path),
         "failures": failures,
         "vault_written": len(vault_paths),
         "vault_paths": vault_paths[:10],
     }
-    print(json.dumps(report))
+    _emit_json(report)
 
     return 0
 
 
+_MIN_TIMESTAMP = dt.datetime.min.replace(tzinfo=dt.timezone.utc)
+
+
+def _weekly_rank_key(row: dict[str, Any]) -> tuple[float, dt.datetime]:
+    timestamp = row.get("timestamp")
+    if isinstance(timestamp, str):
+        parsed = _parse_iso_datetime(timestamp.replace("Z", "+00:00"))
+    else:
+        parsed = _MIN_TIMESTAMP
+    return (row.get("priority_score") or 0.0, parsed)
+
+
 def _run_weekly_review(args: argparse.Namespace, orchestrator: Orchestrator) -> int:
+    _require("pm_os_contracts.models", "orchestrator.vault_ops")
     week_id = args.week_id or current_week_id()
     vault_root = resolve_vault_root(args.vault_root)
-    rows = [SIGNAL.from_dict(row) for row in orchestrator.signals.read_all()]
-    rows.sort(key=lambda item: (item.priority_score or 0.0, item.timestamp), reverse=True)
-    path = write_weekly_review_from_signals(vault_root, week_id, rows[: args.limit], limit=args.limit)
-    print(json.dumps({"week_id": week_id, "written_path": str(path)}))
+    # Rank the raw rows and only build SIGNAL models for the ones that are kept.
+    top_rows = heapq.nlargest(args.limit, orchestrator.signals.iter_rows(), key=_weekly_rank_key)
+    rows = [SIGNAL.from_dict(row) for row in top_rows]
+    path = write_weekly_review_from_signals(vault_root, week_id, rows, limit=args.limit)
+    _emit_json({"week_id": week_id, "written_path": str(path)})
     return 0
 
 
+_L5_COMMANDS = frozenset(
+    {"route-after-gate", "list-staged", "publish-lti", "reject-lti", "publish-rti", "reject-rti", "rule-of-three"}
+)
+
+
+def _run_l5_command(args: argparse.Namespace) -> int:
+    _require("orchestrator.l5_routing_guard")
+
+    if args.command == "route-after-gate":
+        created = route_after_gate_decision(args.decision_id, Path(args.data_dir), Path(args.vault_dir))
+        _emit_json({"ok": True, "created": created, "skipped": [], "errors": []})
+        return 0
+
+    if args.command == "list-staged":
+        rows = list_staged(Path(args.data_dir), artifact_type=args.type, status=args.status)
+        _emit_json({"ok": True, "items": rows})
+        return 0
+
+    if args.command == "publish-lti":
+        path = publish_lti_draft(args.id, Path(args.vault_dir), Path(args.data_dir), args.reviewer, args.notes)
+        _emit_json({"ok": True, "published": args.id, "path": path})
+        return 0
+
+    if args.command == "reject-lti":
+        reject_lti_draft(args.id, Path(args.data_dir), Path(args.vault_dir), args.reviewer, args.reason)
+        _emit_json({"ok": True, "rejected": args.id})
+        return 0
+
+    if args.command == "publish-rti":
+        path = publish_rti_proposal(args.id, Path(args.vault_dir), Path(args.data_dir), args.reviewer, args.notes)
+        _emit_json({"ok": True, "published": args.id, "path": path})
+        return 0
+
+    if args.command == "reject-rti":
+        reject_rti_proposal(args.id, Path(args.vault_dir), Path(args.data_dir), args.reviewer, args.reason)
+        _emit_json({"ok": True, "rejected": args.id})
+        return 0
+
+    if args.command == "rule-of-three":
+        proposal_id = check_rule_of_three_and_propose_rti(args.pattern_id, Path(args.data_dir), Path(args.vault_dir))
+        _emit_json({"ok": True, "proposal_id": proposal_id})
+        return 0
+
+    raise ValueError(f"Unknown L5 command: {args.command}")
+
+
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    # Only the invoked subcommand's parser is built; unknown commands and
+    # top-level --help fall back to the full parser.
+    parser = build_parser(_sniff_subcommand(argv))
     args = parser.parse_args(argv)
 
+    if args.command == "ingest":
+        return _run_ingest(args)
+
+    if args.command in _L5_COMMANDS:
+        return _run_l5_command(args)
+
+    _require("orchestrator.workflow")
     orchestrator = Orchestrator(data_dir=Path(args.data_dir))
 
     if args.command == "add_signal":
@@ -251,12 +532,9 @@ def main(argv: list[str] | None = None) -> int:
             impact_area=None,
             timestamp=dt.datetime.now(tz=dt.timezone.utc),
         )
-        print(signal.to_json())
+        _emit(signal.to_json_bytes())
         return 0
 
-    if args.command == "ingest":
-        return _run_ingest(args)
-
     if args.command == "weekly":
         return _run_weekly_review(args, orchestrator)
 
@@ -272,17 +550,16 @@ def main(argv: list[str] | None = None) -> int:
             impact_area=args.impact_area,
             timestamp=timestamp,
         )
-        print(signal.to_json())
+        _emit(signal.to_json_bytes())
         return 0
 
     if args.command == "signal" and args.signal_command == "top":
-        top = [s.to_dict() for s in orchestrator.top_signals(args.limit)]
-        print(json.dumps(top))
+        _emit_json([s.to_dict() for s in orchestrator.top_signals(args.limit)])
         return 0
 
     if args.command == "action" and args.action_command == "generate":
         task = orchestrator.generate_action(goal=args.goal, action_type=args.type, signal_id=args.signal_id)
-        print(task.to_json())
+        _emit(task.to_json_bytes())
         return 0
 
     if args.command == "writeback" and args.writeback_command == "apply":
@@ -293,7 +570,7 @@ def main(argv: list[str] | None = None) -> int:
             publish_intent=args.publish_intent,
             rti_intent=args.rti_intent,
         )
-        print(json.dumps(payload))
+        _emit_json(payload)
         return 0
 
     if args.command == "gate" and args.gate_command == "decide":
@@ -312,7 +589,7 @@ def main(argv: list[str] | None = None) -> int:
                     decision_reason=payload["reason"],
                 )
             )
-        print(json.dumps(payload))
+        _emit_json(payload)
         return 0
 
     if args.command == "deepen" and args.deepen_command == "run":
@@ -323,42 +600,7 @@ def main(argv: list[str] | None = None) -> int:
             signal_id=args.signal_id,
             vault_root=args.vault_root,
         )
-        print(json.dumps(payload))
-        return 0
-
-    if args.command == "route-after-gate":
-        created = route_after_gate_decision(args.decision_id, Path(args.data_dir), Path(args.vault_dir))
-        print(json.dumps({"ok": True, "created": created, "skipped": [], "errors": []}))
-        return 0
-
-    if args.command == "list-staged":
-        rows = list_staged(Path(args.data_dir), artifact_type=args.type, status=args.status)
-        print(json.dumps({"ok": True, "items": rows}))
-        return 0
-
-    if args.command == "publish-lti":
-        path = publish_lti_draft(args.id, Path(args.vault_dir), Path(args.data_dir), args.reviewer, args.notes)
-        print(json.dumps({"ok": True, "published": args.id, "path": path}))
-        return 0
-
-    if args.command == "reject-lti":
-        reject_lti_draft(args.id, Path(args.data_dir), Path(args.vault_dir), args.reviewer, args.reason)
-        print(json.dumps({"ok": True, "rejected": args.id}))
-        return 0
-
-    if args.command == "publish-rti":
-        path = publish_rti_proposal(args.id, Path(args.vault_dir), Path(args.data_dir), args.reviewer, args.notes)
-        print(json.dumps({"ok": True, "published": args.id, "path": path}))
-        return 0
-
-    if args.command == "reject-rti":
-        reject_rti_proposal(args.id, Path(args.vault_dir), Path(args.data_dir), args.reviewer, args.reason)
-        print(json.dumps({"ok": True, "rejected": args.id}))
-        return 0
-
-    if args.command == "rule-of-three":
-        proposal_id = check_rule_of_three_and_propose_rti(args.pattern_id, Path(args.data_dir), Path(args.vault_dir))
-        print(json.dumps({"ok": True, "proposal_id": proposal_id}))
+        _emit_json(payload)
         return 0
 
     parser.error("Unknown command")
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+
+@dataclass(frozen=True)
+class L4Decision:
+    decision_id: str
+    decision_type: str | None
+    signal_id: str | None
+    revision_of: str | None
+
+
+def read_frontmatter(path: Path) -> Mapping[str, str]:
+    """Return a note's frontmatter, reusing the last parse while the file is unchanged."""
+    stat = path.stat()
+    return _read_frontmatter_cached(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _read_frontmatter_cached(path: str, mtime_ns: int, size: int) -> Mapping[str, str]:
+    # Size is part of the key because mtimes are coarse; the proxy keeps the
+    # shared cached dict read-only.
+    return MappingProxyType(_read_frontmatter(Path(path)))
+
+
+def _read_frontmatter(path: Path) -> dict[str, str]:
+    # Frontmatter sits at the top of the file; stop reading at its closing fence.
+    data: dict[str, str] = {}
+    with path.open(encoding="utf-8") as handle:
+        if handle.readline().strip() != "---":
+            return {}
+        for line in handle:
+            if line.strip() == "---":
+                break
+            if ":" not in line:
+                continue
+            key, value = line.split(":", 1)
+            data[key.strip()] = value.strip()
+    return data
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-import json
+import logging
 import os
-import re
-from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import Any, Iterable
 
-from orchestrator.storage import JSONLStorage
+from orchestrator.decisions import L4Decision, read_frontmatter
+from orchestrator.storage import JournaledSnapshot, JSONLStorage, read_json, write_atomic
 
 L5_DATA_DIRNAME = "test_data"
 LTI_DRAFTS_JSONL = "lti_drafts.jsonl"
@@ -24,13 +22,66 @@ LTI_FINAL_DIR = Path("02_LTI")
 
 DECISION_DIRS = [Path("97_Decisions"), Path("97_Gate_Decisions")]
 
+_log = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
-class L4Decision:
-    decision_id: str
-    decision_type: str
-    signal_id: str | None
-    revision_of: str | None
+# Staged note bodies; only the {placeholders} vary between renders.
+_LTI_DRAFT_TEMPLATE = """\
+---
+id: {draft_id}
+type: lti_draft
+status: draft
+created_at: {now}
+source_signal_id: {signal_id}
+source_decision_id: {decision_id}
+review_required: true
+tags: []
+---
+
+# {title}
+
+## Why it matters (Outcome framing)
+{summary}
+
+## Evidence
+-
+
+## Decision Trace
+- decision_id: {decision_id}
+
+## Draft to Publish Checklist (human)
+- [ ] Evidence verified
+- [ ] Claims checked
+- [ ] OK to publish
+
+## Notes
+"""
+
+_RTI_PROPOSAL_TEMPLATE = """\
+---
+id: {proposal_id}
+type: rti_proposal
+status: draft
+pattern_id: {pattern_id}
+created_at: {now}
+review_required: true
+---
+
+# Proposed RTI Revision
+
+## Pattern Evidence (COS cases)
+{support_lines}
+
+## Proposed Theory Change
+
+## Risks / Tradeoffs
+
+## Rollback Plan
+
+## Review Checklist
+- [ ] Evidence reviewed
+- [ ] Risks assessed
+- [ ] Ready to publish
+"""
 
 
 def route_after_gate_decision(decision_id: str, data_dir: Path, vault_dir: Path) -> list[dict[str, Any]]:
@@ -42,7 +93,7 @@ def route_after_gate_decision(decision_id: str, data_dir: Path, vault_dir: Path)
     decision = _parse_decision(decision_path)
     if decision.decision_type == "ACCEPT":
         if not decision.signal_id:
-            _log_error(f"[L5] missing signal_id in decision {decision.decision_id}")
+            _log.error("[L5] missing signal_id in decision %s", decision.decision_id)
             return [{"error": "missing signal_id"}]
         draft = _ensure_lti_draft(decision, data_dir, vault_dir)
         if draft:
@@ -65,13 +116,13 @@ def check_rule_of_three_and_propose_rti(
         cos_index_path = data_dir / "cos_index.json"
         if not cos_index_path.exists():
             return None
-        cos_index = json.loads(cos_index_path.read_text(encoding="utf-8"))
+        cos_index = read_json(cos_index_path)
     matches = [entry for entry in cos_index if entry.get("pattern_key") == pattern_id]
     if len(matches) < 3:
         return None
 
     proposals_store = _rti_store(data_dir)
-    existing = _find_recent_rti_proposal(pattern_id, proposals_store.read_all())
+    existing = _find_recent_rti_proposal(pattern_id, proposals_store.iter_rows())
     if existing:
         return existing["id"]
 
@@ -80,52 +131,68 @@ def check_rule_of_three_and_propose_rti(
 
 
 def publish_lti_draft(draft_id: str, vault_dir: Path, data_dir: Path, reviewer: str, review_notes: str) -> str:
-    drafts_store = _lti_store(data_dir)
-    drafts = drafts_store.read_all()
-    draft = _find_by_id(drafts, draft_id)
-    if not draft:
-        raise ValueError(f"Draft not found: {draft_id}")
-    if draft["status"] == "published":
-        return draft["final_vault_path"]
-
-    source = vault_dir / draft["vault_path"]
-    final_name = _final_lti_name(draft_id)
-    target = vault_dir / LTI_FINAL_DIR / final_name
-    _move_with_frontmatter_update(
-        source=source,
-        target=target,
-        updates={
-            "status": "published",
-            "published_at": _utc_now(),
-            "reviewer": reviewer,
-            "review_notes": review_notes,
-        },
-    )
+    return publish_lti_drafts([draft_id], vault_dir, data_dir, reviewer, review_notes)[0]
 
-    draft["status"] = "published"
-    draft["published_at"] = _utc_now()
-    draft["updated_at"] = _utc_now()
-    draft["final_vault_path"] = str(target.relative_to(vault_dir).as_posix())
-    draft.setdefault("governance", {})
-    draft["governance"]["reviewer"] = reviewer
-    draft["governance"]["review_notes"] = review_notes
-    drafts_store.rewrite_all(drafts)
 
-    _write_index(LTI_INDEX_JSON, drafts, data_dir, ["id", "status", "created_at", "vault_path", "source_signal_id", "source_decision_id"])
-    return draft["final_vault_path"]
+def publish_lti_drafts(draft_ids: list[str], vault_dir: Path, data_dir: Path, reviewer: str, review_notes: str) -> list[str]:
+    """Publish several drafts with one read and one rewrite of the drafts store."""
+    drafts_store = _lti_store(data_dir)
+    drafts, drafts_by_id = drafts_store.read_indexed()
+    selected = []
+    for draft_id in draft_ids:
+        draft = drafts_by_id.get(draft_id)
+        if not draft:
+            raise ValueError(f"Draft not found: {draft_id}")
+        selected.append(draft)
+
+    now = _utc_now()
+    published = 0
+    try:
+        for draft in selected:
+            if draft["status"] == "published":
+                continue
+            source = vault_dir / draft["vault_path"]
+            final_name = _final_lti_name(draft["id"])
+            target = vault_dir / LTI_FINAL_DIR / final_name
+            _move_with_frontmatter_update(
+                source=source,
+                target=target,
+                updates={
+                    "status": "published",
+                    "published_at": now,
+                    "reviewer": reviewer,
+                    "review_notes": review_notes,
+                },
+            )
+
+            draft["status"] = "published"
+            draft["published_at"] = now
+            draft["updated_at"] = now
+            draft["final_vault_path"] = _rel_posix(target, vault_dir)
+            draft.setdefault("governance", {})
+            draft["governance"]["reviewer"] = reviewer
+            draft["governance"]["review_notes"] = review_notes
+            published += 1
+    finally:
+        # Drafts moved before a failure are still recorded as published.
+        if published:
+            drafts_store.rewrite_all(drafts)
+            _write_index(LTI_INDEX_JSON, drafts, data_dir, ["id", "status", "created_at", "vault_path", "source_signal_id", "source_decision_id"])
+    return [draft["final_vault_path"] for draft in selected]
 
 
 def reject_lti_draft(draft_id: str, data_dir: Path, vault_dir: Path, reviewer: str, reason: str) -> None:
     drafts_store = _lti_store(data_dir)
-    drafts = drafts_store.read_all()
-    draft = _find_by_id(drafts, draft_id)
+    drafts, drafts_by_id = drafts_store.read_indexed()
+    draft = drafts_by_id.get(draft_id)
     if not draft:
         raise ValueError(f"Draft not found: {draft_id}")
     if draft["status"] == "rejected":
         return
+    now = _utc_now()
     draft["status"] = "rejected"
-    draft["rejected_at"] = _utc_now()
-    draft["updated_at"] = _utc_now()
+    draft["rejected_at"] = now
+    draft["updated_at"] = now
     draft.setdefault("governance", {})
     draft["governance"]["reviewer"] = reviewer
     draft["governance"]["review_notes"] = reason
@@ -135,7 +202,7 @@ def reject_lti_draft(draft_id: str, data_dir: Path, vault_dir: Path, reviewer: s
         draft_path,
         {
             "status": "rejected",
-            "rejected_at": _utc_now(),
+            "rejected_at": now,
             "reviewer": reviewer,
             "review_notes": reason,
         },
@@ -145,49 +212,68 @@ def reject_lti_draft(draft_id: str, data_dir: Path, vault_dir: Path, reviewer: s
 
 
 def publish_rti_proposal(proposal_id: str, vault_dir: Path, data_dir: Path, reviewer: str, review_notes: str) -> str:
+    return publish_rti_proposals([proposal_id], vault_dir, data_dir, reviewer, review_notes)[0]
+
+
+def publish_rti_proposals(
+    proposal_ids: list[str], vault_dir: Path, data_dir: Path, reviewer: str, review_notes: str
+) -> list[str]:
+    """Publish several proposals with one read and one rewrite of the proposals store."""
     store = _rti_store(data_dir)
-    proposals = store.read_all()
-    proposal = _find_by_id(proposals, proposal_id)
-    if not proposal:
-        raise ValueError(f"Proposal not found: {proposal_id}")
-    if proposal["status"] == "published":
-        return proposal["final_vault_path"]
-
-    source = vault_dir / proposal["vault_path"]
-    target = vault_dir / RTI_FINAL_DIR / _final_rti_name(proposal_id)
-    _move_with_frontmatter_update(
-        source=source,
-        target=target,
-        updates={
-            "status": "published",
-            "published_at": _utc_now(),
-            "reviewer": reviewer,
-            "review_notes": review_notes,
-        },
-    )
+    proposals, proposals_by_id = store.read_indexed()
+    selected = []
+    for proposal_id in proposal_ids:
+        proposal = proposals_by_id.get(proposal_id)
+        if not proposal:
+            raise ValueError(f"Proposal not found: {proposal_id}")
+        selected.append(proposal)
 
-    proposal["status"] = "published"
-    proposal["published_at"] = _utc_now()
-    proposal["updated_at"] = _utc_now()
-    proposal["final_vault_path"] = str(target.relative_to(vault_dir).as_posix())
-    proposal["reviewer"] = reviewer
-    proposal["review_notes"] = review_notes
-    store.rewrite_all(proposals)
-    _write_index(RTI_INDEX_JSON, proposals, data_dir, ["id", "status", "created_at", "vault_path", "pattern_id"])
-    return proposal["final_vault_path"]
+    now = _utc_now()
+    published = 0
+    try:
+        for proposal in selected:
+            if proposal["status"] == "published":
+                continue
+            source = vault_dir / proposal["vault_path"]
+            target = vault_dir / RTI_FINAL_DIR / _final_rti_name(proposal["id"])
+            _move_with_frontmatter_update(
+                source=source,
+                target=target,
+                updates={
+                    "status": "published",
+                    "published_at": now,
+                    "reviewer": reviewer,
+                    "review_notes": review_notes,
+                },
+            )
+
+            proposal["status"] = "published"
+            proposal["published_at"] = now
+            proposal["updated_at"] = now
+            proposal["final_vault_path"] = _rel_posix(target, vault_dir)
+            proposal["reviewer"] = reviewer
+            proposal["review_notes"] = review_notes
+            published += 1
+    finally:
+        # Proposals moved before a failure are still recorded as published.
+        if published:
+            store.rewrite_all(proposals)
+            _write_index(RTI_INDEX_JSON, proposals, data_dir, ["id", "status", "created_at", "vault_path", "pattern_id"])
+    return [proposal["final_vault_path"] for proposal in selected]
 
 
 def reject_rti_proposal(proposal_id: str, data_dir: Path, vault_dir: Path, reviewer: str, reason: str) -> None:
     store = _rti_store(data_dir)
-    proposals = store.read_all()
-    proposal = _find_by_id(proposals, proposal_id)
+    proposals, proposals_by_id = store.read_indexed()
+    proposal = proposals_by_id.get(proposal_id)
     if not proposal:
         raise ValueError(f"Proposal not found: {proposal_id}")
     if proposal["status"] == "rejected":
         return
+    now = _utc_now()
     proposal["status"] = "rejected"
-    proposal["rejected_at"] = _utc_now()
-    proposal["updated_at"] = _utc_now()
+    proposal["rejected_at"] = now
+    proposal["updated_at"] = now
     proposal["reviewer"] = reviewer
     proposal["review_notes"] = reason
 
@@ -196,7 +282,7 @@ def reject_rti_proposal(proposal_id: str, data_dir: Path, vault_dir: Path, revie
         proposal_path,
         {
             "status": "rejected",
-            "rejected_at": _utc_now(),
+            "rejected_at": now,
             "reviewer": reviewer,
             "review_notes": reason,
         },
@@ -232,7 +318,7 @@ def _ensure_lti_draft(decision: L4Decision, data_dir: Path, vault_dir: Path) ->
     summary = (signal_payload.get("content") if signal_payload else "") or f"Draft created from decision {decision.decision_id}."
 
     evidence_refs = _build_evidence_refs(signal_payload)
-    _write_atomic(draft_path, _render_lti_draft_markdown(draft_id, decision, title, summary, now))
+    write_atomic(draft_path, _render_lti_draft_markdown(draft_id, decision, title, summary, now))
 
     record = {
         "id": draft_id,
@@ -242,7 +328,7 @@ def _ensure_lti_draft(decision: L4Decision, data_dir: Path, vault_dir: Path) ->
         "status": "draft",
         "created_at": now,
         "updated_at": now,
-        "vault_path": str(draft_path.relative_to(vault_dir).as_posix()),
+        "vault_path": _rel_posix(draft_path, vault_dir),
         "final_vault_path": None,
         "title": title or "",
         "summary": summary or "",
@@ -250,9 +336,10 @@ def _ensure_lti_draft(decision: L4Decision, data_dir: Path, vault_dir: Path) ->
         "evidence_refs": evidence_refs,
         "governance": {"reviewer": None, "review_notes": None},
     }
+    # New records are appended; only publish/reject rewrite existing rows.
+    drafts_store.append(record)
     drafts.append(record)
-    drafts_store.rewrite_all(drafts)
-    _write_index(LTI_INDEX_JSON, drafts, data_dir, ["id", "status", "created_at", "vault_path", "source_signal_id", "source_decision_id"])
+    _append_index(LTI_INDEX_JSON, drafts, data_dir, ["id", "status", "created_at", "vault_path", "source_signal_id", "source_decision_id"])
     return record
 
 
@@ -270,7 +357,7 @@ def _create_rti_proposal(
     proposal_id, proposal_path = _reserve_unique_path("RTI-PROP", now, proposals, vault_dir / RTI_PROPOSALS_DIR)
     supporting_ids = [entry.get("cos_id") for entry in matches if entry.get("cos_id")]
 
-    _write_atomic(
+    write_atomic(
         proposal_path,
         _render_rti_proposal_markdown(proposal_id, pattern_id, supporting_ids, now),
     )
@@ -285,7 +372,7 @@ def _create_rti_proposal(
         "updated_at": now,
         "published_at": None,
         "rejected_at": None,
-        "vault_path": str(proposal_path.relative_to(vault_dir).as_posix()),
+        "vault_path": _rel_posix(proposal_path, vault_dir),
         "final_vault_path": None,
         "hypothesis_update": "Pending review.",
         "proposed_change": "Pending review.",
@@ -293,13 +380,13 @@ def _create_rti_proposal(
         "reviewer": None,
         "review_notes": None,
     }
+    store.append(record)
     proposals.append(record)
-    store.rewrite_all(proposals)
-    _write_index(RTI_INDEX_JSON, proposals, data_dir, ["id", "status", "created_at", "vault_path", "pattern_id"])
+    _append_index(RTI_INDEX_JSON, proposals, data_dir, ["id", "status", "created_at", "vault_path", "pattern_id"])
     return record
 
 
-def _find_recent_rti_proposal(pattern_id: str, proposals: list[dict[str, Any]]) -> dict[str, Any] | None:
+def _find_recent_rti_proposal(pattern_id: str, proposals: Iterable[dict[str, Any]]) -> dict[str, Any] | None:
     cutoff = datetime.now(tz=timezone.utc) - timedelta(days=90)
     for proposal in proposals:
         if proposal.get("pattern_id") != pattern_id:
@@ -340,7 +427,7 @@ def _resolve_decision_path(decision_id: str, vault_dir: Path) -> Path | None:
 
 
 def _parse_decision(decision_path: Path) -> L4Decision:
-    frontmatter = _read_frontmatter(decision_path)
+    frontmatter = read_frontmatter(decision_path)
     decision_type = (frontmatter.get("decision_type") or frontmatter.get("decision") or "").strip()
     if decision_type.lower() in {"approved", "approve"}:
         decision_type = "ACCEPT"
@@ -357,87 +444,23 @@ def _parse_decision(decision_path: Path) -> L4Decision:
     )
 
 
-def _read_frontmatter(path: Path) -> dict[str, str]:
-    lines = path.read_text(encoding="utf-8").splitlines()
-    if not lines or lines[0].strip() != "---":
-        return {}
-    data: dict[str, str] = {}
-    for line in lines[1:]:
-        if line.strip() == "---":
-            break
-        if ":" not in line:
-            continue
-        key, value = line.split(":", 1)
-        data[key.strip()] = value.strip()
-    return data
-
-
 def _render_lti_draft_markdown(draft_id: str, decision: L4Decision, title: str | None, summary: str | None, now: str) -> str:
-    return "\n".join(
-        [
-            "---",
-            f"id: {draft_id}",
-            "type: lti_draft",
-            "status: draft",
-            f"created_at: {now}",
-            f"source_signal_id: {decision.signal_id or ''}",
-            f"source_decision_id: {decision.decision_id}",
-            "review_required: true",
-            "tags: []",
-            "---",
-            "",
-            f"# {title or draft_id}",
-            "",
-            "## Why it matters (Outcome framing)",
-            summary or "",
-            "",
-            "## Evidence",
-            "-",
-            "",
-            "## Decision Trace",
-            f"- decision_id: {decision.decision_id}",
-            "",
-            "## Draft to Publish Checklist (human)",
-            "- [ ] Evidence verified",
-            "- [ ] Claims checked",
-            "- [ ] OK to publish",
-            "",
-            "## Notes",
-            "",
-        ]
+    return _LTI_DRAFT_TEMPLATE.format_map(
+        {
+            "draft_id": draft_id,
+            "now": now,
+            "signal_id": decision.signal_id or "",
+            "decision_id": decision.decision_id,
+            "title": title or draft_id,
+            "summary": summary or "",
+        }
     )
 
 
 def _render_rti_proposal_markdown(proposal_id: str, pattern_id: str, supporting_ids: Iterable[str], now: str) -> str:
     support_lines = "\n".join(f"- {item}" for item in supporting_ids) or "- None"
-    return "\n".join(
-        [
-            "---",
-            f"id: {proposal_id}",
-            "type: rti_proposal",
-            "status: draft",
-            f"pattern_id: {pattern_id}",
-            f"created_at: {now}",
-            "review_required: true",
-            "---",
-            "",
-            "# Proposed RTI Revision",
-            "",
-            "## Pattern Evidence (COS cases)",
-            support_lines,
-            "",
-            "## Proposed Theory Change",
-            "",
-            "## Risks / Tradeoffs",
-            "",
-            "## Rollback Plan",
-            "",
-            "## Review Checklist",
-            "- [ ] Evidence reviewed",
-            "- [ ] Risks assessed",
-            "- [ ] Ready to publish",
-            "",
-        ]
+    return _RTI_PROPOSAL_TEMPLATE.format_map(
+        {"proposal_id": proposal_id, "pattern_id": pattern_id, "now": now, "support_lines": support_lines}
     )
 
 
@@ -455,19 +478,29 @@ def _data_root(data_dir: Path) -> Path:
     return root
 
 
+def _index_store(index_name: str, data_dir: Path) -> JournaledSnapshot:
+    return JournaledSnapshot(_data_root(data_dir) / index_name)
+
+
 def _write_index(index_name: str, rows: list[dict[str, Any]], data_dir: Path, fields: list[str]) -> None:
-    payload = [
-        {key: row.get(key) for key in fields}
-        for row in rows
-    ]
-    path = _data_root(data_dir) / index_name
-    _write_atomic(path, json.dumps(payload, indent=2))
+    _index_store(index_name, data_dir).write(_index_entries(rows, fields))
+
+
+def _append_index(index_name: str, rows: list[dict[str, Any]], data_dir: Path, fields: list[str]) -> None:
+    # rows[-1] was just appended to its store, so only its entry is journaled.
+    # Rows that change in place go through _write_index instead.
+    _index_store(index_name, data_dir).append(_index_entries(rows[-1:], fields), lambda: _index_entries(rows, fields))
+
+
+def _index_entries(rows: list[dict[str, Any]], fields: list[str]) -> list[dict[str, Any]]:
+    return [{key: row.get(key) for key in fields} for row in rows]
 
 
 def _find_signal(signals_path: Path, signal_id: str | None) -> dict[str, Any]:
     if not signal_id or not signals_path.exists():
         return {}
-    return next((row for row in JSONLStorage(signals_path).read_all() if row.get("id") == signal_id), {})
+    # Stops reading at the first match instead of parsing the whole file.
+    return next((row for row in JSONLStorage(signals_path).iter_rows() if row.get("id") == signal_id), {})
 
 
 def _build_evidence_refs(signal: dict[str, Any]) -> list[dict[str, str]]:
@@ -478,23 +511,31 @@ def _build_evidence_refs(signal: dict[str, Any]) -> list[dict[str, str]]:
     return [{"kind": kind, "ref": url}]
 
 
-def _next_id(prefix: str, now_iso: str, rows: list[dict[str, Any]], *, offset: int = 0) -> str:
-    date_key = now_iso.split("T")[0].replace("-", "")
-    matching = [row for row in rows if str(row.get("id", "")).startswith(f"{prefix}-{date_key}-")]
-    return f"{prefix}-{date_key}-{len(matching) + 1 + offset:03d}"
+def _next_sequence(prefix: str, now_iso: str, rows: list[dict[str, Any]]) -> tuple[str, int]:
+    """Return the "<prefix>-<YYYYMMDD>-" id stem for ``now_iso`` and the next sequence number."""
+    stem = f"{prefix}-{now_iso.split('T')[0].replace('-', '')}-"
+    matching = sum(1 for row in rows if str(row.get("id", "")).startswith(stem))
+    return stem, matching + 1
 
 
 def _reserve_unique_path(prefix: str, now_iso: str, rows: list[dict[str, Any]], base_dir: Path) -> tuple[str, Path]:
+    # Rows are counted once; the retry only tries the following number.
+    stem, sequence = _next_sequence(prefix, now_iso, rows)
     for offset in range(2):
-        candidate_id = _next_id(prefix, now_iso, rows, offset=offset)
+        candidate_id = f"{stem}{sequence + offset:03d}"
         candidate_path = base_dir / f"{candidate_id}.md"
         if not candidate_path.exists():
             return candidate_id, candidate_path
     raise FileExistsError(f"{prefix} path collision after retry in {base_dir}")
 
 
-def _find_by_id(rows: list[dict[str, Any]], target_id: str) -> dict[str, Any] | None:
-    return next((row for row in rows if row.get("id") == target_id), None)
+def _rel_posix(target: Path, vault_dir: Path) -> str:
+    # Targets are built as vault_dir / ..., so the relative path is the tail of
+    # the string; relative_to() walks path parts and only handles the rest.
+    root, path = str(vault_dir), str(target)
+    if path.startswith(root + os.sep):
+        return path[len(root) + 1 :].replace(os.sep, "/")
+    return target.relative_to(vault_dir).as_posix()
 
 
 def _final_lti_name(draft_id: str) -> str:
@@ -510,14 +551,14 @@ def _final_rti_name(proposal_id: str) -> str:
 def _move_with_frontmatter_update(*, source: Path, target: Path, updates: dict[str, str]) -> None:
     content = source.read_text(encoding="utf-8")
     updated = _apply_frontmatter_updates(content, updates)
-    _write_atomic(target, updated)
+    write_atomic(target, updated)
     source.unlink(missing_ok=True)
 
 
 def _update_frontmatter(path: Path, updates: dict[str, str]) -> None:
     content = path.read_text(encoding="utf-8")
     updated = _apply_frontmatter_updates(content, updates)
-    _write_atomic(path, updated)
+    write_atomic(path, updated)
 
 
 def _apply_frontmatter_updates(content: str, updates: dict[str, str]) -> str:
@@ -529,28 +570,21 @@ def _apply_frontmatter_updates(content: str, updates: dict[str, str]) -> str:
         return content
     frontmatter = content[4:end_idx]
     body = content[end_idx + 5 :]
-    for key, value in updates.items():
-        pattern = re.compile(rf"^{re.escape(key)}:\s*.*$", flags=re.MULTILINE)
-        line = f"{key}: {value}"
-        if pattern.search(frontmatter):
-            frontmatter = pattern.sub(line, frontmatter)
-        else:
-            frontmatter += f"\n{line}"
+    # One pass over the lines; a line belongs to ``key`` when it starts with "key:".
+    lines = frontmatter.split("\n")
+    seen: set[str] = set()
+    for i, line in enumerate(lines):
+        key, sep, _ = line.partition(":")
+        if sep and key in updates:
+            lines[i] = f"{key}: {updates[key]}"
+            seen.add(key)
+    lines.extend(f"{key}: {value}" for key, value in updates.items() if key not in seen)
+    frontmatter = "\n".join(lines)
     return f"---\n{frontmatter}\n---\n{body}"
 
 
-def _write_atomic(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with NamedTemporaryFile(mode="w", encoding="utf-8", dir=path.parent, delete=False) as tmp:
-        tmp.write(content)
-        tmp.flush()
-        os.fsync(tmp.fileno())
-        tmp_name = tmp.name
-    os.replace(tmp_name, path)
-
-
 def _utc_now() -> str:
-    return datetime.now(tz=timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _parse_datetime(value: Any) -> datetime | None:
@@ -561,6 +595,3 @@ def _parse_datetime(value: Any) -> datetime | None:
     except ValueError:
         return None
 
-
-def _log_error(message: str) -> None:
-    print(message)
@@ -1,26 +1,25 @@
 from __future__ import annotations
 
+import logging
 import os
 import re
-from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import Any
 
+from orchestrator.decisions import L4Decision, read_frontmatter
+from orchestrator.storage import write_atomic
 from orchestrator.vault_ops import RTI_PROPOSALS_DIR
 
 DECISION_DIR_NAME = "97_Decisions"
 DECISION_FILENAME_PATTERN = re.compile(r"^DEC-\d{4}-W\d{2}-\d{3}\.md$")
 PROPOSAL_FILENAME_TEMPLATE = "RTI-PROP-{signal_id}-v{version}.md"
 
+_log = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
-class L4Decision:
-    decision_type: str | None
-    signal_id: str | None
-    revision_of: str | None
-    decision_id: str
+# Highest version per signal id for each proposals directory, keyed on the
+# directory's st_mtime_ns so it is only re-listed after files come or go.
+_VERSION_CACHE: dict[str, tuple[int, dict[str, int]]] = {}
 
 
 def should_generate_rti(decision: L4Decision) -> bool:
@@ -28,23 +27,48 @@ def should_generate_rti(decision: L4Decision) -> bool:
 
 
 def compute_next_version(signal_id: str, proposals_dir: Path) -> int:
-    if not proposals_dir.exists():
+    try:
+        dir_mtime = proposals_dir.stat().st_mtime_ns
+    except FileNotFoundError:
         return 1
-
-    escaped = re.escape(signal_id)
-    pattern = re.compile(rf"^RTI-PROP-{escaped}-v(\d+)\.md$")
-    versions: list[int] = []
-    for entry in proposals_dir.iterdir():
-        if not entry.is_file():
-            continue
-        match = pattern.match(entry.name)
-        if not match:
-            continue
-        try:
-            versions.append(int(match.group(1)))
-        except ValueError:
-            continue
-    return (max(versions) + 1) if versions else 1
+    key = os.path.abspath(proposals_dir)
+    cached = _VERSION_CACHE.get(key)
+    if cached is None or cached[0] != dir_mtime:
+        cached = _VERSION_CACHE[key] = (dir_mtime, _scan_versions(proposals_dir))
+    return cached[1].get(signal_id, 0) + 1
+
+
+def _scan_versions(proposals_dir: Path) -> dict[str, int]:
+    """Highest proposal version per signal id, from one listing of the directory."""
+    versions: dict[str, int] = {}
+    with os.scandir(proposals_dir) as entries:
+        for entry in entries:
+            # RTI-PROP-<signal_id>-v<digits>.md, split at the last "-v"; plain
+            # string ops instead of a regex match per file. DirEntry.is_file()
+            # uses the type from the directory read, and only names that match
+            # get that far.
+            name = entry.name
+            if not (name.startswith("RTI-PROP-") and name.endswith(".md")):
+                continue
+            signal_id, sep, digits = name[len("RTI-PROP-") : -len(".md")].rpartition("-v")
+            if not (sep and signal_id and digits.isdecimal()) or not entry.is_file():
+                continue
+            version = int(digits)
+            if version > versions.get(signal_id, 0):
+                versions[signal_id] = version
+    return versions
+
+
+def _remember_version(signal_id: str, version: int, proposals_dir: Path) -> None:
+    # Directory mtimes are coarse, so a file created right after a scan may not
+    # change it; record our own writes instead of relying on the next rescan.
+    key = os.path.abspath(proposals_dir)
+    cached = _VERSION_CACHE.get(key)
+    if cached is None:
+        return
+    versions = cached[1]
+    versions[signal_id] = max(version, versions.get(signal_id, 0))
+    _VERSION_CACHE[key] = (proposals_dir.stat().st_mtime_ns, versions)
 
 
 def write_rti_proposal(decision: L4Decision, signal_id: str, proposals_dir: Path) -> Path:
@@ -53,6 +77,7 @@ def write_rti_proposal(decision: L4Decision, signal_id: str, proposals_dir: Path
     version = compute_next_version(signal_id, proposals_dir)
     target = proposals_dir / PROPOSAL_FILENAME_TEMPLATE.format(signal_id=signal_id, version=version)
     if target.exists():
+        _VERSION_CACHE.pop(os.path.abspath(proposals_dir), None)
         version = compute_next_version(signal_id, proposals_dir)
         target = proposals_dir / PROPOSAL_FILENAME_TEMPLATE.format(signal_id=signal_id, version=version)
         if target.exists():
@@ -79,8 +104,9 @@ def write_rti_proposal(decision: L4Decision, signal_id: str, proposals_dir: Path
         ]
     )
 
-    _atomic_write(target, content)
-    print(f"[RTI] Created proposal: {target}")
+    write_atomic(target, content)
+    _remember_version(signal_id, version, proposals_dir)
+    _log.info("[RTI] Created proposal: %s", target)
     return target
 
 
@@ -90,8 +116,7 @@ def on_new_l4_decision(decision_path: Path) -> str:
         return "no-op"
 
     if not decision.signal_id:
-        message = f"[RTI] ERROR missing signal_id in decision {decision.decision_id}"
-        print(message)
+        _log.error("[RTI] missing signal_id in decision %s", decision.decision_id)
         return "error: missing signal_id"
 
     proposals_dir = _resolve_proposals_dir(decision_path)
@@ -107,8 +132,7 @@ def _resolve_proposals_dir(decision_path: Path) -> Path:
 
 def _parse_decision(decision_path: Path) -> L4Decision:
     decision_id = decision_path.stem
-    lines = decision_path.read_text(encoding="utf-8").splitlines()
-    frontmatter = _extract_frontmatter(lines)
+    frontmatter = read_frontmatter(decision_path)
     decision_type = frontmatter.get("decision_type")
     signal_id = frontmatter.get("signal_id")
     revision_of = frontmatter.get("revision_of")
@@ -118,27 +142,3 @@ def _parse_decision(decision_path: Path) -> L4Decision:
         revision_of=(revision_of or "").strip() or None,
         decision_id=decision_id,
     )
-
-
-def _extract_frontmatter(lines: list[str]) -> dict[str, str]:
-    if not lines or lines[0].strip() != "---":
-        return {}
-    data: dict[str, str] = {}
-    for line in lines[1:]:
-        if line.strip() == "---":
-            break
-        if ":" not in line:
-            continue
-        key, value = line.split(":", 1)
-        data[key.strip()] = value.strip()
-    return data
-
-
-def _atomic_write(target: Path, content: str) -> None:
-    target.parent.mkdir(parents=True, exist_ok=True)
-    with NamedTemporaryFile(mode="w", encoding="utf-8", dir=target.parent, delete=False) as tmp:
-        tmp.write(content)
-        tmp.flush()
-        os.fsync(tmp.fileno())
-        tmp_name = tmp.name
-    os.replace(tmp_name, target)
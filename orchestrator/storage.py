@@ -1,8 +1,119 @@
 from __future__ import annotations
 
+import codecs
 import json
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, Iterator
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+# Parsed JSONL rows per file, keyed on (st_mtime_ns, st_size). Rows are kept
+# pickled so every read_all() hands out an independent copy callers may mutate.
+# A warm read unpickles in roughly half the time orjson takes to re-parse, and a
+# cold read pays for the extra pickle dump.
+_ROWS_CACHE: OrderedDict[str, tuple[int, int, bytes]] = OrderedDict()
+_ROWS_CACHE_SIZE = 32
+
+
+def read_json(path: Path) -> Any:
+    """Parse a UTF-8 JSON file (BOM tolerated), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes().removeprefix(codecs.BOM_UTF8))
+    return json.loads(path.read_text(encoding="utf-8-sig"))
+
+
+def dumps_json(payload: Any, *, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode ``payload`` as UTF-8 JSON bytes (compact unless ``pretty``), using orjson when it is installed."""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if pretty else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(payload, option=option)
+    if pretty:
+        return json.dumps(payload, indent=2, sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Decode one JSON document, using orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def write_json(path: Path, payload: Any, *, pretty: bool = False) -> None:
+    """Atomically replace ``path`` with ``payload`` as JSON (compact unless ``pretty``)."""
+    _replace_atomic(path, dumps_json(payload, pretty=pretty))
+
+
+def write_atomic(path: Path, content: str) -> Path:
+    """Atomically replace ``path`` with UTF-8 text ``content`` and return ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(mode="w", encoding="utf-8", dir=path.parent, delete=False) as tmp:
+        tmp.write(content)
+        tmp.flush()
+        _sync_data(tmp.fileno())
+        tmp_name = tmp.name
+    os.replace(tmp_name, path)
+    return path
+
+
+def write_atomic_many(targets: list[tuple[Path, str]], *, max_workers: int = 8) -> list[Path]:
+    """Write several text files atomically; none is replaced until all are synced.
+
+    A single file goes straight through write_atomic: a one-thread pool would
+    only add thread start-up to a write that has nothing to overlap with.
+    """
+    if len(targets) == 1:
+        return [write_atomic(*targets[0])]
+    for parent in {target.parent for target, _ in targets}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def _stage(item: tuple[Path, str]) -> str:
+        target, content = item
+        with NamedTemporaryFile(mode="w", encoding="utf-8", dir=target.parent, delete=False) as tmp:
+            try:
+                tmp.write(content)
+                tmp.flush()
+                _sync_data(tmp.fileno())
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
+            return tmp.name
+
+    # fsync releases the GIL, so a small pool overlaps the per-file sync
+    # latency; renames wait for the whole batch and run in input order.
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+        futures = [executor.submit(_stage, item) for item in targets]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    if errors:
+        for future in futures:
+            if future.exception() is None:
+                os.unlink(future.result())
+        raise errors[0]
+    for future, (target, _) in zip(futures, targets):
+        os.replace(future.result(), target)
+    return [target for target, _ in targets]
+
+
+def _replace_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(mode="wb", dir=path.parent, delete=False) as tmp:
+        tmp.write(data)
+        tmp.flush()
+        _sync_data(tmp.fileno())
+        tmp_name = tmp.name
+    os.replace(tmp_name, path)
+
+
+def _sync_data(fd: int) -> None:
+    # Writes always go to fresh temp files, so fdatasync still persists their
+    # size and blocks; only timestamps are skipped. Not every platform has it.
+    getattr(os, "fdatasync", os.fsync)(fd)
 
 
 class JSONLStorage:
@@ -11,24 +122,110 @@ class JSONLStorage:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._cache_key = os.path.abspath(path)
 
     def append(self, payload: dict[str, Any]) -> None:
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        _ROWS_CACHE.pop(self._cache_key, None)
+        with self.path.open("ab") as f:
+            f.write(dumps_json(payload) + b"\n")
 
     def read_all(self) -> list[dict[str, Any]]:
-        if not self.path.exists():
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
             return []
+        cached = _ROWS_CACHE.get(self._cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _ROWS_CACHE.move_to_end(self._cache_key)
+            return pickle.loads(cached[2])
 
-        rows: list[dict[str, Any]] = []
-        for line in self.path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            rows.append(json.loads(line))
+        # Parsed line by line straight off the file; no whole-file string or
+        # list of line strings is built first.
+        with self.path.open("rb") as f:
+            rows: list[dict[str, Any]] = [loads_json(line) for line in f if line.strip()]
+        _ROWS_CACHE[self._cache_key] = (stat.st_mtime_ns, stat.st_size, pickle.dumps(rows, pickle.HIGHEST_PROTOCOL))
+        if len(_ROWS_CACHE) > _ROWS_CACHE_SIZE:
+            _ROWS_CACHE.popitem(last=False)
         return rows
 
+    def read_indexed(self, key: str = "id") -> tuple[list[dict[str, Any]], dict[Any, dict[str, Any]]]:
+        """Return read_all() plus a map from each ``key`` value to the first row carrying it."""
+        rows = self.read_all()
+        by_key: dict[Any, dict[str, Any]] = {}
+        for row in rows:
+            if key in row:
+                by_key.setdefault(row[key], row)
+        return rows, by_key
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        """Yield rows one line at a time instead of loading the whole file."""
+        try:
+            handle = self.path.open("rb")
+        except FileNotFoundError:
+            return
+        with handle:
+            for line in handle:
+                if line.strip():
+                    yield loads_json(line)
+
     def rewrite_all(self, rows: list[dict[str, Any]]) -> None:
-        with self.path.open("w", encoding="utf-8") as f:
-            for row in rows:
-                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        _ROWS_CACHE.pop(self._cache_key, None)
+        # Serialized up front and swapped in with one write, so a crash mid-way
+        # leaves the previous rows rather than a truncated file.
+        _replace_atomic(self.path, b"".join(dumps_json(row) + b"\n" for row in rows))
+
+
+class JournaledSnapshot:
+    """A JSON snapshot plus an append-only JSONL journal of entries added since it was written.
+
+    append() journals new entries and only rewrites the snapshot once the journal
+    has grown larger than it, so appends cost O(new entries) amortized. Sizes
+    come from stat(); neither file is read to decide.
+    """
+
+    def __init__(self, path: Path, *, sort_keys: bool = False) -> None:
+        self.path = path
+        self.journal_path = path.with_name(f"{path.stem}.journal.jsonl")
+        self.sort_keys = sort_keys
+
+    def read(self) -> tuple[Any, list[dict[str, Any]]]:
+        """Return the snapshot payload (None when there is none) and the journal entries after it."""
+        if not self.path.exists():
+            return None, []
+        payload = read_json(self.path)
+        entries: list[dict[str, Any]] = []
+        try:
+            handle = self.journal_path.open("rb")
+        except FileNotFoundError:
+            return payload, entries
+        with handle:
+            for line in handle:
+                try:
+                    entries.append(loads_json(line))
+                except json.JSONDecodeError:
+                    # Blank or torn trailing line from an interrupted append.
+                    continue
+        return payload, entries
+
+    def append(self, entries: list[dict[str, Any]], snapshot: Callable[[], Any]) -> None:
+        """Journal ``entries``, or write ``snapshot()`` (which must already include them) to compact."""
+        try:
+            snapshot_size = self.path.stat().st_size
+        except FileNotFoundError:
+            self.write(snapshot())
+            return
+        blob = b"".join(dumps_json(entry, sort_keys=self.sort_keys) + b"\n" for entry in entries)
+        try:
+            journal_size = self.journal_path.stat().st_size
+        except FileNotFoundError:
+            journal_size = 0
+        if journal_size + len(blob) > snapshot_size:
+            self.write(snapshot())
+            return
+        with self.journal_path.open("ab") as handle:
+            handle.write(blob)
+
+    def write(self, payload: Any) -> None:
+        """Atomically replace the snapshot with ``payload`` and drop the journal it now covers."""
+        _replace_atomic(self.path, dumps_json(payload, pretty=True, sort_keys=self.sort_keys))
+        self.journal_path.unlink(missing_ok=True)
@@ -5,9 +5,9 @@ import re
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Any
+from typing import Any, Iterable
 
+from orchestrator.storage import write_atomic, write_atomic_many
 from pm_os_contracts.models import LTI_NODE, RTI_NODE, SIGNAL
 
 SIGNALS_DIR = "95_Signals"
@@ -18,9 +18,16 @@ RTI_DIR = "RTI"
 LTI_DRAFTS_DIR = "96_Weekly_Review/_LTI_Drafts"
 RTI_PROPOSALS_DIR = "97_Decisions/_RTI_Proposals"
 
-_LATEX_INLINE_PATTERN = re.compile(r"\$(.*?)\$|\\\((.*?)\\\)|\\\[(.*?)\\\]", re.DOTALL)
-_LATEX_COMMAND_PATTERN = re.compile(r"\\[a-zA-Z]+\*?(?:\{[^{}]*\})?")
-_LATEX_TEXTBF_PATTERN = re.compile(r"\\textbf\{([^{}]*)\}")
+# \textbf{...} keeps its text, inline math keeps its body, other commands become
+# a space; one alternation so each excerpt is scanned once.
+_LATEX_PATTERN = re.compile(
+    r"\\textbf\{(?P<tb>[^{}]*)\}"
+    r"|\$(?P<m1>.*?)\$|\\\((?P<m2>.*?)\\\)|\\\[(?P<m3>.*?)\\\]"
+    r"|\\[a-zA-Z]+\*?(?:\{[^{}]*\})?",
+    re.DOTALL,
+)
+# Strings made only of these characters are written as plain YAML scalars.
+_SCALAR_SAFE_RE = re.compile(r"[A-Za-z0-9_./:-]+\Z")
 
 
 @dataclass(slots=True)
@@ -45,7 +52,7 @@ def _yaml_scalar(value: Any) -> str:
     if value is None:
         return "null"
     if isinstance(value, str):
-        if re.match(r"^[A-Za-z0-9_./:.-]+$", value):
+        if _SCALAR_SAFE_RE.match(value):
             return value
         escaped = value.replace('"', '\\"')
         return f'"{escaped}"'
@@ -74,14 +81,17 @@ def _normalize_datetime(value: datetime | str | None) -> str:
 def _clean_markdown_text(raw: str | None) -> str:
     if not raw:
         return ""
-    without_textbf = _LATEX_TEXTBF_PATTERN.sub(r"\1", raw)
+    return " ".join(_LATEX_PATTERN.sub(_latex_repl, raw).split())
 
-    def _inline_repl(match: re.Match[str]) -> str:
-        return next((group for group in match.groups() if group is not None), "")
 
-    without_math = _LATEX_INLINE_PATTERN.sub(_inline_repl, without_textbf)
-    without_commands = _LATEX_COMMAND_PATTERN.sub(" ", without_math)
-    return " ".join(without_commands.split())
+def _latex_repl(match: re.Match[str]) -> str:
+    # lastgroup names the captured body; plain commands capture nothing.
+    kind = match.lastgroup
+    if kind is None:
+        return " "
+    inner = match[kind]
+    # Bold text and math bodies may themselves hold math or commands.
+    return _LATEX_PATTERN.sub(_latex_repl, inner) if "\\" in inner or "$" in inner else inner
 
 
 def _excerpt(content: str | None, *, limit: int = 500) -> str:
@@ -91,27 +101,21 @@ def _excerpt(content: str | None, *, limit: int = 500) -> str:
     return cleaned[:limit].rstrip() + "…"
 
 
-def _write_atomic(target: Path, content: str) -> Path:
-    target.parent.mkdir(parents=True, exist_ok=True)
-    with NamedTemporaryFile(mode="w", encoding="utf-8", dir=target.parent, delete=False) as tmp:
-        tmp.write(content)
-        tmp.flush()
-        os.fsync(tmp.fileno())
-        tmp_name = tmp.name
-
-    os.replace(tmp_name, target)
-    return target
-
-
 def write_signal_markdown(vault_root: Path, signal: dict[str, Any] | SIGNAL) -> Path:
     """Write a SIGNAL contract as an Obsidian note under 95_Signals."""
-    signal_model = _coerce_signal(signal)
+    return write_atomic(*_render_signal_markdown(vault_root, _coerce_signal(signal)))
+
+
+def _render_signal_markdown(vault_root: Path, signal_model: SIGNAL) -> tuple[Path, str]:
     target = vault_root / SIGNALS_DIR / f"{signal_model.id}.md"
 
     ingested_at = _normalize_datetime(datetime.now(tz=timezone.utc))
     timestamp = _normalize_datetime(signal_model.timestamp)
     impact_areas = signal_model.impact_area or []
+    source_url = f"\nSource URL: {signal_model.url}\n" if signal_model.url else ""
 
+    # Adjacent f-strings compile to a single string build, so the whole note is
+    # materialized once.
     content = (
         "---\n"
         f"id: {_yaml_scalar(signal_model.id)}\n"
@@ -130,14 +134,20 @@ def write_signal_markdown(vault_root: Path, signal: dict[str, Any] | SIGNAL) ->
         f"{signal_model.source}\n\n"
         "## Preview\n"
         f"{_excerpt(signal_model.content)}\n"
+        f"{source_url}"
+        "\n## Full Evidence (optional; appended later)\n"
     )
+    return target, content
 
-    if signal_model.url:
-        content += f"\nSource URL: {signal_model.url}\n"
-
-    content += "\n## Full Evidence (optional; appended later)\n"
 
-    return _write_atomic(target, content)
+def write_signal_markdowns(
+    vault_root: Path, signals: Iterable[dict[str, Any] | SIGNAL], *, max_workers: int = 8
+) -> list[Path]:
+    """Write several signal notes with their syncs overlapped; paths are returned in input order."""
+    notes = [_render_signal_markdown(vault_root, _coerce_signal(signal)) for signal in signals]
+    if not notes:
+        return []
+    return write_atomic_many(notes, max_workers=max_workers)
 
 
 def _coerce_signal(signal: dict[str, Any] | SIGNAL) -> SIGNAL:
@@ -172,7 +182,7 @@ def write_weekly_review(vault_root: Path, week_id: str, shortlist: list[SignalSc
                 ]
             )
 
-    return _write_atomic(target, "\n".join(lines))
+    return write_atomic(target, "\n".join(lines))
 
 
 def write_weekly_review_from_signals(vault_root: Path, week_id: str, signals: list[SIGNAL], *, limit: int = 10) -> Path:
@@ -237,7 +247,7 @@ def write_gate_decision(
         next_actions_markdown,
         "",
     ]
-    return _write_atomic(target, "\n".join(lines))
+    return write_atomic(target, "\n".join(lines))
 
 
 def _writeback_target_dir(*, artifact_kind: str, human_approved: bool) -> str:
@@ -305,7 +315,7 @@ def write_lti_markdown(
         f"{linked_evidence_body}\n"
     )
 
-    return _write_atomic(target, content)
+    return write_atomic(target, content)
 
 
 def write_rti_markdown(
@@ -340,7 +350,7 @@ def write_rti_markdown(
         "---\n\n"
         f"# {node.title}\n"
     )
-    return _write_atomic(target, content)
+    return write_atomic(target, content)
 
 
 def current_week_id(today: date | None = None) -> str:
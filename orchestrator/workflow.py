@@ -5,7 +5,6 @@ import json
 import os
 import hashlib
 import re
-from tempfile import NamedTemporaryFile
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any, Callable
@@ -16,8 +15,8 @@ from urllib.error import HTTPError, URLError
 from pm_os_contracts.models import ACTION_TASK, LTI_NODE, RTI_NODE, SIGNAL
 from kb_manager import KnowledgeBaseManager
 
-from orchestrator.storage import JSONLStorage
-from orchestrator.vault_ops import _excerpt, write_gate_decision, write_lti_markdown, write_rti_markdown, write_signal_markdown
+from orchestrator.storage import JSONLStorage, write_atomic
+from orchestrator.vault_ops import SIGNALS_DIR, _excerpt, write_gate_decision, write_lti_markdown, write_rti_markdown, write_signal_markdown
 from orchestrator.l5_routing_guard import route_after_gate_decision, check_rule_of_three_and_propose_rti
 
 DEFAULT_NEXT_ACTIONS = {
@@ -104,7 +103,7 @@ class Orchestrator:
                 continue
 
             evidence = self._fetch_evidence(signal_row)
-            sig_path = resolved_vault_root / "95_Signals" / f"{task_signal_id}.md"
+            sig_path = resolved_vault_root / SIGNALS_DIR / f"{task_signal_id}.md"
             if not sig_path.exists():
                 write_signal_markdown(resolved_vault_root, signal_row)
 
@@ -598,7 +597,7 @@ class Orchestrator:
                 "",
             ]
         )
-        self._write_atomic(cos_path, "\n".join(lines))
+        write_atomic(cos_path, "\n".join(lines))
         self._sync_kb_indices()
 
         entry = {
@@ -691,16 +690,7 @@ class Orchestrator:
 
     def _write_cos_index(self, rows: list[dict[str, Any]]) -> None:
         self.cos_index_path.parent.mkdir(parents=True, exist_ok=True)
-        self._write_atomic(self.cos_index_path, json.dumps(rows, indent=2))
-
-    def _write_atomic(self, path: Path, content: str) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with NamedTemporaryFile(mode="w", encoding="utf-8", dir=path.parent, delete=False) as tmp:
-            tmp.write(content)
-            tmp.flush()
-            os.fsync(tmp.fileno())
-            tmp_name = tmp.name
-        os.replace(tmp_name, path)
+        write_atomic(self.cos_index_path, json.dumps(rows, indent=2))
 
     def _yaml_safe(self, value: str) -> str:
         if re.match(r"^[A-Za-z0-9_./: -]+$", value):
@@ -22,6 +22,10 @@ class ContractBaseModel(BaseModel):
     def to_json(self, *, indent: int | None = None) -> str:
         return self.model_dump_json(indent=indent, exclude_none=True)
 
+    def to_json_bytes(self) -> bytes:
+        """Compact UTF-8 JSON, identical to ``to_json().encode()`` without the str round trip."""
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> "ContractBaseModel":
         return cls.model_validate(payload)
@@ -36,3 +36,33 @@ def test_avl_pack_create_and_validate(tmp_path, capsys) -> None:
     assert rc == 0
     result = json.loads(capsys.readouterr().out)
     assert result["ok"] is True
+
+
+def test_avl_pack_ids_increment_across_cached_creates(tmp_path) -> None:
+    import datetime as dt
+
+    from avl.ops import EvidencePackStore
+
+    now = dt.datetime(2026, 3, 1, tzinfo=dt.timezone.utc)
+    store = EvidencePackStore(tmp_path)
+    first = store.create(title="Pack A", now=now)
+    second = store.create(title="Pack B", now=now)
+    assert first.id == "AVL-EP-20260301-001"
+    assert second.id == "AVL-EP-20260301-002"
+
+    # A fresh store instance (or another writer) sees the persisted index.
+    third = EvidencePackStore(tmp_path).create(title="Pack C", now=now)
+    assert third.id == "AVL-EP-20260301-003"
+    assert store.find_by_id(third.id) is not None
+    assert store.next_id(now.date()) == "AVL-EP-20260301-004"
+
+
+def test_avl_pack_validate_reports_missing_fields_in_order(tmp_path) -> None:
+    from avl.ops import REQUIRED_FIELDS, EvidencePackStore
+
+    store = EvidencePackStore(tmp_path)
+    record = store.create(title="Pack A")
+    result = store.validate(tmp_path / record.path)
+    assert result["ok"] is False
+    assert result["id"] == record.id
+    assert result["missing"] == list(REQUIRED_FIELDS)
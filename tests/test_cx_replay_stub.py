@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+import datetime as dt
 from pathlib import Path
 
 from cx_replay.replay_runner import run_fixture
@@ -28,3 +29,41 @@ def test_cx_replay_fixture_generates_valid_evidence_pack(tmp_path: Path) -> None
     assert Path(routed["lti_created"]).exists()
     assert routed["rti_review_created"] is not None
     assert Path(routed["rti_review_created"]).exists()
+
+
+def test_cx_replay_reserves_ids_in_evidence_index(tmp_path: Path) -> None:
+    from avl.ops import EvidencePackStore
+
+    first = run_fixture(fixture_id="cx-case-001", root=tmp_path)
+    second = run_fixture(fixture_id="cx-case-002", root=tmp_path)
+
+    assert Path(first["path"]).name.endswith("-001.md")
+    assert Path(second["path"]).name.endswith("-002.md")
+    assert first["evidence_pack"]["id"] != second["evidence_pack"]["id"]
+
+    created = EvidencePackStore(tmp_path).create(title="After replay")
+    assert created.id not in {first["evidence_pack"]["id"], second["evidence_pack"]["id"]}
+
+
+def test_cx_replay_seeds_counter_from_existing_files(tmp_path: Path) -> None:
+    output_dir = tmp_path / "avl" / "evidence_packs"
+    output_dir.mkdir(parents=True)
+    year = dt.datetime.now(tz=dt.timezone.utc).strftime("%Y")
+    (output_dir / f"VAL-CX-{year}-004.md").write_text("---\n---\n", encoding="utf-8")
+
+    result = run_fixture(fixture_id="cx-case-001", root=tmp_path)
+
+    assert Path(result["path"]).name == f"VAL-CX-{year}-005.md"
+
+
+def test_cx_replay_keeps_its_counter_out_of_the_evidence_index(tmp_path: Path) -> None:
+    from orchestrator.storage import read_json
+
+    run_fixture(fixture_id="cx-case-001", root=tmp_path)
+    result = run_fixture(fixture_id="cx-case-002", root=tmp_path)
+
+    output_dir = tmp_path / "avl" / "evidence_packs"
+    year = dt.datetime.now(tz=dt.timezone.utc).strftime("%Y")
+    assert Path(result["path"]).name == f"VAL-CX-{year}-002.md"
+    assert read_json(output_dir / "cx_replay_state.json") == {"counters": {f"VAL-CX-{year}-": 2}}
+    assert not any(key.startswith("VAL-CX-") for key in read_json(output_dir / "index.json")["counters"])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import patch
 
 from pmos.cli import main
 
@@ -25,3 +26,72 @@ def test_graph_create_list_show_update(tmp_path, capsys) -> None:
     assert rc == 0
     updated = json.loads(capsys.readouterr().out)
     assert updated["status"] == "validation_ready"
+
+
+def test_graph_store_batches_index_writes(tmp_path) -> None:
+    from graph.ops import GraphStore
+
+    store = GraphStore(tmp_path)
+    with store:
+        first = store.create(node_type="concept", title="Batch A")
+        second = store.create(node_type="concept", title="Batch B")
+        store.update_status(node_id=first.id, status="validated")
+        assert not store.index_path.exists()
+        assert store.get(second.id)["title"] == "Batch B"
+
+    snapshot = json.loads(store.index_path.read_text(encoding="utf-8"))
+    assert snapshot["log_offset"] == store.nodes_path.stat().st_size
+    index = snapshot["nodes"]
+    assert set(index) == {first.id, second.id}
+    assert index[first.id]["status"] == "validated"
+    assert GraphStore(tmp_path).get(first.id)["status"] == "validated"
+
+
+def test_graph_store_replays_log_appended_by_other_writers(tmp_path) -> None:
+    from graph.ops import GraphStore
+
+    reader = GraphStore(tmp_path)
+    assert reader.list() == []
+
+    writer = GraphStore(tmp_path)
+    with writer:
+        created = writer.create(node_type="hypothesis", title="Log only")
+        # Not snapshotted yet, but the append-only log already has the node.
+        assert reader.get(created.id)["title"] == "Log only"
+        writer.update_status(node_id=created.id, status="archived")
+        assert reader.get(created.id)["status"] == "archived"
+
+
+def test_graph_store_loads_snapshot_and_replays_only_the_log_tail(tmp_path) -> None:
+    from graph import ops
+    from graph.ops import GraphStore
+
+    writer = GraphStore(tmp_path)
+    with writer:
+        for n in range(5):
+            writer.create(node_type="concept", title=f"Snapshotted {n}")
+    # A line appended after the snapshot, e.g. by a writer that crashed before
+    # snapshotting.
+    late = dict(writer.list()[0], id="GRAPH-SKILL-20260216-001", title="After snapshot")
+    writer.store.append(late)
+
+    with patch.object(ops, "loads_json", wraps=ops.loads_json) as loads_mock:
+        fresh = GraphStore(tmp_path)
+        assert len(fresh.list()) == 6
+
+    assert loads_mock.call_count == 1
+    assert fresh.get(late["id"])["title"] == "After snapshot"
+
+
+def test_graph_store_append_does_not_skip_lines_from_other_writers(tmp_path) -> None:
+    from graph.ops import GraphStore
+
+    first = GraphStore(tmp_path)
+    second = GraphStore(tmp_path)
+    assert first.list() == [] and second.list() == []
+
+    theirs = second.create(node_type="concept", title="Theirs")
+    mine = first.create(node_type="skill", title="Mine")
+
+    assert first.get(theirs.id)["title"] == "Theirs"
+    assert {node["id"] for node in GraphStore(tmp_path).list()} == {theirs.id, mine.id}
@@ -3,6 +3,8 @@ from __future__ import annotations
 import datetime as dt
 from pathlib import Path
 
+import pytest
+
 from ingest.fetchers.arxiv_fetcher import ArxivFetcher
 from ingest.fetchers.html_list_fetcher import HTMLListFetcher
 from ingest.fetchers.md_proxy_fetcher import MDProxyFetcher
@@ -70,6 +72,39 @@ def test_html_list_fetcher_extracts_links(monkeypatch) -> None:
     assert items[0]["url"] == "https://www.anthropic.com/news/claude-agents"
 
 
+def test_html_list_fetcher_lexbor_and_bs4_return_identical_items(monkeypatch) -> None:
+    pytest.importorskip("selectolax.lexbor")
+    from ingest.fetchers import html_list_fetcher
+
+    pages = {
+        "https://www.anthropic.com/news": Path("tests/fixtures/html/anthropic_news.html"),
+        "https://ai.meta.com/blog": Path("tests/fixtures/html/meta_ai_blog.html"),
+    }
+
+    def fake_get(url, *args, **kwargs):
+        from ingest.fetchers.http import HTTPResponse
+
+        text = pages[url].read_text(encoding="utf-8")
+        return HTTPResponse(text=text, content=text.encode("utf-8"))
+
+    monkeypatch.setattr("ingest.fetchers.html_list_fetcher.http_get", fake_get)
+    sources = [
+        SourceConfig(id="anthropic", type="html_list", url="https://www.anthropic.com/news", link_selector="a[href^='/news/']", date_hint=True),
+        SourceConfig(id="anthropic_all", type="html_list", url="https://www.anthropic.com/news", date_hint=True),
+        SourceConfig(id="meta", type="html_list", url="https://ai.meta.com/blog", include_pattern=r"/blog/", date_hint=True),
+        SourceConfig(id="meta_none", type="html_list", url="https://ai.meta.com/blog", include_pattern=r"/news/"),
+    ]
+    fetcher = HTMLListFetcher()
+
+    lexbor_items = [fetcher.fetch(source, limit=5) for source in sources]
+    monkeypatch.setattr(html_list_fetcher, "LexborHTMLParser", None)
+    bs4_items = [fetcher.fetch(source, limit=5) for source in sources]
+
+    assert lexbor_items == bs4_items
+    assert [len(items) for items in lexbor_items] == [1, 1, 1, 0]
+    assert lexbor_items[0][0]["title"] == "Claude agents for enterprise"
+
+
 def test_normalize_outputs_contract_valid_signal() -> None:
     now = dt.datetime(2026, 2, 13, tzinfo=dt.timezone.utc)
     source = SourceConfig(id="openai", name="OpenAI News", type="rss", signal_type="capability", weight=0.9)
@@ -150,3 +185,268 @@ def test_sourceconfig_accepts_expected_alias_keys() -> None:
 def test_get_fetcher_supports_new_source_types() -> None:
     assert get_fetcher("md_proxy").__class__.__name__ == "MDProxyFetcher"
     assert get_fetcher("arxiv_api").__class__.__name__ == "ArxivFetcher"
+
+
+def test_parse_datetime_handles_rss_iso_and_year_hints() -> None:
+    from ingest.fetchers.common import parse_datetime
+
+    utc = dt.timezone.utc
+    assert parse_datetime("Thu, 12 Feb 2026 10:00:00 GMT") == dt.datetime(2026, 2, 12, 10, tzinfo=utc)
+    assert parse_datetime("12 Feb 2026 10:00:00 +0000") == dt.datetime(2026, 2, 12, 10, tzinfo=utc)
+    assert parse_datetime("2026-02-12T10:00:00Z") == dt.datetime(2026, 2, 12, 10, tzinfo=utc)
+    assert parse_datetime("2026-02-12") == dt.datetime(2026, 2, 12, tzinfo=utc)
+    assert parse_datetime("Published Feb 2026") == dt.datetime(2026, 1, 1, tzinfo=utc)
+    assert parse_datetime("") is None
+
+
+def test_parse_datetime_iso_fast_path_matches_strptime_formats() -> None:
+    from ingest.fetchers.common import parse_datetime
+
+    utc = dt.timezone.utc
+    plus_two = dt.timezone(dt.timedelta(hours=2))
+    assert parse_datetime("2026-02-16T12:34:56+02:00") == dt.datetime(2026, 2, 16, 12, 34, 56, tzinfo=plus_two)
+    assert parse_datetime("2026-02-16T12:34:56+0200") == dt.datetime(2026, 2, 16, 12, 34, 56, tzinfo=plus_two)
+    # Forms none of the formats accept still fall back to the year hint.
+    assert parse_datetime("2026-02-16T12:34:56.123Z") == dt.datetime(2026, 1, 1, tzinfo=utc)
+    assert parse_datetime("2026-02-16 08:00") == dt.datetime(2026, 1, 1, tzinfo=utc)
+    assert parse_datetime("2026-02-16T08:00") == dt.datetime(2026, 1, 1, tzinfo=utc)
+    assert parse_datetime("2026-02") == dt.datetime(2026, 1, 1, tzinfo=utc)
+    assert parse_datetime("2026-02-30") == dt.datetime(2026, 1, 1, tzinfo=utc)
+
+
+def test_infer_impact_area_matches_whole_terms_in_declared_order() -> None:
+    from ingest.normalize import infer_impact_area
+
+    assert infer_impact_area("New SDK for agents", "with Red Team evaluation") == [
+        "agent_systems",
+        "evaluation",
+        "tooling_infra",
+    ]
+    assert infer_impact_area("Agentic evals", None) == ["tooling_infra"]
+
+
+def test_store_keeps_legacy_sha256_index_compatible(tmp_path) -> None:
+    import hashlib
+    import json
+
+    out = tmp_path / "signals.jsonl"
+    idx = tmp_path / "signals_index.json"
+    now = dt.datetime(2026, 2, 13, tzinfo=dt.timezone.utc)
+    source = SourceConfig(id="openai", name="OpenAI News", type="rss", signal_type="capability", weight=0.9)
+    signal = normalize_item_to_signal(source, {"title": "Toolkit", "published_at": now}, seq_num=1, now_utc=now)
+    legacy = hashlib.sha256(f"OpenAI News|Toolkit|{signal.to_dict()['timestamp']}".encode("utf-8")).hexdigest()
+    idx.write_text(json.dumps({"urls": [], "fallback_hashes": [legacy]}), encoding="utf-8")
+
+    assert append_signals(out, [signal], index_path=idx) == (0, 1)
+
+    fresh_idx = tmp_path / "fresh_index.json"
+    assert append_signals(out, [signal], index_path=fresh_idx) == (1, 0)
+    assert json.loads(fresh_idx.read_text(encoding="utf-8"))["index_version"] == 2
+
+
+def test_normalize_items_to_signals_numbers_and_scores_batch() -> None:
+    from ingest.normalize import calculate_priority_score, normalize_items_to_signals
+
+    now = dt.datetime(2026, 2, 13, tzinfo=dt.timezone.utc)
+    source = SourceConfig(id="openai", type="rss", signal_type="capability", weight=0.9)
+    items = [
+        {"title": "Agent SDK", "url": "https://example.com/a", "published_at": now - dt.timedelta(days=1)},
+        {"title": "Policy update", "url": "https://example.com/b", "published_at": now - dt.timedelta(days=5)},
+        {"title": "Old benchmark", "url": "https://example.com/c"},
+    ]
+
+    signals = normalize_items_to_signals(source, items, start_seq=4, now_utc=now)
+
+    assert [signal.id for signal in signals] == ["SIG-20260213-004", "SIG-20260213-005", "SIG-20260213-006"]
+    assert [signal.priority_score for signal in signals] == [
+        calculate_priority_score(source, item, signal.impact_area, now) for item, signal in zip(items, signals)
+    ]
+
+
+def test_normalize_and_validate_items_matches_separate_passes() -> None:
+    from ingest import normalize
+
+    now = dt.datetime(2026, 2, 13, tzinfo=dt.timezone.utc)
+    source = SourceConfig(id="openai", type="rss", signal_type="capability", weight=0.9)
+    items = [
+        {"title": "Agent SDK", "url": "https://example.com/a", "published_at": now - dt.timedelta(days=1)},
+        {"title": "Old note", "url": "https://example.com/b", "published_at": now - dt.timedelta(days=30)},
+        {"title": "Agent SDK again", "url": "https://example.com/a", "published_at": now},
+        {"title": ["not", "a", "string"], "url": "https://example.com/d", "published_at": now},
+        {"title": "Policy update", "url": "https://example.com/e", "published_at": now - dt.timedelta(days=2)},
+    ]
+    seen_urls: set[str] = set()
+
+    outcomes = normalize.normalize_and_validate_items(
+        source, items, start_seq=1, now_utc=now, threshold=0.5, seen_urls=seen_urls
+    )
+
+    assert [outcome.reason for outcome in outcomes] == [
+        normalize.OK,
+        normalize.LOW_PRIORITY,
+        normalize.DUPLICATE,
+        normalize.INVALID,
+        normalize.OK,
+    ]
+    assert outcomes[3].error
+    accepted = [outcome.signal for outcome in outcomes if outcome.signal is not None]
+    expected = normalize.normalize_items_to_signals(source, [items[0], items[4]], start_seq=1, now_utc=now)
+    assert [signal.id for signal in accepted] == ["SIG-20260213-001", "SIG-20260213-005"]
+    assert [signal.model_dump(exclude={"id"}) for signal in accepted] == [
+        signal.model_dump(exclude={"id"}) for signal in expected
+    ]
+    for signal in accepted:
+        validate_signal_contract(signal)
+    assert seen_urls == {"https://example.com/a", "https://example.com/e"}
+
+
+def test_normalize_and_validate_items_rejects_on_freshness_bound_without_scanning(monkeypatch) -> None:
+    from ingest import normalize
+
+    now = dt.datetime(2026, 2, 13, tzinfo=dt.timezone.utc)
+    source = SourceConfig(id="openai", type="rss", signal_type="capability", weight=0.9)
+    items = [
+        {"title": "Agent eval safety policy", "url": "https://example.com/old", "published_at": now - dt.timedelta(days=30)},
+        {"title": "Agent eval safety policy", "url": "https://example.com/new", "published_at": now},
+    ]
+    scanned = []
+    infer = normalize.infer_impact_area
+    monkeypatch.setattr(normalize, "infer_impact_area", lambda title, content: scanned.append(title) or infer(title, content))
+
+    outcomes = normalize.normalize_and_validate_items(source, items, start_seq=1, now_utc=now, threshold=0.5)
+
+    assert [outcome.reason for outcome in outcomes] == [normalize.LOW_PRIORITY, normalize.OK]
+    assert len(scanned) == 1
+    assert outcomes[1].signal.priority_score == normalize.calculate_priority_score(
+        source, items[1], outcomes[1].signal.impact_area, now
+    )
+
+
+def test_signal_appender_persists_each_batch_before_close(tmp_path) -> None:
+    from ingest.store import SignalAppender, _load_index
+
+    out = tmp_path / "signals.jsonl"
+    idx = tmp_path / "signals_index.json"
+    now = dt.datetime(2026, 2, 13, tzinfo=dt.timezone.utc)
+    source = SourceConfig(id="openai", type="rss", signal_type="capability", weight=0.9)
+    signals = [
+        normalize_item_to_signal(source, {"title": f"T{n}", "url": f"https://example.com/{n}", "published_at": now}, n, now)
+        for n in range(1, 4)
+    ]
+
+    with SignalAppender(out, index_path=idx) as appender:
+        assert appender.append(signals[:2]) == (signals[:2], 0)
+        assert len(out.read_text(encoding="utf-8").splitlines()) == 2
+        assert _load_index(idx)["urls"] == {"https://example.com/1", "https://example.com/2"}
+
+        written, skipped = appender.append(signals[1:])
+        assert (written, skipped) == ([signals[2]], 1)
+
+    assert len(out.read_text(encoding="utf-8").splitlines()) == 3
+    assert append_signals(out, signals, index_path=idx) == (0, 3)
+
+
+def test_store_appends_index_journal_and_compacts(tmp_path) -> None:
+    out = tmp_path / "signals.jsonl"
+    idx = tmp_path / "signals_index.json"
+    journal = tmp_path / "signals_index.journal.jsonl"
+    now = dt.datetime(2026, 2, 13, tzinfo=dt.timezone.utc)
+    source = SourceConfig(id="openai", name="OpenAI News", type="rss", signal_type="capability", weight=0.9)
+
+    def batch(start: int, count: int):
+        return [
+            normalize_item_to_signal(
+                source, {"title": f"T{n}", "url": f"https://example.com/{n}", "published_at": now}, seq_num=n, now_utc=now
+            )
+            for n in range(start, start + count)
+        ]
+
+    assert append_signals(out, batch(0, 4), index_path=idx) == (4, 0)
+    assert not journal.exists()
+
+    assert append_signals(out, batch(4, 2), index_path=idx) == (2, 0)
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 2
+    assert append_signals(out, batch(0, 6), index_path=idx) == (0, 6)
+
+    assert append_signals(out, batch(6, 3), index_path=idx) == (3, 0)
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 5
+    assert journal.stat().st_size <= idx.stat().st_size
+
+    # Compacted once the journal would outgrow the snapshot.
+    assert append_signals(out, batch(9, 6), index_path=idx) == (6, 0)
+    assert not journal.exists()
+    assert append_signals(out, batch(0, 15), index_path=idx) == (0, 15)
+
+
+def test_store_prunes_dedup_entries_older_than_max_age(tmp_path) -> None:
+    import json
+
+    out = tmp_path / "signals.jsonl"
+    idx = tmp_path / "signals_index.json"
+    now = dt.datetime(2026, 2, 13, tzinfo=dt.timezone.utc)
+    source = SourceConfig(id="openai", name="OpenAI News", type="rss", signal_type="capability", weight=0.9)
+    item = {"title": "Toolkit", "url": "https://openai.com/news/toolkit", "published_at": now}
+    signal = normalize_item_to_signal(source, item, seq_num=1, now_utc=now)
+
+    assert append_signals(out, [signal], index_path=idx) == (1, 0)
+    payload = json.loads(idx.read_text(encoding="utf-8"))
+    assert payload["urls"] == [] and len(payload["entries"]) == 1
+    payload["entries"][0]["ts"] = "2000-01-01"
+    idx.write_text(json.dumps(payload), encoding="utf-8")
+
+    assert append_signals(out, [signal], index_path=idx) == (0, 1)
+    assert append_signals(out, [signal], index_path=idx, max_index_age_days=180) == (1, 0)
+
+
+def test_http_get_pooled_path_matches_urlopen_semantics() -> None:
+    pytest.importorskip("urllib3")
+    import gzip
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.error import HTTPError
+
+    from ingest.fetchers import http
+
+    hits: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            hits.append(self.path)
+            if self.path == "/old":
+                self.send_response(302)
+                self.send_header("Location", "/feed")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            elif self.path.startswith("/feed"):
+                body = gzip.compress("café".encode("utf-8"))
+                self.send_response(200)
+                self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            else:
+                self.send_response(503 if self.path == "/busy" else 404)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        assert http._POOL is not None
+        assert http.http_get(f"{base}/feed", params={"q": "x", "skip": None}).text == "café"
+        assert http.http_get(f"{base}/old").text == "café"
+        for path, status in (("/missing", 404), ("/busy", 503)):
+            with pytest.raises(HTTPError) as excinfo:
+                http.http_get(base + path)
+            assert excinfo.value.code == status
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # One attempt per request: error statuses, even with Retry-After, are not retried.
+    assert hits == ["/feed?q=x", "/old", "/feed", "/missing", "/busy"]
@@ -91,3 +91,53 @@ def test_atomic_writeback_uses_os_replace(tmp_path: Path) -> None:
         manager.writeback_lti(LTI_NODE(id="LTI-6.5", title="Signal scoring", series="LTI-6.x", status="active"))
 
     assert replace_mock.called
+
+
+def test_repeated_writebacks_update_index_without_reparsing(tmp_path: Path) -> None:
+    manager = KnowledgeBaseManager(tmp_path)
+    manager.writeback_lti(LTI_NODE(id="LTI-6.5", title="Signal scoring", series="LTI-6.x", status="active"))
+
+    with patch.object(manager, "_read_json_file") as read_mock:
+        manager.writeback_lti(LTI_NODE(id="LTI-6.1", title="Routing", series="LTI-6.x", status="active"))
+        manager.writeback_lti(LTI_NODE(id="LTI-6.5", title="Signal scoring", series="LTI-6.x", status="archived"))
+
+    assert not read_mock.called
+    lti_index = _read_json(tmp_path / "02_LTI" / "lti_index.json")
+    assert [(item["id"], item["status"]) for item in lti_index["items"]] == [
+        ("LTI-6.1", "active"),
+        ("LTI-6.5", "archived"),
+    ]
+    assert manager.sync_indices().lti_count == 2
+    assert _read_json(tmp_path / "02_LTI" / "lti_index.json")["items"] == lti_index["items"]
+
+
+def test_writeback_index_picks_up_notes_changed_outside_the_manager(tmp_path: Path) -> None:
+    manager = KnowledgeBaseManager(tmp_path)
+    manager.writeback_lti(LTI_NODE(id="LTI-6.1", title="Routing", series="LTI-6.x", status="active"))
+
+    external = tmp_path / "02_LTI" / "LTI-6.x" / "LTI-6.2.md"
+    external.write_text(json.dumps({"id": "LTI-6.2", "title": "Manual", "series": "LTI-6.x", "status": "draft"}), encoding="utf-8")
+    (tmp_path / "02_LTI" / "LTI-6.x" / "LTI-6.1.md").unlink()
+    manager.writeback_lti(LTI_NODE(id="LTI-6.5", title="Signal scoring", series="LTI-6.x", status="active"))
+
+    lti_index = _read_json(tmp_path / "02_LTI" / "lti_index.json")
+    assert [(item["id"], item["status"]) for item in lti_index["items"]] == [("LTI-6.2", "draft"), ("LTI-6.5", "active")]
+
+
+def test_sync_indices_reparses_only_changed_notes(tmp_path: Path) -> None:
+    manager = KnowledgeBaseManager(tmp_path)
+    manager.writeback_lti(LTI_NODE(id="LTI-6.1", title="Routing", series="LTI-6.x", status="active"))
+    manager.writeback_lti(LTI_NODE(id="LTI-6.5", title="Signal scoring", series="LTI-6.x", status="active"))
+    manager.sync_indices()
+
+    changed = tmp_path / "02_LTI" / "LTI-6.x" / "LTI-6.5.md"
+    payload = _read_json(changed)
+    payload["status"] = "archived"
+    changed.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    with patch.object(manager, "_read_json_file", wraps=manager._read_json_file) as read_mock:
+        manager.sync_indices()
+
+    assert [call.args[0] for call in read_mock.call_args_list] == [changed]
+    lti_index = _read_json(tmp_path / "02_LTI" / "lti_index.json")
+    assert [item["status"] for item in lti_index["items"]] == ["active", "archived"]
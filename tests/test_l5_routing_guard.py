@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
+
+from orchestrator import decisions, rti_proposals
 from orchestrator import l5_routing_guard as l5
 from orchestrator.storage import JSONLStorage
 
@@ -30,6 +34,11 @@ def _seed_signal(data_dir: Path, signal_id: str) -> None:
     store.append({"id": signal_id, "title": "Signal Title", "content": "Signal summary", "impact_area": ["strategy"], "url": "https://example.com"})
 
 
+def _read_index(index_name: str, data_dir: Path) -> list[dict]:
+    snapshot, journal = l5._index_store(index_name, data_dir).read()
+    return [*(snapshot or []), *journal]
+
+
 def test_route_after_gate_creates_lti_draft_when_approved(tmp_path) -> None:
     vault_root = tmp_path / "vault"
     data_dir = tmp_path / "data"
@@ -123,3 +132,147 @@ def test_reject_marks_status_only(tmp_path) -> None:
     updated = JSONLStorage(data_dir / "test_data" / "lti_drafts.jsonl").read_all()[0]
     assert updated["status"] == "rejected"
     assert (vault_root / updated["vault_path"]).exists()
+
+
+def test_new_drafts_are_appended_without_rewriting(tmp_path) -> None:
+    vault_root = tmp_path / "vault"
+    data_dir = tmp_path / "data"
+    for n in (5, 6):
+        _seed_signal(data_dir, f"SIG-20260223-00{n}")
+        _write_decision(
+            vault_root / "97_Decisions" / f"DEC-2026-W08-00{n}.md", decision_type="ACCEPT", signal_id=f"SIG-20260223-00{n}"
+        )
+
+    with patch.object(JSONLStorage, "rewrite_all", autospec=True, side_effect=JSONLStorage.rewrite_all) as rewrite_mock:
+        l5.route_after_gate_decision("DEC-2026-W08-005", data_dir, vault_root)
+        l5.route_after_gate_decision("DEC-2026-W08-006", data_dir, vault_root)
+
+    rewritten = {call.args[0].path.name for call in rewrite_mock.call_args_list}
+    assert "lti_drafts.jsonl" not in rewritten
+    rows = JSONLStorage(data_dir / "test_data" / "lti_drafts.jsonl").read_all()
+    assert [row["source_decision_id"] for row in rows] == ["DEC-2026-W08-005", "DEC-2026-W08-006"]
+    assert len({row["id"] for row in rows}) == 2
+    assert [item["id"] for item in _read_index(l5.LTI_INDEX_JSON, data_dir)] == [row["id"] for row in rows]
+
+
+def test_index_is_journaled_on_append_and_compacted_on_update(tmp_path) -> None:
+    vault_root = tmp_path / "vault"
+    data_dir = tmp_path / "data"
+    draft_ids = []
+    for n in range(1, 6):
+        _seed_signal(data_dir, f"SIG-20260224-00{n}")
+        _write_decision(
+            vault_root / "97_Decisions" / f"DEC-2026-W09-00{n}.md", decision_type="ACCEPT", signal_id=f"SIG-20260224-00{n}"
+        )
+        created = l5.route_after_gate_decision(f"DEC-2026-W09-00{n}", data_dir, vault_root)
+        draft_ids.append(created[0]["id"])
+        assert [entry["id"] for entry in _read_index(l5.LTI_INDEX_JSON, data_dir)] == draft_ids
+
+    journal = data_dir / "test_data" / "lti_index.journal.jsonl"
+    assert journal.exists()
+
+    l5.reject_lti_draft(draft_ids[0], data_dir, vault_root, reviewer="Lisa", reason="not ready")
+    assert not journal.exists()
+    index = json.loads((data_dir / "test_data" / "lti_index.json").read_text(encoding="utf-8"))
+    assert [(item["id"], item["status"]) for item in index] == [(draft_ids[0], "rejected")] + [
+        (draft_id, "draft") for draft_id in draft_ids[1:]
+    ]
+
+
+def test_frontmatter_updates_replace_existing_keys_and_append_missing_ones() -> None:
+    content = "---\nid: X\nstatus: draft\nreviewer: a\n---\n\n# Body\nstatus: keep\n"
+
+    updated = l5._apply_frontmatter_updates(
+        content, {"status": "published", "published_at": "2026-02-23T00:00:00Z", "reviewer": "C:\\1"}
+    )
+
+    assert updated == (
+        "---\nid: X\nstatus: published\nreviewer: C:\\1\npublished_at: 2026-02-23T00:00:00Z\n---\n\n# Body\nstatus: keep\n"
+    )
+
+
+def test_publish_lti_drafts_rewrites_the_store_once(tmp_path) -> None:
+    vault_root = tmp_path / "vault"
+    data_dir = tmp_path / "data"
+    for n in (7, 8):
+        _seed_signal(data_dir, f"SIG-20260223-00{n}")
+        _write_decision(
+            vault_root / "97_Decisions" / f"DEC-2026-W08-00{n}.md", decision_type="ACCEPT", signal_id=f"SIG-20260223-00{n}"
+        )
+        l5.route_after_gate_decision(f"DEC-2026-W08-00{n}", data_dir, vault_root)
+    draft_ids = [row["id"] for row in JSONLStorage(data_dir / "test_data" / "lti_drafts.jsonl").read_all()]
+
+    with patch.object(JSONLStorage, "rewrite_all", autospec=True, side_effect=JSONLStorage.rewrite_all) as rewrite_mock:
+        final_paths = l5.publish_lti_drafts(draft_ids, vault_root, data_dir, reviewer="Lisa", review_notes="ok")
+
+    assert rewrite_mock.call_count == 1
+    assert all((vault_root / path).exists() for path in final_paths)
+    rows = JSONLStorage(data_dir / "test_data" / "lti_drafts.jsonl").read_all()
+    assert [row["status"] for row in rows] == ["published", "published"]
+    assert l5.publish_lti_drafts(draft_ids[:1], vault_root, data_dir, reviewer="Lisa", review_notes="ok") == final_paths[:1]
+
+
+def test_missing_signal_id_is_logged_not_printed(tmp_path, caplog, capsys) -> None:
+    vault_root = tmp_path / "vault"
+    decision_path = vault_root / "97_Decisions" / "DEC-2026-W08-009.md"
+    _write_decision(decision_path, decision_type="ACCEPT", signal_id="")
+
+    with caplog.at_level("ERROR", logger="orchestrator.l5_routing_guard"):
+        result = l5.route_after_gate_decision("DEC-2026-W08-009", tmp_path / "data", vault_root)
+
+    assert result == [{"error": "missing signal_id"}]
+    assert "missing signal_id in decision DEC-2026-W08-009" in caplog.text
+    assert capsys.readouterr().out == ""
+
+
+def test_rel_posix_matches_relative_to(tmp_path) -> None:
+    target = tmp_path / "96_Weekly_Review" / "_LTI_Drafts" / "LTI-DRAFT-20260223-001.md"
+
+    assert l5._rel_posix(target, tmp_path) == target.relative_to(tmp_path).as_posix()
+    assert l5._rel_posix(Path("vault/RTI/RTI-1.md"), Path("vault")) == "RTI/RTI-1.md"
+
+
+def test_rendered_notes_keep_braces_in_values_verbatim() -> None:
+    decision = l5.L4Decision(decision_id="DEC-2026-W08-010", decision_type="ACCEPT", signal_id=None, revision_of=None)
+
+    draft = l5._render_lti_draft_markdown("LTI-DRAFT-20260223-001", decision, None, "uses {curly} braces", "2026-02-23T00:00:00Z")
+    proposal = l5._render_rti_proposal_markdown("RTI-PROP-20260223-001", "FP-{1}", [], "2026-02-23T00:00:00Z")
+
+    assert draft.startswith("---\nid: LTI-DRAFT-20260223-001\ntype: lti_draft\n")
+    assert "source_signal_id: \n" in draft
+    assert "# LTI-DRAFT-20260223-001\n\n## Why it matters (Outcome framing)\nuses {curly} braces\n" in draft
+    assert draft.endswith("## Notes\n")
+    assert "pattern_id: FP-{1}\n" in proposal
+    assert "## Pattern Evidence (COS cases)\n- None\n" in proposal
+
+
+def test_unchanged_decision_is_parsed_once(tmp_path) -> None:
+    vault_root = tmp_path / "vault"
+    data_dir = tmp_path / "data"
+    _seed_signal(data_dir, "SIG-20260223-011")
+    decision_path = vault_root / "97_Decisions" / "DEC-2026-W08-011.md"
+    _write_decision(decision_path, decision_type="ACCEPT", signal_id="SIG-20260223-011")
+
+    with patch.object(decisions, "_read_frontmatter", wraps=decisions._read_frontmatter) as parse_mock:
+        l5.route_after_gate_decision("DEC-2026-W08-011", data_dir, vault_root)
+        l5.route_after_gate_decision("DEC-2026-W08-011", data_dir, vault_root)
+        assert rti_proposals._parse_decision(decision_path).signal_id == "SIG-20260223-011"
+        assert parse_mock.call_count == 1
+
+        _write_decision(decision_path, decision_type="REJECT", signal_id="SIG-20260223-011-edited")
+        assert l5.route_after_gate_decision("DEC-2026-W08-011", data_dir, vault_root) == []
+        assert parse_mock.call_count == 2
+
+
+def test_reserve_unique_path_retries_the_next_number_once(tmp_path) -> None:
+    rows = [{"id": "LTI-DRAFT-20260223-001"}, {"id": "LTI-DRAFT-20260222-001"}, {"id": "RTI-PROP-20260223-001"}]
+
+    assert l5._reserve_unique_path("LTI-DRAFT", "2026-02-23T10:00:00Z", rows, tmp_path) == (
+        "LTI-DRAFT-20260223-002",
+        tmp_path / "LTI-DRAFT-20260223-002.md",
+    )
+    (tmp_path / "LTI-DRAFT-20260223-002.md").write_text("taken", encoding="utf-8")
+    assert l5._reserve_unique_path("LTI-DRAFT", "2026-02-23T10:00:00Z", rows, tmp_path)[0] == "LTI-DRAFT-20260223-003"
+    (tmp_path / "LTI-DRAFT-20260223-003.md").write_text("taken", encoding="utf-8")
+    with pytest.raises(FileExistsError):
+        l5._reserve_unique_path("LTI-DRAFT", "2026-02-23T10:00:00Z", rows, tmp_path)
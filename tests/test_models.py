@@ -36,6 +36,19 @@ def test_signal_roundtrip_serialization() -> None:
     assert json.loads(payload)["source"] == "anthropic_blog"
 
 
+def test_to_json_bytes_matches_to_json() -> None:
+    signal = SIGNAL(
+        id="SIG-20260216-001",
+        source="caf\u00e9",
+        type="capability",
+        timestamp="2026-02-16T12:00:00Z",
+        impact_area=["evaluation"],
+        extra_field={"kept": True},
+    )
+
+    assert signal.to_json_bytes() == signal.to_json().encode("utf-8")
+
+
 @pytest.mark.parametrize(
     "model_cls, valid_payload",
     [
@@ -1,6 +1,6 @@
 ﻿from __future__ import annotations
 
-from ingest.registry import load_sources
+from ingest.registry import _minimal_yaml_load, load_sources
 
 
 def test_newsletter_sources_have_source_type_and_credibility(tmp_path) -> None:
@@ -21,3 +21,31 @@ def test_newsletter_sources_have_source_type_and_credibility(tmp_path) -> None:
     sources = load_sources(src)
     assert sources[0].source_type == "pm_newsletter"
     assert sources[0].credibility == "high"
+
+
+def test_load_sources_reuses_parse_until_file_changes(tmp_path) -> None:
+    src = tmp_path / "sources.yaml"
+    src.write_text("- id: a\n  type: rss\n", encoding="utf-8")
+    first = load_sources(src)
+    assert load_sources(src)[0] is first[0]
+
+    src.write_text("- id: a\n  type: rss\n- id: b\n  type: rss\n", encoding="utf-8")
+    assert [cfg.id for cfg in load_sources(src)] == ["a", "b"]
+
+
+def test_minimal_yaml_loader_parses_source_scalars() -> None:
+    text = """
+# comment
+- id: lennys_newsletter
+  name: "Lenny's Newsletter"
+  priority_weight: 0.8
+  max_results: 20
+  date_hint: true
+
+- id: second
+  title_selector: 'h2'
+"""
+    assert _minimal_yaml_load(text) == [
+        {"id": "lennys_newsletter", "name": "Lenny's Newsletter", "priority_weight": 0.8, "max_results": 20, "date_hint": True},
+        {"id": "second", "title_selector": "h2"},
+    ]
@@ -280,3 +280,267 @@ def test_cli_deepen_run_returns_report(tmp_path, capsys, monkeypatch) -> None:
     assert payload["processed"] == 1
     assert payload["completed"] == 1
     assert payload["results"][0]["status"] == "completed"
+
+
+def test_cli_import_defers_command_dependencies() -> None:
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys, orchestrator.cli as cli; cli.build_parser(); "
+        "print(sorted(m for m in ('ingest.normalize', 'orchestrator.workflow', 'pm_os_contracts.models') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_sniff_subcommand_builds_only_the_invoked_parser() -> None:
+    from orchestrator.cli import _sniff_subcommand, build_parser
+
+    argv = ["--data-dir", "ingest", "weekly", "--limit", "3"]
+    assert _sniff_subcommand(argv) == "weekly"
+    assert _sniff_subcommand(["--help"]) is None
+    assert _sniff_subcommand(["unknown"]) is None
+
+    assert vars(build_parser("weekly").parse_args(argv)) == vars(build_parser().parse_args(argv))
+    assert build_parser("weekly") is build_parser("weekly")
+
+
+def test_cli_ingest_skips_repeated_urls_across_sources_before_validation(tmp_path, capsys, monkeypatch) -> None:
+    import datetime as dt
+
+    from ingest.registry import SourceConfig
+
+    class _Fetcher:
+        def fetch(self, source_cfg, limit):
+            return [
+                {
+                    "title": f"Agent policy update via {source_cfg.id}",
+                    "url": "https://example.com/shared",
+                    "content": "Same story syndicated by two feeds",
+                    "published_at": dt.datetime.now(tz=dt.timezone.utc),
+                }
+            ]
+
+    validated = []
+    monkeypatch.setattr(
+        "orchestrator.cli.load_sources",
+        lambda path: [
+            SourceConfig(id="feed-a", type="rss", signal_type="research"),
+            SourceConfig(id="feed-b", type="rss", signal_type="research"),
+        ],
+    )
+    monkeypatch.setattr("orchestrator.cli.get_fetcher", lambda source_type: _Fetcher())
+    monkeypatch.setattr("ingest.normalize.validate_signal_payload", validated.append)
+
+    out = tmp_path / "data" / "signals.jsonl"
+    rc = main(["ingest", "--out", str(out), "--since-days", "30", "--threshold", "0"])
+
+    assert rc == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["new_count"] == 1
+    assert report["skipped_duplicates"] == 1
+    assert len(validated) == 1
+
+
+def test_cli_ingest_resolves_each_fetcher_type_once(tmp_path, capsys, monkeypatch) -> None:
+    from ingest.registry import SourceConfig
+
+    class _Fetcher:
+        def fetch(self, source_cfg, limit):
+            return []
+
+    resolved = []
+
+    def _get_fetcher(source_type):
+        resolved.append(source_type)
+        if source_type == "carrier_pigeon":
+            raise ValueError(f"Unsupported source type: {source_type}")
+        return _Fetcher()
+
+    monkeypatch.setattr(
+        "orchestrator.cli.load_sources",
+        lambda path: [
+            SourceConfig(id="feed-a", type="rss"),
+            SourceConfig(id="feed-b", type="rss"),
+            SourceConfig(id="bird-a", type="carrier_pigeon"),
+            SourceConfig(id="bird-b", type="carrier_pigeon"),
+        ],
+    )
+    monkeypatch.setattr("orchestrator.cli.get_fetcher", _get_fetcher)
+
+    rc = main(["ingest", "--out", str(tmp_path / "data" / "signals.jsonl")])
+
+    assert rc == 0
+    report = json.loads(capsys.readouterr().out)
+    assert resolved == ["rss", "carrier_pigeon"]
+    assert [failure["source"] for failure in report["failures"]] == ["bird-a", "bird-b"]
+
+
+def test_cli_ingest_keeps_source_order_with_concurrent_fetches(tmp_path, capsys, monkeypatch) -> None:
+    import datetime as dt
+    import time
+
+    from ingest.registry import SourceConfig
+
+    class _Fetcher:
+        def fetch(self, source_cfg, limit):
+            if source_cfg.id == "slow":
+                time.sleep(0.05)
+            return [
+                {
+                    "title": f"Agent tooling update from {source_cfg.id}",
+                    "url": f"https://example.com/{source_cfg.id}",
+                    "content": "Body",
+                    "published_at": dt.datetime.now(tz=dt.timezone.utc),
+                }
+            ]
+
+    monkeypatch.setattr(
+        "orchestrator.cli.load_sources",
+        lambda path: [
+            SourceConfig(id="slow", type="rss", signal_type="research"),
+            SourceConfig(id="fast", type="rss", signal_type="research"),
+        ],
+    )
+    monkeypatch.setattr("orchestrator.cli.get_fetcher", lambda source_type: _Fetcher())
+
+    out = tmp_path / "data" / "signals.jsonl"
+    rc = main(["ingest", "--out", str(out), "--since-days", "30", "--threshold", "0"])
+
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["new_count"] == 2
+    rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [row["url"].rsplit("/", 1)[1] for row in rows] == ["slow", "fast"]
+    assert [row["id"][-3:] for row in rows] == ["001", "002"]
+
+
+def test_cli_weekly_keeps_highest_priority_then_newest(tmp_path, capsys, monkeypatch) -> None:
+    from orchestrator.storage import JSONLStorage
+
+    data_dir = tmp_path / "data"
+    storage = JSONLStorage(data_dir / "signals.jsonl")
+    for seq, score, timestamp in [
+        (1, 0.2, "2026-02-16T09:00:00Z"),
+        (2, 0.9, "2026-02-14T09:00:00Z"),
+        (3, None, "2026-02-17T09:00:00Z"),
+        (4, 0.9, "2026-02-15T09:00:00+01:00"),
+    ]:
+        row = {"id": f"SIG-20260216-00{seq}", "source": "manual", "type": "research", "timestamp": timestamp}
+        if score is not None:
+            row["priority_score"] = score
+        storage.append(row)
+
+    captured = {}
+
+    def _write(vault_root, week_id, signals, *, limit):
+        captured["ids"] = [signal.id for signal in signals]
+        return vault_root / "weekly.md"
+
+    monkeypatch.setattr("orchestrator.cli.write_weekly_review_from_signals", _write)
+
+    rc = main(["--data-dir", str(data_dir), "weekly", "--vault-root", str(tmp_path / "vault"), "--week-id", "2026-W08", "--limit", "3"])
+
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["week_id"] == "2026-W08"
+    assert captured["ids"] == ["SIG-20260216-004", "SIG-20260216-002", "SIG-20260216-001"]
+
+
+def test_cli_signal_add_dedupes_repeated_impact_areas(tmp_path, capsys, monkeypatch) -> None:
+    monkeypatch.setenv("PM_OS_VAULT_ROOT", str(tmp_path / "vault"))
+
+    rc = main([
+        "--data-dir",
+        str(tmp_path / "data"),
+        "signal",
+        "add",
+        "--source",
+        "manual",
+        "--type",
+        "research",
+        "--impact-area",
+        "evaluation",
+        "--impact-area",
+        "agent_systems",
+        "--impact-area",
+        "evaluation",
+    ])
+
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["impact_area"] == ["evaluation", "agent_systems"]
+
+
+def test_cli_signal_types_match_contract() -> None:
+    from typing import get_args
+
+    from orchestrator.cli import _SIGNAL_TYPES
+    from pm_os_contracts.models import SIGNAL
+
+    assert _SIGNAL_TYPES == get_args(SIGNAL.model_fields["type"].annotation)
+
+
+def test_cli_lazy_import_table_matches_type_checking_imports() -> None:
+    import ast
+    import importlib
+    from pathlib import Path
+
+    from orchestrator import cli
+
+    tree = ast.parse(Path(cli.__file__).read_text(encoding="utf-8"))
+    guard = next(
+        node for node in tree.body if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+    )
+    imports = [node for node in guard.body if isinstance(node, ast.ImportFrom)]
+    typed = {node.module: tuple(alias.name for alias in node.names) for node in imports}
+
+    assert typed == cli._LAZY_MODULES
+    for module_name, names in cli._LAZY_MODULES.items():
+        module = importlib.import_module(module_name)
+        assert all(hasattr(module, name) for name in names)
+
+
+def test_cli_json_output_is_the_same_with_and_without_orjson() -> None:
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    payload = {"ok": True, "title": "Café 研究", "score": 0.1, "items": [None, 3], "path": "a/b"}
+    code = (
+        "import sys\n"
+        "if sys.argv[1] == 'block':\n"
+        "    sys.modules['orjson'] = None\n"
+        "import json, orchestrator.cli as cli\n"
+        f"cli._emit_json(json.loads({json.dumps(payload)!r}))\n"
+    )
+    outputs = [
+        subprocess.run(
+            [sys.executable, "-c", code, mode],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True,
+            check=True,
+        ).stdout
+        for mode in ("default", "block")
+    ]
+    assert outputs[0] == outputs[1]
+    assert outputs[0].rstrip(b"\r\n") == json.dumps(payload).encode("ascii")
+
+
+def test_cli_signal_top_escapes_non_ascii_titles(tmp_path, capsys, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    monkeypatch.setenv("PM_OS_VAULT_ROOT", str(tmp_path / "vault"))
+    main(["--data-dir", str(data_dir), "signal", "add", "--source", "manual", "--type", "research", "--title", "Café 研究"])
+    capsys.readouterr()
+
+    assert main(["--data-dir", str(data_dir), "signal", "top", "--limit", "1"]) == 0
+    out = capsys.readouterr().out
+    # Windows PowerShell scripts read this output, so it stays ASCII as it always was.
+    assert out.isascii()
+    assert '"title": "Caf\\u00e9 \\u7814\\u7a76"' in out
+    assert json.loads(out)[0]["title"] == "Café 研究"
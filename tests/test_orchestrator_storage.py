@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from orchestrator.storage import JSONLStorage
+import codecs
+from unittest.mock import patch
+
+import pytest
+
+from orchestrator.storage import JournaledSnapshot, JSONLStorage, read_json, write_atomic_many, write_json
 
 
 def test_jsonl_storage_append_read_and_rewrite(tmp_path) -> None:
@@ -14,3 +19,134 @@ def test_jsonl_storage_append_read_and_rewrite(tmp_path) -> None:
 
     store.rewrite_all([{"id": 3, "name": "third"}])
     assert store.read_all() == [{"id": 3, "name": "third"}]
+
+
+def test_json_helpers_round_trip_and_tolerate_bom(tmp_path) -> None:
+    path = tmp_path / "index.json"
+    write_json(path, {"items": [{"id": "A", "title": "caf\u00e9"}]})
+    assert read_json(path) == {"items": [{"id": "A", "title": "caf\u00e9"}]}
+    assert b"\n" not in path.read_bytes()
+    assert [p.name for p in tmp_path.iterdir()] == ["index.json"]
+
+    write_json(path, {"items": []}, pretty=True)
+    assert path.read_text(encoding="utf-8") == '{\n  "items": []\n}'
+
+    path.write_bytes(codecs.BOM_UTF8 + b'{"items": []}')
+    assert read_json(path) == {"items": []}
+
+
+def test_jsonl_storage_iter_rows_streams_same_rows_as_read_all(tmp_path) -> None:
+    store = JSONLStorage(tmp_path / "events.jsonl")
+    assert list(store.iter_rows()) == []
+
+    store.append({"id": 1, "title": "café"})
+    with store.path.open("a", encoding="utf-8") as handle:
+        handle.write("\n   \n")
+    store.append({"id": 2, "title": None})
+
+    assert list(store.iter_rows()) == store.read_all() == [{"id": 1, "title": "café"}, {"id": 2, "title": None}]
+
+
+def test_jsonl_storage_read_all_reuses_parse_until_file_changes(tmp_path, monkeypatch) -> None:
+    import orchestrator.storage as storage
+
+    store = JSONLStorage(tmp_path / "drafts.jsonl")
+    store.append({"id": "A", "status": "draft", "tags": ["x"]})
+    first = store.read_all()
+    first[0]["status"] = "published"
+    first[0]["tags"].append("y")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("unchanged file was re-parsed")
+
+    monkeypatch.setattr(storage, "loads_json", _fail)
+    assert store.read_all() == [{"id": "A", "status": "draft", "tags": ["x"]}]
+    monkeypatch.undo()
+
+    JSONLStorage(tmp_path / "drafts.jsonl").rewrite_all([{"id": "A", "status": "rejected"}])
+    assert store.read_all() == [{"id": "A", "status": "rejected"}]
+
+
+def test_jsonl_storage_rows_may_contain_unicode_line_separators(tmp_path) -> None:
+    store = JSONLStorage(tmp_path / "signals.jsonl")
+    store.append({"id": "A", "content": "first\u2028second\x85third"})
+
+    assert store.read_all() == [{"id": "A", "content": "first\u2028second\x85third"}]
+    assert list(store.iter_rows()) == store.read_all()
+
+
+def test_read_indexed_maps_each_id_to_its_first_row(tmp_path) -> None:
+    store = JSONLStorage(tmp_path / "drafts.jsonl")
+    store.rewrite_all([{"id": "A", "n": 1}, {"name": "no id"}, {"id": "B", "n": 2}, {"id": "A", "n": 3}])
+
+    rows, by_id = store.read_indexed()
+
+    assert rows == store.read_all()
+    assert by_id == {"A": {"id": "A", "n": 1}, "B": {"id": "B", "n": 2}}
+    assert by_id["B"] is rows[2]
+
+
+def test_rewrite_all_keeps_previous_rows_if_the_swap_fails(tmp_path, monkeypatch) -> None:
+    store = JSONLStorage(tmp_path / "drafts.jsonl")
+    store.rewrite_all([{"id": "A"}, {"id": "B"}])
+    assert [path.name for path in tmp_path.iterdir()] == ["drafts.jsonl"]
+
+    def failing_replace(src, dst) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("orchestrator.storage.os.replace", failing_replace)
+    with pytest.raises(OSError):
+        store.rewrite_all([{"id": "C"}])
+
+    assert store.read_all() == [{"id": "A"}, {"id": "B"}]
+
+
+def test_journaled_snapshot_compacts_once_the_journal_outgrows_the_snapshot(tmp_path, monkeypatch) -> None:
+    from orchestrator import storage
+
+    index = JournaledSnapshot(tmp_path / "index.json")
+    rows = [{"id": n} for n in range(4)]
+    index.append(rows, lambda: rows)
+    assert index.read() == (rows, [])
+
+    # Appends only stat the two files; nothing is parsed to decide.
+    monkeypatch.setattr(storage, "loads_json", lambda _data: pytest.fail("append parsed the journal"))
+    rows.append({"id": 4})
+    index.append(rows[-1:], lambda: rows)
+    monkeypatch.undo()
+    assert index.read() == (rows[:4], [{"id": 4}])
+
+    while index.journal_path.exists():
+        rows.append({"id": len(rows)})
+        index.append(rows[-1:], lambda: rows)
+    assert read_json(index.path) == rows
+    assert len(rows) > 6
+
+    # A torn trailing line from an interrupted append is skipped on read.
+    index.journal_path.write_bytes(b'{"id": 99}\n{"id": 1')
+    assert index.read() == (rows, [{"id": 99}])
+
+
+def test_write_atomic_many_replaces_nothing_when_a_sync_fails(tmp_path) -> None:
+    existing = tmp_path / "a.md"
+    existing.write_text("old", encoding="utf-8")
+    targets = [(existing, "new"), (tmp_path / "b.md", "b"), (tmp_path / "c.md", "c")]
+
+    with patch("orchestrator.storage._sync_data", side_effect=[None, OSError("disk full"), None]):
+        with pytest.raises(OSError, match="disk full"):
+            write_atomic_many(targets)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["a.md"]
+    assert existing.read_text(encoding="utf-8") == "old"
+
+    assert write_atomic_many(targets) == [target for target, _ in targets]
+    assert [path.read_text(encoding="utf-8") for path, _ in targets] == ["new", "b", "c"]
+
+
+def test_write_atomic_many_writes_a_single_file_without_a_pool(tmp_path) -> None:
+    target = tmp_path / "only.md"
+    with patch("orchestrator.storage.ThreadPoolExecutor") as pool_mock:
+        assert write_atomic_many([(target, "body")]) == [target]
+
+    assert not pool_mock.called
+    assert target.read_text(encoding="utf-8") == "body"
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import datetime as dt
 
+import pytest
+
 from orchestrator.vault_ops import (
     resolve_vault_root,
     write_gate_decision,
     write_lti_markdown,
     write_signal_markdown,
+    write_signal_markdowns,
     write_weekly_review,
 )
 from pm_os_contracts.models import LTI_NODE, SIGNAL
@@ -36,6 +39,25 @@ def test_write_signal_markdown_creates_obsidian_note(tmp_path) -> None:
     assert "## Full Evidence" in text
 
 
+def test_write_signal_markdown_source_url_trailer_is_optional(tmp_path) -> None:
+    base = dict(
+        source="arXiv AI",
+        type="research",
+        timestamp=dt.datetime(2026, 2, 13, 8, 0, 0, tzinfo=dt.timezone.utc),
+        content="Preview body.",
+    )
+
+    with_url = write_signal_markdown(tmp_path, SIGNAL(id="SIG-20260216-002", url="https://example.com/a", **base))
+    without_url = write_signal_markdown(tmp_path, SIGNAL(id="SIG-20260216-003", **base))
+
+    assert with_url.read_text(encoding="utf-8").endswith(
+        "## Preview\nPreview body.\n\nSource URL: https://example.com/a\n\n## Full Evidence (optional; appended later)\n"
+    )
+    assert without_url.read_text(encoding="utf-8").endswith(
+        "## Preview\nPreview body.\n\n## Full Evidence (optional; appended later)\n"
+    )
+
+
 def test_write_lti_markdown_routes_to_drafts_without_approval(tmp_path) -> None:
     node = LTI_NODE(
         id="LTI-1.0",
@@ -127,3 +149,49 @@ def test_resolve_vault_root_precedence(tmp_path, monkeypatch) -> None:
 
     monkeypatch.delenv("PM_OS_VAULT_ROOT")
     assert resolve_vault_root(None).as_posix() == ".vault_test"
+
+
+def test_write_signal_markdowns_matches_single_writes_in_order(tmp_path) -> None:
+    signals = [
+        SIGNAL(
+            id=f"SIG-20260216-00{seq}",
+            source="manual",
+            type="research",
+            timestamp=dt.datetime(2026, 2, 16, 8, 0, seq, tzinfo=dt.timezone.utc),
+            title=f"Signal {seq}",
+        )
+        for seq in range(1, 6)
+    ]
+
+    paths = write_signal_markdowns(tmp_path / "batch", signals)
+
+    assert paths == [tmp_path / "batch" / "95_Signals" / f"{signal.id}.md" for signal in signals]
+
+    def _stable_lines(path):
+        return [line for line in path.read_text(encoding="utf-8").splitlines() if not line.startswith("ingested_at:")]
+
+    for signal, path in zip(signals, paths):
+        assert _stable_lines(path) == _stable_lines(write_signal_markdown(tmp_path / "single", signal))
+    assert write_signal_markdowns(tmp_path / "empty", []) == []
+
+
+def test_yaml_scalar_quotes_anything_beyond_the_safe_character_set() -> None:
+    from orchestrator.vault_ops import _yaml_scalar
+
+    assert _yaml_scalar("https://example.com/a_b-c.d") == "https://example.com/a_b-c.d"
+    assert _yaml_scalar("two words") == '"two words"'
+    assert _yaml_scalar("trailing\n") == '"trailing\n"'
+    assert _yaml_scalar("") == '""'
+
+
+def test_clean_markdown_text_strips_latex_in_one_pass() -> None:
+    from orchestrator.vault_ops import _clean_markdown_text
+
+    assert _clean_markdown_text(r"Use $f(x)$ with \textbf{robust} \(g(y)\) checks \cite{a}.") == (
+        "Use f(x) with robust g(y) checks ."
+    )
+    # Bold text and math bodies are cleaned too.
+    assert _clean_markdown_text(r"\textbf{$x$} and $\alpha + 1$") == "x and + 1"
+    # Text after a math block is not glued onto a command inside it.
+    assert _clean_markdown_text(r"\[\alpha\]y") == "y"
+    assert _clean_markdown_text(None) == ""
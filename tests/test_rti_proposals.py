@@ -114,3 +114,41 @@ def test_directory_auto_created(tmp_path) -> None:
     rti_proposals.on_new_l4_decision(decision)
     proposals_dir = vault_root / "97_Decisions" / "_RTI_Proposals"
     assert proposals_dir.exists()
+
+
+def test_next_version_reuses_listing_until_directory_changes(tmp_path, monkeypatch) -> None:
+    proposals_dir = tmp_path / "97_Decisions" / "_RTI_Proposals"
+    proposals_dir.mkdir(parents=True, exist_ok=True)
+    (proposals_dir / "RTI-PROP-SIG-123-v1.md").write_text("v1", encoding="utf-8")
+    (proposals_dir / "RTI-PROP-SIG-7-v4.md").write_text("v4", encoding="utf-8")
+
+    scans = {"count": 0}
+    scan_versions = rti_proposals._scan_versions
+
+    def counting_scan(path: Path) -> dict[str, int]:
+        scans["count"] += 1
+        return scan_versions(path)
+
+    monkeypatch.setattr(rti_proposals, "_scan_versions", counting_scan)
+
+    assert rti_proposals.compute_next_version("SIG-123", proposals_dir) == 2
+    assert rti_proposals.compute_next_version("SIG-7", proposals_dir) == 5
+    assert rti_proposals.compute_next_version("SIG-1", proposals_dir) == 1
+    assert scans["count"] == 1
+
+    decision = rti_proposals.L4Decision(
+        decision_type="ACCEPT", signal_id="SIG-123", revision_of=None, decision_id="DEC-2026-W08-006"
+    )
+    rti_proposals.write_rti_proposal(decision, "SIG-123", proposals_dir)
+    assert rti_proposals.compute_next_version("SIG-123", proposals_dir) == 3
+
+
+def test_next_version_parses_only_well_formed_names(tmp_path) -> None:
+    proposals_dir = tmp_path / "_RTI_Proposals"
+    proposals_dir.mkdir()
+    for name in ("RTI-PROP-SIG-1-v2.md", "RTI-PROP-SIG-1-v10.md", "RTI-PROP-SIG-1-v3-vx.md", "RTI-PROP-A-v2-v3.md", "RTI-PROP-SIG-1-v4.txt"):
+        (proposals_dir / name).write_text("x", encoding="utf-8")
+
+    assert rti_proposals.compute_next_version("SIG-1", proposals_dir) == 11
+    assert rti_proposals.compute_next_version("A-v2", proposals_dir) == 4
+    assert rti_proposals.compute_next_version("A", proposals_dir) == 1
@@ -59,3 +59,8 @@ def test_signal_vault_writeback_dedupe_and_index(tmp_path) -> None:
 
     temp_files = [path for path in (vault_root / "00_Index").iterdir() if path.name != "signal_url_index.json"]
     assert temp_files == []
+
+
+def test_yaml_scalars_escape_quotes_and_backslashes() -> None:
+    assert SignalVaultWriter._yaml_scalar('say "hi" C:\\tmp') == '"say \\"hi\\" C:\\\\tmp"'
+    assert SignalVaultWriter._yaml_list(['a"b', "c\\d"]) == '["a\\"b", "c\\\\d"]'
@@ -126,26 +126,25 @@ class ValidationProjectStore:
 
     def _next_id(self, day: dt.date) -> str:
         date_key = day.strftime("%Y")
-        existing = []
-        if self.index_path.exists():
-            index = json.loads(self.index_path.read_text(encoding="utf-8"))
-            existing = [item["id"] for item in index.get("items", []) if item["id"].startswith(f"VP-{date_key}-")]
+        index = self._read_index()
+        existing = [item["id"] for item in index.get("items", []) if item["id"].startswith(f"VP-{date_key}-")]
         return f"VP-{date_key}-{len(existing) + 1:03d}"
 
+    def _read_index(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {"items": []}
+
     def _update_index(self, record: ValidationProjectRecord) -> None:
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        if self.index_path.exists():
-            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
-        else:
-            payload = {"items": []}
+        payload = self._read_index()
         payload["items"].append(record.to_index())
         self.index_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
     def _update_index_from_payload(self, payload: dict[str, Any]) -> None:
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        index = {"items": []}
-        if self.index_path.exists():
-            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        index = self._read_index()
         items = index.get("items", [])
         for idx, item in enumerate(items):
             if item["id"] == payload["id"]:
@@ -158,9 +157,10 @@ class ValidationProjectStore:
 
     def _load_project(self, project_id: str) -> dict[str, Any]:
         path = self.base_dir / project_id / "project.json"
-        if not path.exists():
-            raise ValueError(f"Validation project not found: {project_id}")
-        return json.loads(path.read_text(encoding="utf-8"))
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise ValueError(f"Validation project not found: {project_id}") from None
 
     def _write_project(self, project_id: str, payload: dict[str, Any]) -> None:
         path = self.base_dir / project_id / "project.json"